@@ -0,0 +1,70 @@
+"""Benchmark of `SalaryAnalytics` against the equivalent `groupby().apply()` chain.
+
+The participants are synthetic, drawn with the categories of the participants schema. Run from the repository root
+with `python -m benchmarks.analytics`.
+"""
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from egytech_api.analytics import SalaryAnalytics
+from egytech_api.cube import STATS_QUANTILES
+from egytech_api.schema import PARTICIPANTS_SCHEMA, apply_schema
+
+
+def participants(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Returns synthetic participants with the dtypes of the participants schema.
+
+    Parameters
+    ----------
+    rows : int
+        The number of participants.
+    seed : int
+        The seed of the random generator.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    generator = np.random.default_rng(seed)
+    frame = pd.DataFrame(
+        {
+            column: generator.choice(list(PARTICIPANTS_SCHEMA[column].categories), rows)
+            for column in ["title", "level", "gender"]
+        }
+    )
+    frame["yoe"] = generator.integers(0, 26, rows)
+    frame["cs_degree"] = generator.random(rows) < 0.6
+    frame["compensation"] = generator.lognormal(10, 0.8, rows).round()
+    return apply_schema(frame, PARTICIPANTS_SCHEMA)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000, help="number of synthetic participants")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed passes")
+    args = parser.parse_args()
+
+    frame = participants(args.rows)
+    by = ["title", "level", "yoe"]
+
+    def apply() -> None:
+        frame.groupby(by, observed=True)["compensation"].apply(
+            lambda compensations: pd.Series(
+                {name: compensations.quantile(quantile) for name, quantile in STATS_QUANTILES.items()}
+            )
+        )
+
+    def analytics() -> None:
+        SalaryAnalytics(frame=frame).get_stats(by=by)
+
+    print(f"{args.rows} participants grouped by {', '.join(by)}, best of {args.repeat} passes")
+    for name, function in [("groupby.apply", apply), ("SalaryAnalytics", analytics)]:
+        best = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(f"{name:>20}: {best * 1e3:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
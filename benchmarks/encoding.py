@@ -0,0 +1,46 @@
+"""Benchmark of the query parameters encoder against pydantic serialization.
+
+Run from the repository root with `python -m benchmarks.encoding`.
+"""
+import argparse
+import timeit
+
+from egytech_api.encoding import QueryEncoder
+from egytech_api.grid import QueryGrid
+from egytech_api.models import LevelEnum, StatsQueryParams, TitleEnum
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed passes over the queries")
+    args = parser.parse_args()
+
+    grid = QueryGrid(
+        dimensions={
+            "title": TitleEnum,
+            "level": LevelEnum,
+            "min_yoe,max_yoe": [(0, 3), (3, 6), (6, 10), (10, 20)],
+            "cs_degree": [True, False],
+        },
+        base={"include_relocated": False, "include_remote_abroad": True},
+        query_class=StatsQueryParams,
+    )
+    queries = list(grid.queries())
+
+    def model_dump() -> None:
+        for query in queries:
+            query.model_dump(mode="json", exclude_none=True, by_alias=True)
+
+    def encoder() -> None:
+        encode = QueryEncoder(StatsQueryParams).encode
+        for query in queries:
+            encode(query)
+
+    print(f"{len(queries)} queries, best of {args.repeat} passes")
+    for name, function in [("model_dump", model_dump), ("QueryEncoder", encoder)]:
+        best = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(f"{name:>20}: {best * 1e3:8.2f} ms  {best / len(queries) * 1e6:6.2f} us/query")
+
+
+if __name__ == "__main__":
+    main()
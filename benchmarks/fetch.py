@@ -0,0 +1,243 @@
+"""Benchmark of every fetch path against a local mock API server.
+
+Every client fetches the same number of queries from a `benchmarks.server.MockAPIServer` with a fresh `Session`,
+`--repeat` times per query count. The report gives, per client and query count:
+
+- `throughput`: queries per second over the median run,
+- `p50_seconds`/`p99_seconds`: percentiles of the wall time of a run,
+- `cpu_seconds`: median CPU time of the client process per run (the server runs in its own process),
+- `peak_memory_bytes`: peak of the Python allocations of one extra run traced with `tracemalloc`,
+- `errors`: the number of queries that failed over all runs.
+
+Run from the repository root with `python -m benchmarks.fetch --output report.json`, and compare two reports, e.g.
+before and after a dependency upgrade, with `python -m benchmarks.fetch --compare before.json after.json`.
+"""
+import argparse
+import importlib.metadata
+import itertools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+import numpy as np
+
+from egytech_api.core import AsyncPoolingClient, Participants, PoolingClient, Stats
+from egytech_api.exceptions import APIError
+from egytech_api.models import LevelEnum, ParticipantsQueryParams, TitleEnum
+from egytech_api.session import Session
+
+from .server import MockAPIServer, ServerConfig, add_config_arguments
+
+# Every benchmark fetches the given queries over the given session and returns the number of failed queries.
+Benchmark = Callable[[list[Dict[str, Any]], Session], int]
+
+
+def _one_by_one(client_class: type) -> Benchmark:
+    def run(queries: list[Dict[str, Any]], session: Session) -> int:
+        errors = 0
+        for query in queries:
+            try:
+                client_class(**query, session=session)
+            except APIError:
+                errors += 1
+        return errors
+
+    return run
+
+
+def _pooling(queries: list[Dict[str, Any]], session: Session) -> int:
+    try:
+        PoolingClient(queries=[ParticipantsQueryParams(**query) for query in queries], session=session)
+    except APIError:
+        return len(queries)
+    return 0
+
+
+def _async_pooling(queries: list[Dict[str, Any]], session: Session) -> int:
+    client = AsyncPoolingClient(queries=[ParticipantsQueryParams(**query) for query in queries], session=session)
+    return sum(not result.ok for result in client.get_report())
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    "Participants": _one_by_one(Participants),
+    "Stats": _one_by_one(Stats),
+    "PoolingClient": _pooling,
+    "AsyncPoolingClient": _async_pooling,
+}
+"""The benchmarked fetch paths, by name."""
+
+
+def make_queries(count: int) -> list[Dict[str, Any]]:
+    """Returns the given number of distinct query parameters, valid for both the participants and stats endpoints.
+
+    Parameters
+    ----------
+    count : int
+
+    Returns
+    -------
+    list of dict
+    """
+    combinations = itertools.cycle(itertools.product(TitleEnum, LevelEnum))
+    return [{"title": title.value, "level": level.value} for title, level in itertools.islice(combinations, count)]
+
+
+def measure(benchmark: Benchmark, queries: list[Dict[str, Any]], url: str, repeat: int) -> Dict[str, Any]:
+    """Runs a benchmark `repeat` times, then once more with memory tracing, and returns its measurements.
+
+    Parameters
+    ----------
+    benchmark : Benchmark
+        The fetch path to measure.
+    queries : list of dict
+        The query parameters to fetch on every run.
+    url : str
+        The base URL of the mock API server.
+    repeat : int
+        The number of timed runs.
+
+    Returns
+    -------
+    Dict[str, Any]
+    """
+
+    def run() -> int:
+        with Session(base_url=url) as session:
+            return benchmark(queries, session)
+
+    walls, cpus, errors = [], [], 0
+    for _ in range(repeat):
+        wall, cpu = time.perf_counter(), time.process_time()
+        errors += run()
+        walls.append(time.perf_counter() - wall)
+        cpus.append(time.process_time() - cpu)
+
+    # Tracing slows allocations down, so the peak memory is measured on a separate run.
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "throughput": len(queries) / float(np.median(walls)),
+        "p50_seconds": float(np.percentile(walls, 50)),
+        "p99_seconds": float(np.percentile(walls, 99)),
+        "cpu_seconds": float(np.median(cpus)),
+        "peak_memory_bytes": peak,
+        "errors": errors,
+    }
+
+
+def _environment() -> Dict[str, str]:
+    versions = {"python": sys.version.split()[0], "platform": platform.platform()}
+    for package in ["egytech_api", "httpx", "pandas", "pydantic", "numpy"]:
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = "unknown"
+    return versions
+
+
+def run_suite(
+        config: ServerConfig, query_counts: list[int], clients: list[str], repeat: int
+) -> Dict[str, Any]:
+    """Runs the benchmarks of the given clients for every query count against one mock API server.
+
+    Parameters
+    ----------
+    config : ServerConfig
+        The behaviour of the mock API server.
+    query_counts : list of int
+        The numbers of queries to fetch per run.
+    clients : list of str
+        The names of the fetch paths to measure, keys of `BENCHMARKS`.
+    repeat : int
+        The number of timed runs per client and query count.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The report: the server configuration, the versions of the environment and one result per client and query
+        count.
+    """
+    results = []
+    with MockAPIServer(config) as server:
+        for client, count in itertools.product(clients, query_counts):
+            measurements = measure(BENCHMARKS[client], make_queries(count), server.url, repeat)
+            results.append({"client": client, "queries": count, "repeat": repeat, **measurements})
+            print(
+                f"{client:>20} {count:>5} queries: {measurements['throughput']:9.1f} queries/s  "
+                f"p50 {measurements['p50_seconds'] * 1e3:8.1f} ms  p99 {measurements['p99_seconds'] * 1e3:8.1f} ms  "
+                f"cpu {measurements['cpu_seconds'] * 1e3:8.1f} ms  "
+                f"peak {measurements['peak_memory_bytes'] / 2**20:6.1f} MiB  errors {measurements['errors']}",
+                file=sys.stderr,
+            )
+    return {"server": config.model_dump(), "environment": _environment(), "results": results}
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> list[Dict[str, Any]]:
+    """Returns the ratio of every measurement of the current report to the baseline report, for the clients and query
+    counts present in both. Ratios above 1 mean more throughput, or more time or memory.
+
+    Parameters
+    ----------
+    baseline : Dict[str, Any]
+        The reference report, as returned by run_suite().
+    current : Dict[str, Any]
+        The report to compare.
+
+    Returns
+    -------
+    list of dict
+    """
+    reference = {(result["client"], result["queries"]): result for result in baseline["results"]}
+    ratios = []
+    for result in current["results"]:
+        before = reference.get((result["client"], result["queries"]))
+        if before is None:
+            continue
+        ratios.append({
+            "client": result["client"],
+            "queries": result["queries"],
+            **{
+                metric: result[metric] / before[metric] if before[metric] else None
+                for metric in ["throughput", "p50_seconds", "p99_seconds", "cpu_seconds", "peak_memory_bytes"]
+            },
+        })
+    return ratios
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, nargs="+", default=[1, 10, 50], help="query counts per run")
+    parser.add_argument("--clients", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs per client and query count")
+    parser.add_argument("--output", help="file to write the JSON report to, standard output by default")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="compare two JSON reports")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    if args.compare:
+        reports = []
+        for filename in args.compare:
+            with open(filename) as file:
+                reports.append(json.load(file))
+        report: Any = compare(*reports)
+    else:
+        config = ServerConfig(**{field: getattr(args, field) for field in ServerConfig.model_fields})
+        report = run_suite(config, args.queries, args.clients, args.repeat)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
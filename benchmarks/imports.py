@@ -0,0 +1,185 @@
+"""Benchmark of the import time of the package, as paid by every cold start of a CLI tool or serverless function.
+
+Every import statement of `STATEMENTS` runs `--repeat` times in a fresh interpreter. The report gives, per statement:
+
+- `p50_seconds`/`min_seconds`: the median and minimum wall time of the statement alone, the interpreter startup
+  excluded,
+- `modules`: the number of modules it imports,
+- `heavy`: the heavy dependencies of `HEAVY_MODULES` it imports.
+
+With `--check`, the command fails if a statement imports a heavy dependency it is not allowed to by `STATEMENTS`, which
+guards against an eager import creeping back in. Run from the repository root with
+`python -m benchmarks.imports --check`, and compare two reports with
+`python -m benchmarks.imports --compare before.json after.json`.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict
+
+import numpy as np
+
+HEAVY_MODULES = ["pandas", "numpy", "httpx", "multiprocessing", "xlsxwriter", "pyarrow"]
+"""The dependencies whose import dominates the startup time."""
+
+STATEMENTS: Dict[str, list[str]] = {
+    "import egytech_api": [],
+    "from egytech_api import ParticipantsQueryParams, StatsQueryParams": [],
+    "from egytech_api.exceptions import APIError": [],
+    "from egytech_api.session import Session": ["httpx"],
+    "from egytech_api import Participants": ["pandas", "numpy", "httpx"],
+}
+"""The measured import statements, with the heavy dependencies each one is allowed to import."""
+
+_PROBE = """
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "modules": sorted(set(sys.modules) - before)}))
+"""
+
+
+def measure(statement: str, repeat: int) -> Dict[str, Any]:
+    """Runs an import statement `repeat` times, each in a fresh interpreter, and returns its measurements.
+
+    Parameters
+    ----------
+    statement : str
+        The import statement.
+    repeat : int
+        The number of runs.
+
+    Returns
+    -------
+    Dict[str, Any]
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))}
+    seconds, modules = [], []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE, statement], capture_output=True, check=True, env=environment, text=True
+        ).stdout
+        run = json.loads(output)
+        seconds.append(run["seconds"])
+        modules = run["modules"]
+    return {
+        "p50_seconds": float(np.median(seconds)),
+        "min_seconds": float(np.min(seconds)),
+        "modules": len(modules),
+        "heavy": [module for module in HEAVY_MODULES if module in modules],
+    }
+
+
+def run_suite(repeat: int) -> Dict[str, Any]:
+    """Measures every statement of `STATEMENTS`.
+
+    Parameters
+    ----------
+    repeat : int
+        The number of runs per statement.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The report: the Python version and one result per statement.
+    """
+    results = []
+    for statement in STATEMENTS:
+        measurements = measure(statement, repeat)
+        results.append({"statement": statement, "repeat": repeat, **measurements})
+        print(
+            f"{statement:<70} p50 {measurements['p50_seconds'] * 1e3:8.1f} ms  "
+            f"min {measurements['min_seconds'] * 1e3:8.1f} ms  modules {measurements['modules']:5}  "
+            f"heavy {', '.join(measurements['heavy']) or '-'}",
+            file=sys.stderr,
+        )
+    return {"python": sys.version.split()[0], "results": results}
+
+
+def check(report: Dict[str, Any]) -> list[str]:
+    """Returns the statements of a report that import heavy dependencies they are not allowed to.
+
+    Parameters
+    ----------
+    report : Dict[str, Any]
+        The report, as returned by run_suite().
+
+    Returns
+    -------
+    list of str
+        One message per offending statement.
+    """
+    return [
+        f"{result['statement']!r} imports {', '.join(sorted(set(result['heavy']) - set(allowed)))}"
+        for result in report["results"]
+        if set(result["heavy"]) - set(allowed := STATEMENTS.get(result["statement"], HEAVY_MODULES))
+    ]
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> list[Dict[str, Any]]:
+    """Returns the ratio of the import times of the current report to the baseline report, for the statements present
+    in both. Ratios above 1 mean slower imports.
+
+    Parameters
+    ----------
+    baseline : Dict[str, Any]
+        The reference report, as returned by run_suite().
+    current : Dict[str, Any]
+        The report to compare.
+
+    Returns
+    -------
+    list of dict
+    """
+    reference = {result["statement"]: result for result in baseline["results"]}
+    return [
+        {
+            "statement": result["statement"],
+            **{
+                metric: result[metric] / before[metric] if before[metric] else None
+                for metric in ["p50_seconds", "min_seconds", "modules"]
+            },
+        }
+        for result in current["results"]
+        if (before := reference.get(result["statement"])) is not None
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs per statement")
+    parser.add_argument("--output", help="file to write the JSON report to, standard output by default")
+    parser.add_argument("--check", action="store_true", help="fail if a statement imports a heavy dependency")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="compare two JSON reports")
+    args = parser.parse_args()
+
+    if args.compare:
+        reports = []
+        for filename in args.compare:
+            with open(filename) as file:
+                reports.append(json.load(file))
+        report: Any = compare(*reports)
+    else:
+        report = run_suite(args.repeat)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.check and not args.compare:
+        failures = check(report)
+        for failure in failures:
+            print(failure, file=sys.stderr)
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Local stand-in for `api.egytech.fyi` used by the benchmarks.
+
+The server answers the `participants` and `stats` endpoints with synthetic payloads of a configurable size, after a
+configurable latency, and fails a configurable share of the requests with a 503 response. It runs in its own process
+so that its CPU time and memory are not attributed to the client being measured.
+
+Run it on its own with `python -m benchmarks.server --port 8000 --latency 0.05`.
+"""
+import argparse
+import collections
+import json
+import multiprocessing
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+from egytech_api.snapshot import CATEGORICAL_COLUMNS
+
+
+class ServerConfig(BaseModel):
+    """Behaviour of the mock API server.
+
+    Attributes
+    ----------
+    latency : float
+        The number of seconds every response is delayed by.
+    records : int
+        The number of participant records of every participants response.
+    error_rate : float
+        The share of the requests answered with a 503 response, between 0 and 1.
+    seed : int
+        The seed of the synthetic records and of the failed requests, so that runs are reproducible.
+    """
+
+    latency: float = Field(default=0.02, ge=0)
+    records: int = Field(default=500, ge=0)
+    error_rate: float = Field(default=0.0, ge=0, le=1)
+    seed: int = 0
+
+
+def make_records(count: int, seed: int = 0) -> list[Dict[str, Any]]:
+    """Returns synthetic participant records with the columns and value sets of the API.
+
+    Parameters
+    ----------
+    count : int
+        The number of records.
+    seed : int
+        The seed of the random values.
+
+    Returns
+    -------
+    list of dict
+    """
+    generator = random.Random(seed)
+    values = {column: [member.value for member in enum] for column, enum in CATEGORICAL_COLUMNS.items()}
+    records = []
+    for _ in range(count):
+        record: Dict[str, Any] = {column: generator.choice(choices) for column, choices in values.items()}
+        record.update(
+            yoe=generator.randint(0, 25),
+            cs_degree=generator.random() < 0.6,
+            is_relocated=generator.random() < 0.1,
+            is_remote_abroad=generator.random() < 0.15,
+            compensation=generator.randint(5, 300) * 1000,
+        )
+        records.append(record)
+    return records
+
+
+def _payloads(config: ServerConfig) -> Dict[str, bytes]:
+    records = make_records(config.records, config.seed)
+    compensations = sorted(record["compensation"] for record in records)
+    counts = collections.Counter(value // 10000 for value in compensations)
+    stats = {
+        "stats": {
+            "totalCount": len(records),
+            "median": compensations[len(compensations) // 2] if compensations else None,
+        },
+        "buckets": [{"bucket": f"{low * 10}K-{low * 10 + 10}K", "count": counts[low]} for low in range(31)],
+    }
+    return {
+        "participants": json.dumps({"results": records}).encode(),
+        "stats": json.dumps(stats).encode(),
+    }
+
+
+def _handler(config: ServerConfig) -> type:
+    payloads = _payloads(config)
+    generator = random.Random(config.seed)
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        # HTTP/1.1 keeps the connections alive, like the real API, so connection pooling is measured.
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately: without this, Nagle's algorithm delays every response by the
+        # delayed ACK timeout of the client.
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            time.sleep(config.latency)
+            with lock:
+                failed = generator.random() < config.error_rate
+            body = payloads.get(self.path.split("?", 1)[0].strip("/"))
+            if failed:
+                status, body = 503, b'{"error": "unavailable"}'
+            elif body is None:
+                status, body = 404, b'{"error": "not found"}'
+            else:
+                status = 200
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 connections makes concurrent clients wait for SYN retransmissions.
+    request_queue_size = 128
+
+
+def serve(config: ServerConfig, port: int = 0, ready: Optional[Any] = None) -> None:
+    """Serves the mock API until the process is terminated.
+
+    Parameters
+    ----------
+    config : ServerConfig
+        The behaviour of the server.
+    port : int
+        The port to listen on, any free port by default.
+    ready : multiprocessing.Queue, optional
+        A queue the port the server listens on is put into once it accepts connections.
+
+    Returns
+    -------
+    None
+    """
+    server = _Server(("127.0.0.1", port), _handler(config))
+    if ready is not None:
+        ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+class MockAPIServer:
+    """Context manager running the mock API server in a child process.
+
+    Parameters
+    ----------
+    config : ServerConfig
+        The behaviour of the server.
+
+    Attributes
+    ----------
+    url : str
+        The base URL of the server, to pass to `egytech_api.session.Session(base_url=...)`.
+
+    Examples
+    --------
+    >>> with MockAPIServer(ServerConfig(latency=0.05)) as server:
+    ...     participants = Participants(session=Session(base_url=server.url))
+    """
+
+    def __init__(self, config: ServerConfig):
+        self.config = config
+        self.url = ""
+        self._process: Optional[multiprocessing.Process] = None
+
+    def __enter__(self) -> "MockAPIServer":
+        context = multiprocessing.get_context("spawn")
+        ready = context.Queue()
+        self._process = context.Process(target=serve, args=(self.config, 0, ready), daemon=True)
+        self._process.start()
+        self.url = f"http://127.0.0.1:{ready.get(timeout=30)}/"
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds one command line option per field of `ServerConfig` to the given parser.
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+
+    Returns
+    -------
+    None
+    """
+    for field, info in ServerConfig.model_fields.items():
+        parser.add_argument(
+            f"--{field.replace('_', '-')}", type=info.annotation, default=info.default,
+            help=f"server {field.replace('_', ' ')} (default: {info.default})",
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8000)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+    config = ServerConfig(**{field: getattr(args, field) for field in ServerConfig.model_fields})
+    print(f"Serving the mock API on http://127.0.0.1:{args.port}/")
+    serve(config, args.port)
+
+
+if __name__ == "__main__":
+    main()
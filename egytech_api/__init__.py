@@ -1,3 +1,50 @@
-from core import (AsyncPoolingClient, Participants, PoolingClient,
-                  Stats)
-from models import ParticipantsQueryParams, StatsQueryParams
+"""Python wrapper for the EgyTech.FYI API.
+
+The public classes are imported from their submodules on first access, so that importing the package, or only the
+query models, does not import `pandas` or `httpx`: e.g. `from egytech_api import ParticipantsQueryParams` only loads
+`pydantic`.
+"""
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core import (AsyncParticipants, AsyncPoolingClient, AsyncStats, AsyncStatsPoolingClient,
+                       Participants, PoolingClient, Stats, StatsPoolingClient, fetch_all)
+    from .models import ParticipantsQueryParams, StatsQueryParams
+
+_EXPORTS = {
+    "AsyncParticipants": "core",
+    "AsyncPoolingClient": "core",
+    "AsyncStats": "core",
+    "AsyncStatsPoolingClient": "core",
+    "Participants": "core",
+    "PoolingClient": "core",
+    "Stats": "core",
+    "StatsPoolingClient": "core",
+    "fetch_all": "core",
+    "ParticipantsQueryParams": "models",
+    "StatsQueryParams": "models",
+}
+
+_SUBMODULES = {
+    "analytics", "cache", "coalescing", "core", "cube", "encoding", "exceptions", "export", "grid", "instrumentation",
+    "models", "planner", "refresh", "responses", "scheduler", "schema", "session", "sharding", "snapshot", "store",
+    "streaming",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    # Cached so that later accesses skip this function.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_SUBMODULES})
@@ -0,0 +1,292 @@
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, Field
+
+from .cube import DIMENSIONS, STATS_QUANTILES, _label
+from .models import ParticipantsQueryParams
+from .snapshot import ParticipantsSnapshot
+
+
+def _yoe_label(low: int, high: Optional[int]) -> str:
+    return f"{low}+" if high is None else f"{low}-{high}"
+
+
+class SalaryAnalytics(BaseModel):
+    """Class computing compensation statistics of fetched participants grouped along the dimensions of
+    `StatsQueryParams`, in one vectorized pass per call.
+
+    Every grouping column is factorized once into integer codes. A call combines the codes of its grouping columns
+    into one group id per participant, sorts the participants once by group and compensation, and reads every
+    statistic off the sorted compensations with segment reductions (`np.add.reduceat`) and position arithmetic,
+    instead of a Python call per group like `groupby().apply()`. Percentiles use linear interpolation, like
+    `StatsCube` and `np.quantile`.
+
+    Groups are the observed combinations of values; participants with a missing value in a grouping column are left
+    out. Participants with a missing compensation are counted in `totalCount` but not in the statistics.
+
+    Attributes
+    ----------
+    frame : pd.DataFrame
+        The participants, e.g. returned by the get_df() method of `Participants`, `PoolingClient` or a
+        `DatasetStore`.
+    bucket_size : float
+        The width of the compensation buckets of get_histogram(). Ignored when `bucket_edges` is given.
+    bucket_edges : list of float, optional
+        The lower edges of the compensation buckets, in increasing order. The last bucket is open-ended.
+    yoe_edges : list of int, optional
+        The lower edges of the years of experience buckets to group `yoe` by, in increasing order, e.g.
+        `[0, 3, 6, 10]`. Lower edges are inclusive and upper edges exclusive, like `min_yoe` and `max_yoe`, and the last
+        bucket is open-ended. Defaults to grouping by year.
+    _snapshot : ParticipantsSnapshot
+        The snapshot masking the participants with the query of a call, built on first use.
+    _codes : Dict[str, tuple]
+        The codes of every factorized grouping column, and the labels they index.
+
+    Methods
+    -------
+    get_stats(by: Sequence[str] = (), query: ParticipantsQueryParams = None, quantiles: Dict[str, float] = None)
+        Returns the count, mean and compensation percentiles of every group.
+    get_histogram(by: Sequence[str] = (), query: ParticipantsQueryParams = None)
+        Returns the compensation buckets of every group, like `Stats.get_df()`.
+    get_gaps(column: str, by: Sequence[str] = (), reference: Any = None, query: ParticipantsQueryParams = None,
+    statistic: str = "median")
+        Returns a table comparing a statistic across the values of a column, e.g. a gender gap table.
+
+    Examples
+    --------
+    >>> analytics = SalaryAnalytics(frame=client.get_df(), yoe_edges=[0, 3, 6, 10])
+    >>> analytics.get_stats(by=["title", "level"])
+    >>> analytics.get_gaps("gender", by=["title"], query=StatsQueryParams(include_relocated=True))
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
+    frame: pd.DataFrame = Field(exclude=True)
+    bucket_size: float = Field(default=10000, gt=0)
+    bucket_edges: Optional[list[float]] = None
+    yoe_edges: Optional[list[int]] = None
+    _snapshot: Optional[ParticipantsSnapshot] = None
+    _codes: Dict[str, tuple[np.ndarray, pd.Index]] = {}
+    _compensations: Optional[np.ndarray] = None
+
+    def model_post_init(self, __context: Any) -> None:
+        """Placeholder that reads the compensations after initialization of the pydantic model.
+
+        Parameters
+        ----------
+        __context : Any
+
+        Returns
+        -------
+        None
+        """
+        compensation = self.frame.get("compensation", pd.Series(np.nan, index=self.frame.index))
+        self._compensations = pd.to_numeric(compensation, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        self._codes = {}
+
+    def _factorize(self, column: str) -> tuple[np.ndarray, pd.Index]:
+        """Returns the codes of a grouping column, -1 for missing values, and the labels they index."""
+        factorized = self._codes.get(column)
+        if factorized is not None:
+            return factorized
+        if column not in self.frame:
+            raise KeyError(f"{column!r} is not a column of the participants, expected one of {DIMENSIONS}")
+
+        values = self.frame[column]
+        if column == "yoe" and self.yoe_edges is not None:
+            edges = np.asarray(self.yoe_edges)
+            yoe = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+            codes = np.searchsorted(edges, yoe, side="right") - 1
+            codes[np.isnan(yoe) | (codes < 0)] = -1
+            labels = [_yoe_label(low, high) for low, high in zip(self.yoe_edges, [*self.yoe_edges[1:], None])]
+            factorized = codes, pd.CategoricalIndex(labels, categories=labels, ordered=True)
+        elif isinstance(values.dtype, pd.CategoricalDtype):
+            factorized = values.cat.codes.to_numpy(), pd.CategoricalIndex(values.cat.categories, dtype=values.dtype)
+        else:
+            codes, labels = pd.factorize(values, sort=True)
+            factorized = codes, pd.Index(labels)
+        self._codes[column] = factorized
+        return factorized
+
+    def _mask(self, query: Optional[ParticipantsQueryParams]) -> Optional[np.ndarray]:
+        if query is None:
+            return None
+        if getattr(query, "programming_language", None) is not None:
+            raise ValueError("Participant records have no programming language, the analytics cannot filter on it")
+        if self._snapshot is None:
+            self._snapshot = ParticipantsSnapshot(frame=self.frame)
+        return self._snapshot.mask(query)
+
+    def _segments(
+            self, by: Sequence[str], query: Optional[ParticipantsQueryParams]
+    ) -> tuple[pd.DataFrame, np.ndarray, np.ndarray, np.ndarray]:
+        """Sorts the selected participants once by group and compensation.
+
+        Returns the labels of the groups, one row per group in sorted order, the sorted compensations, the position of
+        the first participant of every group in them, and the size of every group."""
+        codes, labels = zip(*(self._factorize(column) for column in by)) if by else ((), ())
+        selected = np.ones(len(self.frame), dtype=bool)
+        for column_codes in codes:
+            selected &= column_codes >= 0
+        mask = self._mask(query)
+        if mask is not None:
+            selected &= mask
+        rows = np.flatnonzero(selected)
+
+        sizes = [len(column_labels) for column_labels in labels]
+        groups = (
+            np.ravel_multi_index([column_codes[rows] for column_codes in codes], sizes)
+            if by else np.zeros(len(rows), dtype=np.intp)
+        )
+        compensations = self._compensations[rows]
+        # Sorted by group, then by compensation with missing compensations last in every group.
+        order = np.lexsort((compensations, groups))
+        groups, compensations = groups[order], compensations[order]
+
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]]) if len(groups) else np.zeros(0, np.intp)
+        counts = np.diff(np.r_[starts, len(groups)])
+        keys = np.unravel_index(groups[starts], sizes) if by else ()
+        frame = pd.DataFrame(
+            {
+                column: pd.Categorical.from_codes(key, dtype=column_labels.dtype)
+                if isinstance(column_labels, pd.CategoricalIndex) else column_labels.take(key)
+                for column, key, column_labels in zip(by, keys, labels)
+            },
+            index=pd.RangeIndex(len(starts)),
+        )
+        return frame, compensations, starts, counts
+
+    def get_stats(
+            self,
+            by: Sequence[str] = (),
+            query: Optional[ParticipantsQueryParams] = None,
+            quantiles: Optional[Dict[str, float]] = None,
+    ) -> pd.DataFrame:
+        """Returns the count, mean and compensation percentiles of every group.
+
+        Parameters
+        ----------
+        by : Sequence[str]
+            The columns to group the participants by, e.g. `["title", "level"]`, see `DIMENSIONS`. Without columns,
+            the result has a single row for all the selected participants.
+        query : ParticipantsQueryParams, optional
+            The query parameters to select the participants with, like a stats query: omitted `include_*` parameters
+            fall back to the server defaults. Defaults to all the participants.
+        quantiles : Dict[str, float], optional
+            The percentiles to compute, by the name of their column. Defaults to those of the stats of the API,
+            `STATS_QUANTILES`.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per group, in the order of the categories of the grouping columns, with the grouping columns,
+            `totalCount`, `mean` and one column per percentile.
+        """
+        frame, compensations, starts, counts = self._segments(by, query)
+        valid = ~np.isnan(compensations)
+        present = np.add.reduceat(valid, starts) if len(starts) else np.zeros(0, dtype=int)
+        sums = np.add.reduceat(np.where(valid, compensations, 0), starts) if len(starts) else np.zeros(0)
+
+        frame["totalCount"] = counts
+        with np.errstate(invalid="ignore", divide="ignore"):
+            frame["mean"] = np.where(present > 0, sums / np.maximum(present, 1), np.nan)
+        padded = np.r_[compensations, np.nan]
+        for name, quantile in (STATS_QUANTILES if quantiles is None else quantiles).items():
+            position = quantile * np.maximum(present - 1, 0)
+            low = np.floor(position).astype(np.intp)
+            high = np.minimum(low + 1, np.maximum(present - 1, 0))
+            # Groups without compensations read the padding, i.e. a missing value.
+            low_values = padded[np.where(present > 0, starts + low, len(compensations))]
+            high_values = padded[np.where(present > 0, starts + high, len(compensations))]
+            frame[name] = low_values + (high_values - low_values) * (position - low)
+        return frame
+
+    def get_histogram(
+            self, by: Sequence[str] = (), query: Optional[ParticipantsQueryParams] = None
+    ) -> pd.DataFrame:
+        """Returns the compensation buckets of every group, labelled like the buckets of `Stats.get_df()`.
+
+        Parameters
+        ----------
+        by : Sequence[str]
+            The columns to group the participants by, see `DIMENSIONS`.
+        query : ParticipantsQueryParams, optional
+            The query parameters to select the participants with. Defaults to all the participants.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per group and bucket, with the grouping columns, `bucket` and `count`. Every group has every
+            bucket, empty ones included.
+        """
+        frame, compensations, starts, counts = self._segments(by, query)
+        if self.bucket_edges is not None:
+            edges = np.asarray(self.bucket_edges, dtype=float)
+        else:
+            top = np.nanmax(self._compensations) if np.any(~np.isnan(self._compensations)) else 0
+            edges = np.arange(0, top + self.bucket_size, self.bucket_size)
+        labels = [_label(low, high) for low, high in zip(edges, [*edges[1:], None])]
+
+        valid = ~np.isnan(compensations)
+        segments = np.repeat(np.arange(len(starts)), counts)[valid]
+        buckets = np.clip(np.searchsorted(edges, compensations[valid], side="right") - 1, 0, len(edges) - 1)
+        histogram = np.bincount(segments * len(edges) + buckets, minlength=len(starts) * len(edges))
+
+        result = frame.iloc[np.repeat(np.arange(len(starts)), len(edges))].reset_index(drop=True)
+        result["bucket"] = pd.Categorical.from_codes(np.tile(np.arange(len(edges)), len(starts)), categories=labels)
+        result["count"] = histogram
+        return result
+
+    def get_gaps(
+            self,
+            column: str,
+            by: Sequence[str] = (),
+            reference: Any = None,
+            query: Optional[ParticipantsQueryParams] = None,
+            statistic: str = "median",
+    ) -> pd.DataFrame:
+        """Returns a table comparing a statistic across the values of a column within every group, e.g. the gender or
+        computer science degree pay gap by title.
+
+        Parameters
+        ----------
+        column : str
+            The column whose values are compared, e.g. `gender` or `cs_degree`.
+        by : Sequence[str]
+            The columns to group the participants by, see `DIMENSIONS`.
+        reference : Any, optional
+            The value of `column` the others are compared to. Defaults to the first value, e.g. `male`, or `True` for
+            boolean columns.
+        query : ParticipantsQueryParams, optional
+            The query parameters to select the participants with. Defaults to all the participants.
+        statistic : str
+            The statistic compared, a column of get_stats(), e.g. `median` or `mean`.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per group, with the grouping columns, then `count_<value>` and `<statistic>_<value>` for every
+            value of `column`, and `gap_<value>` for every value but the reference: the relative shortfall of the
+            statistic of that value from the reference, `1 - value / reference`.
+        """
+        stats = self.get_stats(by=[*by, column], query=query)
+        _, labels = self._factorize(column)
+        values = list(labels)
+        if reference is None:
+            reference = True if pd.api.types.is_bool_dtype(labels.dtype) else values[0]
+        if reference not in values:
+            raise ValueError(f"{reference!r} is not a value of {column!r}, expected one of {values}")
+
+        table = stats.set_index([*by, column])[["totalCount", statistic]]
+        # Columns of (statistic, value) pairs, one row per group.
+        table = table.unstack(column) if by else table.unstack().to_frame().T
+        result = pd.DataFrame(index=table.index)
+        for value in values:
+            result[f"count_{value}"] = table.get(("totalCount", value), pd.Series(0, table.index)).fillna(0).astype(int)
+        for value in values:
+            result[f"{statistic}_{value}"] = table.get((statistic, value), np.nan)
+        for value in values:
+            if value != reference:
+                result[f"gap_{value}"] = 1 - result[f"{statistic}_{value}"] / result[f"{statistic}_{reference}"]
+        return result.reset_index(drop=not by)
@@ -0,0 +1,341 @@
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+def _default_directory() -> str:
+    return os.path.join(
+        os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+        "egytech_api",
+    )
+
+
+class CacheEntry(BaseModel):
+    """Model for a single cached API response.
+
+    Attributes
+    ----------
+    body : bytes
+        The raw body of the cached response.
+    stored_at : float
+        The UNIX timestamp at which the response was stored or last revalidated.
+    etag : str, optional
+        The `ETag` header of the cached response, if the server provided one.
+    last_modified : str, optional
+        The `Last-Modified` header of the cached response, if the server provided one.
+
+    Methods
+    -------
+    decode()
+        Returns the deserialized body of the cached response.
+
+    """
+
+    model_config = ConfigDict(extra="forbid")
+    body: bytes
+    stored_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def decode(self) -> Any:
+        """Returns the deserialized body of the cached response.
+
+        Returns
+        -------
+        Any
+
+        """
+        return json.loads(self.body)
+
+
+class ResponseCache(BaseModel):
+    """Class for a persistent on-disk cache of API responses keyed by endpoint and canonical query parameters.
+
+    Entries older than `ttl` are revalidated with the server using their `ETag`/`Last-Modified` validators when
+    available, and the least recently used entries are evicted once the cache grows over `max_bytes`.
+
+    Attributes
+    ----------
+    directory : str
+        The directory the cache entries are stored in. Defaults to `$XDG_CACHE_HOME/egytech_api`
+        (`~/.cache/egytech_api`).
+    ttl : float, optional
+        The number of seconds a cached response is served without contacting the server. `None` means entries never
+        go stale.
+    max_bytes : int
+        The maximum total size of the cached response bodies in bytes.
+    _size : int, optional
+        The running total size of the cached response bodies, scanned from the directory on the first store and when
+        it grows over `max_bytes`, so that entries written by other processes are accounted for before evicting.
+
+    Methods
+    -------
+    key(path: str, params: Dict[str, Any])
+        Returns the cache key of the given endpoint and query parameters.
+    load(path: str, params: Dict[str, Any])
+        Returns the cached entry for the given endpoint and query parameters, if any.
+    is_fresh(entry: CacheEntry)
+        Returns whether the given entry can be served without revalidation.
+    validators(entry: CacheEntry)
+        Returns the conditional request headers for revalidating the given entry.
+    store(path: str, params: Dict[str, Any], body: bytes, headers: Mapping[str, str])
+        Stores the given response body in the cache.
+    refresh(path: str, params: Dict[str, Any], entry: CacheEntry)
+        Marks the given entry as revalidated by the server.
+    clear()
+        Removes every entry from the cache.
+
+    """
+
+    model_config = ConfigDict(extra="forbid")
+    directory: str = Field(default_factory=_default_directory)
+    ttl: Optional[float] = Field(default=24 * 60 * 60, ge=0)
+    max_bytes: int = Field(default=256 * 1024 * 1024, gt=0)
+    _size: Optional[int] = None
+    _lock: Any = None
+
+    def model_post_init(self, __context: Any) -> None:
+        """Placeholder that creates the cache directory after initialization of the pydantic model.
+
+        Parameters
+        ----------
+        __context : Any
+
+        Returns
+        -------
+        None
+
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def key(self, path: str, params: Dict[str, Any]) -> str:
+        """Returns the cache key of the given endpoint and query parameters.
+
+        Parameters
+        ----------
+        path : str
+            The API endpoint, e.g. "participants".
+        params : Dict[str, Any]
+            The serialized query parameters.
+
+        Returns
+        -------
+        str
+
+        """
+        canonical = json.dumps(
+            {"path": path, "params": params}, sort_keys=True, separators=(",", ":")
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _paths(self, key: str) -> tuple[str, str]:
+        base = os.path.join(self.directory, key)
+        return base + ".body", base + ".meta"
+
+    def load(self, path: str, params: Dict[str, Any]) -> Optional[CacheEntry]:
+        """Returns the cached entry for the given endpoint and query parameters, if any.
+
+        Parameters
+        ----------
+        path : str
+            The API endpoint, e.g. "participants".
+        params : Dict[str, Any]
+            The serialized query parameters.
+
+        Returns
+        -------
+        CacheEntry or None
+
+        """
+        body_path, meta_path = self._paths(self.key(path, params))
+        try:
+            with open(meta_path) as meta_file:
+                meta = json.load(meta_file)
+            with open(body_path, "rb") as body_file:
+                body = body_file.read()
+        except (OSError, ValueError):
+            return None
+
+        # The entry may be evicted by another process once read, which does not invalidate the read entry.
+        with contextlib.suppress(OSError):
+            os.utime(meta_path)
+        return CacheEntry(body=body, **meta)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Returns whether the given entry can be served without revalidation.
+
+        Parameters
+        ----------
+        entry : CacheEntry
+            The cached entry.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.ttl is None or time.time() - entry.stored_at < self.ttl
+
+    def validators(self, entry: CacheEntry) -> Dict[str, str]:
+        """Returns the conditional request headers for revalidating the given entry.
+
+        Parameters
+        ----------
+        entry : CacheEntry
+            The cached entry.
+
+        Returns
+        -------
+        Dict[str, str]
+
+        """
+        headers = {}
+        if entry.etag is not None:
+            headers["if-none-match"] = entry.etag
+        if entry.last_modified is not None:
+            headers["if-modified-since"] = entry.last_modified
+        return headers
+
+    def _replace(self, file_path: str, content: bytes) -> None:
+        # Every writer gets its own temporary file, so that concurrent writers of an entry, in threads or processes,
+        # never replace each other's temporary files.
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(content)
+            os.replace(temporary, file_path)
+        except BaseException:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            raise
+
+    def _write(self, key: str, entry: CacheEntry, write_body: bool = True) -> None:
+        body_path, meta_path = self._paths(key)
+        if write_body:
+            self._replace(body_path, entry.body)
+        self._replace(meta_path, json.dumps(entry.model_dump(exclude={"body"})).encode())
+
+    def store(
+            self,
+            path: str,
+            params: Dict[str, Any],
+            body: bytes,
+            headers: Mapping[str, str],
+    ) -> None:
+        """Stores the given response body in the cache, evicting the least recently used entries if needed.
+
+        Parameters
+        ----------
+        path : str
+            The API endpoint, e.g. "participants".
+        params : Dict[str, Any]
+            The serialized query parameters.
+        body : bytes
+            The raw body of the successful response.
+        headers : Mapping[str, str]
+            The headers of the successful response, used for its `ETag`/`Last-Modified` validators.
+
+        Returns
+        -------
+        None
+
+        """
+        if len(body) > self.max_bytes:
+            return
+
+        entry = CacheEntry(
+            body=body,
+            stored_at=time.time(),
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+        )
+        key = self.key(path, params)
+        try:
+            replaced = os.path.getsize(self._paths(key)[0])
+        except OSError:
+            replaced = 0
+        self._write(key, entry)
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan()[1]
+            else:
+                self._size += len(body) - replaced
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def refresh(
+            self, path: str, params: Dict[str, Any], entry: CacheEntry
+    ) -> None:
+        """Marks the given entry as revalidated by the server, restarting its time to live.
+
+        Parameters
+        ----------
+        path : str
+            The API endpoint, e.g. "participants".
+        params : Dict[str, Any]
+            The serialized query parameters.
+        entry : CacheEntry
+            The cached entry the server confirmed as unchanged.
+
+        Returns
+        -------
+        None
+
+        """
+        entry.stored_at = time.time()
+        self._write(self.key(path, params), entry, write_body=False)
+
+    def _scan(self) -> tuple[list[tuple[float, int, str, str]], int]:
+        """Returns every entry of the directory as `(last_used, size, body_path, meta_path)`, and their total size."""
+        entries = []
+        total = 0
+        for dir_entry in os.scandir(self.directory):
+            if not dir_entry.name.endswith(".meta"):
+                continue
+            key = dir_entry.name[: -len(".meta")]
+            body_path, meta_path = self._paths(key)
+            try:
+                size = os.path.getsize(body_path)
+                last_used = dir_entry.stat().st_mtime
+            except OSError:
+                continue
+            entries.append((last_used, size, body_path, meta_path))
+            total += size
+        return entries, total
+
+    def _evict(self) -> None:
+        entries, total = self._scan()
+        for _, size, body_path, meta_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for file_path in (meta_path, body_path):
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
+            total -= size
+        self._size = total
+
+    def clear(self) -> None:
+        """Removes every entry from the cache.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            for dir_entry in os.scandir(self.directory):
+                if dir_entry.name.endswith((".body", ".meta")):
+                    os.remove(dir_entry.path)
+            self._size = 0
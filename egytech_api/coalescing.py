@@ -0,0 +1,159 @@
+import asyncio
+import json
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+def flight_key(kind: str, path: str, params: Dict[str, Any]) -> Hashable:
+    """Returns the key identifying identical calls: the kind of result, the endpoint and the serialized parameters.
+
+    Parameters
+    ----------
+    kind : str
+        The kind of result of the call, e.g. `json` or `frame`, since calls decoding the same response differently
+        must not share their results.
+    path : str
+        The endpoint called.
+    params : Dict[str, Any]
+        The URL parameters of the call.
+
+    Returns
+    -------
+    Hashable
+    """
+    return kind, path, json.dumps(params, sort_keys=True, default=str)
+
+
+def share(result: Any) -> Any:
+    """Returns the result of a call shared with other callers, so that modifying it does not affect them.
+
+    DataFrames are copied lazily when pandas copies on write, and deeply otherwise. Decoded JSON responses are shared
+    as is and must be treated as read-only, like the responses of a `StatsCube`.
+
+    Parameters
+    ----------
+    result : Any
+
+    Returns
+    -------
+    Any
+    """
+    # Imported here so that sessions, which coalesce calls, do not import pandas.
+    import pandas as pd
+
+    if isinstance(result, pd.DataFrame):
+        copy_on_write = int(pd.__version__.split(".")[0]) >= 3 or pd.get_option("mode.copy_on_write") is True
+        return result.copy(deep=not copy_on_write)
+    return result
+
+
+class SingleFlight:
+    """Class coalescing concurrent identical calls into one: while a call is in flight, callers making an identical
+    call wait for it and share its result (or error) instead of making their own.
+
+    Calls are only coalesced while they are in flight, results are not kept afterwards; use a `ResponseCache` for
+    that. Threads coalesce with threads, and coroutines with the coroutines of the same event loop.
+
+    Methods
+    -------
+    do(key: Hashable, function: Callable[[], Any])
+        Calls the function unless an identical call is in flight in another thread, and returns its result.
+    ado(key: Hashable, function: Callable[[], Awaitable[Any]])
+        Awaits the coroutine function unless an identical call is in flight on the running event loop, and returns its
+        result.
+
+    Examples
+    --------
+    >>> flights = SingleFlight()
+    >>> result, shared = flights.do(flight_key("json", "stats", params), lambda: client.get("stats", params=params))
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._async_calls: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> tuple[Any, bool]:
+        """Calls the function unless an identical call is in flight in another thread, in which case this waits for
+        that call instead.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key identifying identical calls, see flight_key().
+        function : Callable[[], Any]
+            The call.
+
+        Returns
+        -------
+        tuple of Any and bool
+            The result of the call, and whether it was shared from another caller's call.
+
+        Raises
+        ------
+        Exception
+            The error the call failed with, raised to every caller waiting for it.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result(), True
+
+        try:
+            result = function()
+        except BaseException as error:
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(error)
+            raise
+        with self._lock:
+            del self._calls[key]
+        future.set_result(result)
+        return result, False
+
+    async def ado(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        """Awaits the coroutine function unless an identical call is in flight on the running event loop, in which
+        case this awaits that call instead.
+
+        The call runs in its own task, so cancelling one of its callers does not cancel it for the others.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key identifying identical calls, see flight_key().
+        function : Callable[[], Awaitable[Any]]
+            The coroutine function making the call.
+
+        Returns
+        -------
+        tuple of Any and bool
+            The result of the call, and whether it was shared from another caller's call.
+
+        Raises
+        ------
+        Exception
+            The error the call failed with, raised to every caller awaiting it.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            calls = self._async_calls.setdefault(loop, {})
+        task = calls.get(key)
+        if task is not None:
+            return await asyncio.shield(task), True
+
+        task = calls[key] = loop.create_task(function())
+
+        def done(task: asyncio.Task) -> None:
+            if calls.get(key) is task:
+                del calls[key]
+            if not task.cancelled():
+                # Retrieved so that an error is not reported as unhandled when every caller was cancelled.
+                task.exception()
+
+        task.add_done_callback(done)
+        return await asyncio.shield(task), False
@@ -1,12 +1,430 @@
 import asyncio
+import collections
+import contextlib
+import functools
 import itertools
-from typing import Any, Dict, Optional
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import (Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict,
+                    Generator, Iterable, Iterator, Literal, Optional, Union)
 
 import httpx
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, ConfigDict, Field
 
-from models import ParticipantsQueryParams, StatsQueryParams
+from .cache import CacheEntry, ResponseCache
+from .coalescing import SingleFlight, flight_key, share
+from .cube import StatsCube
+from .encoding import encode_query
+from .exceptions import APIError
+from .export import ChunkedWriter, save_feather, save_parquet
+from .instrumentation import (NULL_PROBE, Instrumentation, InstrumentationSummary,
+                              RequestSpan, probe_call)
+from .models import ParticipantsQueryParams, StatsQueryParams
+from .planner import QueryPlan
+from .refresh import Fingerprint
+from .responses import decode_response
+from .scheduler import QueryResult, Scheduler
+from .schema import (BUCKETS_SCHEMA, PARTICIPANTS_SCHEMA, STATS_SCHEMA, DtypeBackend,
+                     apply_schema)
+from .session import HEADERS, Session, get_session
+from .snapshot import ParticipantsSnapshot
+from .streaming import aread_frame, read_frame
+
+
+def _session(session: Optional[Session]) -> Session:
+    return get_session() if session is None else session
+
+
+def _run(make_calls: Callable[[], Awaitable[None]], *sessions: Optional[Session]) -> None:
+    """Runs the given coroutine function in a new event loop, closing the sessions' clients of that loop afterwards.
+
+    When an event loop is already running in the calling thread (e.g. in Jupyter or an async web framework), where
+    `asyncio.run()` is not allowed, the new event loop runs in a worker thread and the calling thread waits for it.
+    """
+
+    async def main() -> None:
+        try:
+            await make_calls()
+        finally:
+            for session in {id(session): session for session in map(_session, sessions)}.values():
+                await session.aclose()
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(main())
+        return
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="egytech_api") as executor:
+        executor.submit(asyncio.run, main()).result()
+
+
+def _map(
+        function: Callable[[Any], Any], items: Iterable[Any], max_workers: int, ordered: bool = True
+) -> Iterator[Any]:
+    """Lazily yields the results of the given function for every item, in order or in the order they complete,
+    computing up to `max_workers` of them concurrently in a thread pool. Items are only submitted as results are
+    consumed."""
+    if max_workers == 1:
+        yield from map(function, items)
+        return
+
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="egytech_api") as executor:
+        pending = collections.deque(
+            executor.submit(function, item) for item in itertools.islice(items, max_workers)
+        )
+        try:
+            while pending:
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    future = next(as_completed(pending))
+                    pending.remove(future)
+                for item in itertools.islice(items, 1):
+                    pending.append(executor.submit(function, item))
+                yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _typed(
+        frame: pd.DataFrame, schema: Dict[str, Any], dtype_backend: Optional[DtypeBackend]
+) -> pd.DataFrame:
+    if dtype_backend is None:
+        return frame
+    return apply_schema(frame, schema, dtype_backend)
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    try:
+        return float(response.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _lookup(
+        cache: Optional[ResponseCache], path: str, params: Dict[str, Any]
+) -> tuple[Optional[CacheEntry], Dict[str, str]]:
+    if cache is None:
+        return None, HEADERS
+    entry = cache.load(path, params)
+    if entry is None:
+        return None, HEADERS
+    return entry, {**HEADERS, **cache.validators(entry)}
+
+
+def _revalidated(
+        response: httpx.Response,
+        cache: Optional[ResponseCache],
+        path: str,
+        params: Dict[str, Any],
+        entry: Optional[CacheEntry],
+) -> bool:
+    if response.status_code == 304 and entry is not None:
+        cache.refresh(path, params, entry)
+        return True
+
+    if response.status_code != 200:
+        raise APIError(response.status_code, _retry_after(response))
+    return False
+
+
+def _decode(path: str, body: bytes, validate: bool) -> Any:
+    """Decodes a JSON response body, validated against the response models in the same pass if `validate` is set."""
+    return decode_response(path, body) if validate else json.loads(body)
+
+
+def _resolve(
+        response: httpx.Response,
+        cache: Optional[ResponseCache],
+        path: str,
+        params: Dict[str, Any],
+        entry: Optional[CacheEntry],
+        probe: Any = NULL_PROBE,
+        validate: bool = False,
+) -> Any:
+    if _revalidated(response, cache, path, params, entry):
+        deser_response = _decode(path, entry.body, validate)
+    else:
+        if cache is not None:
+            cache.store(path, params, response.content, response.headers)
+        deser_response = _decode(path, response.content, validate)
+    probe.mark("decode")
+    return deser_response
+
+
+def _cached(path: str, entry: CacheEntry, probe: Any, validate: bool = False) -> Any:
+    probe.cached()
+    deser_response = _decode(path, entry.body, validate)
+    probe.mark("decode")
+    return deser_response
+
+
+def _coalesced(
+        flights: SingleFlight, kind: str, path: str, params: Dict[str, Any], probe: Any, call: Callable[[], Any]
+) -> Any:
+    result, shared = flights.do(flight_key(kind, path, params), call)
+    if not shared:
+        return result
+    probe.coalesced()
+    return share(result)
+
+
+async def _acoalesced(
+        flights: SingleFlight,
+        kind: str,
+        path: str,
+        params: Dict[str, Any],
+        probe: Any,
+        call: Callable[[], Awaitable[Any]],
+) -> Any:
+    result, shared = await flights.ado(flight_key(kind, path, params), call)
+    if not shared:
+        return result
+    probe.coalesced()
+    return share(result)
+
+
+def _get_json(
+        path: str,
+        params: Dict[str, Any],
+        client: httpx.Client,
+        cache: Optional[ResponseCache] = None,
+        probe: Any = NULL_PROBE,
+        flights: Optional[SingleFlight] = None,
+        validate: bool = False,
+) -> Any:
+    if flights is not None:
+        return _coalesced(
+            flights, "records" if validate else "json", path, params, probe,
+            lambda: _get_json(path, params, client, cache, probe, validate=validate),
+        )
+
+    entry, headers = _lookup(cache, path, params)
+    if entry is not None and cache.is_fresh(entry):
+        return _cached(path, entry, probe, validate)
+
+    response = probe.send(client, path, headers, params)
+    return _resolve(response, cache, path, params, entry, probe, validate)
+
+
+async def _aget_json(
+        path: str,
+        params: Dict[str, Any],
+        client: httpx.AsyncClient,
+        cache: Optional[ResponseCache] = None,
+        probe: Any = NULL_PROBE,
+        flights: Optional[SingleFlight] = None,
+        validate: bool = False,
+) -> Any:
+    if flights is not None:
+        return await _acoalesced(
+            flights, "records" if validate else "json", path, params, probe,
+            lambda: _aget_json(path, params, client, cache, probe, validate=validate),
+        )
+
+    entry, headers = _lookup(cache, path, params)
+    if entry is not None and cache.is_fresh(entry):
+        return _cached(path, entry, probe, validate)
+
+    response = await probe.asend(client, path, headers, params)
+    return _resolve(response, cache, path, params, entry, probe, validate)
+
+
+def _get_changed(
+        path: str,
+        params: Dict[str, Any],
+        client: httpx.Client,
+        fingerprint: Optional[Fingerprint],
+        probe: Any = NULL_PROBE,
+) -> tuple[Fingerprint, Optional[httpx.Response]]:
+    """Fetches the results of a query, conditionally on the fingerprint of the previous response if any. Returns the
+    fingerprint of the current results, and the response or None when the results are unchanged."""
+    headers = HEADERS if fingerprint is None else {**HEADERS, **fingerprint.validators()}
+    response = probe.send(client, path, headers, params)
+    if response.status_code == 304 and fingerprint is not None:
+        return fingerprint, None
+    if response.status_code != 200:
+        raise APIError(response.status_code, _retry_after(response))
+
+    current = Fingerprint.from_response(response)
+    return current, None if current.matches(fingerprint) else response
+
+
+def _as_frame(part: Union[list[Dict[str, Any]], pd.DataFrame]) -> pd.DataFrame:
+    if isinstance(part, pd.DataFrame):
+        return part
+    return pd.DataFrame.from_records(part)
+
+
+def _aggregate(
+        parts: list[Optional[Union[list[Dict[str, Any]], pd.DataFrame]]],
+        keys: Optional[list[Any]] = None,
+        key_names: Optional[list[str]] = None,
+) -> pd.DataFrame:
+    """Aggregates the per-query results of a pooled fetch, skipping failed queries (`None`).
+
+    When `keys` are given, the result is indexed by a MultiIndex made of the key of the originating query followed
+    by the position of the row within the results of that query.
+    """
+    present = [index for index, part in enumerate(parts) if part is not None]
+    parts = [parts[index] for index in present]
+
+    if all(isinstance(part, list) for part in parts):
+        frame = pd.DataFrame.from_records(itertools.chain.from_iterable(parts))
+    elif len(parts) == 1:
+        frame = _as_frame(parts[0]).reset_index(drop=True)
+    else:
+        frame = pd.concat(map(_as_frame, parts), ignore_index=True)
+
+    if keys is not None:
+        if key_names is None:
+            key_names = [None] * (len(keys[0]) if keys else 0)
+        counts = np.asarray([len(part) for part in parts], dtype=np.intp)
+        positions = np.repeat(np.asarray(present, dtype=np.intp), counts)
+        levels = [
+            pd.Index([key[level] for key in keys], tupleize_cols=False).take(positions)
+            for level in range(len(key_names))
+        ]
+        rows = np.arange(len(frame)) - np.repeat(np.cumsum(counts) - counts, counts)
+        frame.index = pd.MultiIndex.from_arrays(levels + [rows], names=[*key_names, None])
+    return frame
+
+
+def _aggregate_stats(
+        responses: list[Optional[Dict[str, Any]]],
+        keys: Optional[list[Any]] = None,
+        key_names: Optional[list[str]] = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Aggregates the per-query responses of a pooled stats fetch into a DataFrame of stats rows and one of buckets,
+    both indexed by the key of the originating query (its position by default), skipping failed queries (`None`).
+    """
+    if keys is None:
+        keys, key_names = [(position,) for position in range(len(responses))], ["query"]
+    elif key_names is None:
+        key_names = [None] * (len(keys[0]) if keys else 0)
+
+    present = [index for index, response in enumerate(responses) if response is not None]
+    index = pd.MultiIndex.from_arrays(
+        [
+            pd.Index([keys[position][level] for position in present], tupleize_cols=False)
+            for level in range(len(key_names))
+        ],
+        names=key_names,
+    )
+    stats = pd.DataFrame.from_records(
+        [responses[position]["stats"] for position in present], index=index
+    )
+    buckets = _aggregate(
+        [None if response is None else response["buckets"] for response in responses],
+        keys,
+        key_names,
+    )
+    return stats, buckets
+
+
+def _write(
+        writer: Optional[ChunkedWriter],
+        position: int,
+        part: Optional[Union[list[Dict[str, Any]], pd.DataFrame]],
+        dtype_backend: Optional[DtypeBackend],
+) -> Optional[Union[list[Dict[str, Any]], pd.DataFrame]]:
+    """Appends the results of the query at the given position to the writer, typed so that every chunk shares the
+    same dtypes, and returns them unchanged."""
+    if writer is not None and part is not None:
+        frame = _as_frame(part)
+        if not frame.columns.empty:
+            frame = apply_schema(frame, PARTICIPANTS_SCHEMA, dtype_backend or "numpy_nullable")
+            frame.insert(0, "query", position)
+        writer.write(frame)
+    return part
+
+
+def _tee(chunks: Iterable[bytes], body: Optional[bytearray]) -> Iterator[bytes]:
+    for chunk in chunks:
+        if body is not None:
+            body += chunk
+        yield chunk
+
+
+async def _atee(
+        chunks: AsyncIterable[bytes], body: Optional[bytearray]
+) -> AsyncIterator[bytes]:
+    async for chunk in chunks:
+        if body is not None:
+            body += chunk
+        yield chunk
+
+
+def _read_cached(entry: CacheEntry, probe: Any) -> pd.DataFrame:
+    frame = read_frame([entry.body])
+    probe.mark("decode")
+    return frame
+
+
+def _stream_frame(
+        path: str,
+        params: Dict[str, Any],
+        client: httpx.Client,
+        cache: Optional[ResponseCache] = None,
+        probe: Any = NULL_PROBE,
+        flights: Optional[SingleFlight] = None,
+) -> pd.DataFrame:
+    if flights is not None:
+        return _coalesced(
+            flights, "frame", path, params, probe, lambda: _stream_frame(path, params, client, cache, probe)
+        )
+
+    entry, headers = _lookup(cache, path, params)
+    if entry is not None and cache.is_fresh(entry):
+        probe.cached()
+        return _read_cached(entry, probe)
+
+    with probe.stream(client, path, headers, params) as response:
+        if _revalidated(response, cache, path, params, entry):
+            return _read_cached(entry, probe)
+        body = bytearray() if cache is not None else None
+        frame = read_frame(_tee(response.iter_bytes(), body))
+        probe.mark("download")
+
+    if cache is not None:
+        cache.store(path, params, bytes(body), response.headers)
+    return frame
+
+
+async def _astream_frame(
+        path: str,
+        params: Dict[str, Any],
+        client: httpx.AsyncClient,
+        cache: Optional[ResponseCache] = None,
+        probe: Any = NULL_PROBE,
+        flights: Optional[SingleFlight] = None,
+) -> pd.DataFrame:
+    if flights is not None:
+        return await _acoalesced(
+            flights, "frame", path, params, probe, lambda: _astream_frame(path, params, client, cache, probe)
+        )
+
+    entry, headers = _lookup(cache, path, params)
+    if entry is not None and cache.is_fresh(entry):
+        probe.cached()
+        return _read_cached(entry, probe)
+
+    async with probe.astream(client, path, headers, params) as response:
+        if _revalidated(response, cache, path, params, entry):
+            return _read_cached(entry, probe)
+        body = bytearray() if cache is not None else None
+        frame = await aread_frame(_atee(response.aiter_bytes(), body))
+        probe.mark("download")
+
+    if cache is not None:
+        cache.store(path, params, bytes(body), response.headers)
+    return frame
 
 
 class Participants(ParticipantsQueryParams):
@@ -42,29 +460,77 @@ class Participants(ParticipantsQueryParams):
         Whether to include participants who have relocated.
     include_remote_abroad : bool, optional
         Whether to include participants who are work remotely for companies abroad.
+    snapshot : ParticipantsSnapshot, optional
+        A snapshot of the full participants dataset. When given, the query is answered locally from the snapshot
+        instead of calling the API.
+    cache : ResponseCache, optional
+        A persistent on-disk cache of API responses. When given, responses are served from and stored in the cache.
+    session : Session, optional
+        The session holding the shared, long-lived HTTP clients. Defaults to the process-wide session returned by
+        `egytech_api.session.get_session()`.
+    async_client : httpx.AsyncClient, optional
+        An asynchronous client to make the API call of afetch() with, instead of the client of the session, e.g. the
+        client of a web application. It must be configured with the base URL of the API and is not closed.
+    instrumentation : Instrumentation, optional
+        The instrumentation of the API call. When given, the call is measured phase by phase and its measurements are
+        passed to the hooks of the instrumentation and returned by get_summary().
+    validate_responses : bool
+        Whether to validate the response against the response models (`ParticipantRecord`), parsing and
+        validating the raw JSON in one pass without building model objects. Records with fields of unexpected types or
+        values raise a `pydantic.ValidationError`, so API changes are caught on ingestion. Ignored with `stream`.
+    stream : bool
+        Whether to decode the response incrementally while it downloads, straight into typed column buffers, instead
+        of building the full list of records first. This roughly halves the peak memory of large responses.
+    dtype_backend : {None, 'numpy_nullable', 'pyarrow'}
+        The dtypes of the resulting DataFrame. When set, the enum-like columns are categorical with the category sets
+        of the enums and the other columns use nullable NumPy or `pyarrow`-backed dtypes, see `egytech_api.schema`.
+        When None, the dtypes are inferred by pandas.
+    lazy : bool
+        Whether to defer the API call until the results are first accessed or fetch()/afetch() is called. When False,
+        the API call is executed on initialization.
     _participants : pd.DataFrame
         This is where the pandas.DataFrame resulting from the API Call is stored. It can be accessed using by calling
         the get_df() method on your instance of the class.
 
     Methods
     -------
+    fetch()
+        Executes the API call unless it has already been executed.
+    afetch()
+        Asynchronously executes the API call unless it has already been executed.
     get_df()
         Returns the pandas.DataFrame of the retrieved participants.
+    get_summary()
+        Returns the measurements of the API call, if the client is instrumented.
     save_csv(filename: str="participants")
         Saves the participants DataFrame to a CSV file.
     save_excel(filename: str="participants")
         Saves the participants DataFrame to an Excel file.
+    save_parquet(filename: str = "participants", compression: str = "snappy")
+        Saves the participants DataFrame to a Parquet file.
+    save_feather(filename: str = "participants", compression: str = "zstd")
+        Saves the participants DataFrame to a Feather file.
     """
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True, use_enum_values=True, extra="forbid"
     )
+    snapshot: Optional[ParticipantsSnapshot] = Field(default=None, exclude=True)
+    cache: Optional[ResponseCache] = Field(default=None, exclude=True)
+    session: Optional[Session] = Field(default=None, exclude=True)
+    async_client: Optional[httpx.AsyncClient] = Field(default=None, exclude=True)
+    instrumentation: Optional[Instrumentation] = Field(default=None, exclude=True)
+    validate_responses: bool = Field(default=False, exclude=True)
+    stream: bool = Field(default=False, exclude=True)
+    dtype_backend: Optional[DtypeBackend] = Field(default=None, exclude=True)
+    lazy: bool = Field(default=False, exclude=True)
     _participants: Optional[pd.DataFrame] = None
+    _spans: list[RequestSpan] = []
 
     def model_post_init(self, __context: Any) -> None:
         """
         Placeholder that calls execute_call() on self with given query parameters after initialization of the pydantic
-        model for the available query parameters with the correct specification.
+        model for the available query parameters with the correct specification, unless `lazy` is set.
 
         Parameters
         ----------
@@ -74,39 +540,134 @@ class Participants(ParticipantsQueryParams):
         -------
         None
         """
-        self.execute_call()
+        if not self.lazy:
+            self.execute_call()
 
     def execute_call(self):
-        """Executes the API call with the given query parameters during model initialization.
+        """Executes the API call with the given query parameters.
 
         Returns
         -------
         None
         """
-        url = "https://api.egytech.fyi/participants"
-        headers = {"accept": "application/json"}
+        if self.snapshot is not None:
+            self._participants = _typed(self.snapshot.query(self), PARTICIPANTS_SCHEMA, self.dtype_backend)
+            return
+
+        session = _session(self.session)
+        params, client = encode_query(self), session.client()
+        self._spans = []
+        with probe_call(self.instrumentation, "participants", params, self._spans) as probe:
+            if self.stream:
+                participants = _stream_frame(
+                    "participants",
+                    params,
+                    client,
+                    self.cache,
+                    probe,
+                    session.flights(),
+                )
+            else:
+                participants_dict = _get_json(
+                    "participants",
+                    params,
+                    client,
+                    self.cache,
+                    probe,
+                    session.flights(),
+                    self.validate_responses,
+                )["results"]
+                participants = pd.DataFrame.from_records(participants_dict)
 
-        response = httpx.get(
-            url,
-            headers=headers,
-            params=self.model_dump(mode="json", exclude_none=True),
-        )
+            self._participants = _typed(participants, PARTICIPANTS_SCHEMA, self.dtype_backend)
+            probe.mark("frame")
+
+    async def aexecute_call(self) -> None:
+        """Asynchronously executes the API call with the given query parameters on the running event loop.
+
+        Returns
+        -------
+        None
+        """
+        if self.snapshot is not None:
+            self._participants = _typed(self.snapshot.query(self), PARTICIPANTS_SCHEMA, self.dtype_backend)
+            return
+
+        session = _session(self.session)
+        params, client = encode_query(self), self.async_client or session.async_client()
+        self._spans = []
+        with probe_call(self.instrumentation, "participants", params, self._spans) as probe:
+            if self.stream:
+                participants = await _astream_frame(
+                    "participants",
+                    params,
+                    client,
+                    self.cache,
+                    probe,
+                    session.flights(),
+                )
+            else:
+                participants_dict = (
+                    await _aget_json(
+                        "participants",
+                        params,
+                        client,
+                        self.cache,
+                        probe,
+                        session.flights(),
+                        self.validate_responses,
+                    )
+                )["results"]
+                participants = pd.DataFrame.from_records(participants_dict)
+
+            self._participants = _typed(participants, PARTICIPANTS_SCHEMA, self.dtype_backend)
+            probe.mark("frame")
+
+    def fetch(self) -> "Participants":
+        """Executes the API call unless it has already been executed.
+
+        Returns
+        -------
+        Participants
+            The instance itself, so calls can be chained.
+        """
+        if self._participants is None:
+            self.execute_call()
+        return self
 
-        if response.status_code != 200:
-            raise Exception("Unsuccessful API Call")
+    async def afetch(self) -> "Participants":
+        """Asynchronously executes the API call on the running event loop unless it has already been executed.
+
+        Returns
+        -------
+        Participants
+            The instance itself, so calls can be chained.
+        """
+        if self._participants is None:
+            await self.aexecute_call()
+        return self
 
-        participants_dict = response.json()["results"]
+    def get_summary(self) -> Optional[InstrumentationSummary]:
+        """Returns the aggregated measurements of the API call, executing it first if it is deferred.
 
-        self._participants = pd.DataFrame.from_records(participants_dict)
+        Returns
+        -------
+        InstrumentationSummary or None
+            The summary, or None when the client is not instrumented.
+        """
+        self.fetch()
+        if self.instrumentation is None:
+            return None
+        return InstrumentationSummary.from_spans(self._spans)
 
     def get_df(self):
-        """Returns the pandas.DataFrame of the participants.
+        """Returns the pandas.DataFrame of the participants, executing the API call first if it is deferred.
 
         Returns
         -------
         pd.DataFrame
         """
-        return self._participants
+        return self.fetch()._participants
 
     def save_csv(self, filename: str = "participants") -> None:
         """Saves the participants DataFrame to a CSV file.
@@ -121,7 +682,7 @@ class Participants(ParticipantsQueryParams):
         -------
         None
         """
-        self._participants.to_csv(filename + ".csv", index=False)
+        self.get_df().to_csv(filename + ".csv", index=False)
 
     def save_excel(self, filename: str = "participants") -> None:
         """Saves the participants DataFrame to an Excel file.
@@ -136,10 +697,142 @@ class Participants(ParticipantsQueryParams):
         -------
         None
         """
-        self._participants.to_excel(
+        self.get_df().to_excel(
             filename + ".xlsx", index=False, engine="xlsxwriter"
         )
 
+    def save_parquet(
+            self, filename: str = "participants", compression: Optional[str] = "snappy"
+    ) -> None:
+        """Saves the participants DataFrame to a Parquet file, keeping its dtypes and index. This requires the optional
+        `pyarrow` dependency.
+
+        Parameters
+        ----------
+        filename : str = "participants"
+            The filename to save the Parquet file to. This should not include the file extension.
+            Example: "participants" would lead to a file named "participants.parquet".
+        compression : {'snappy', 'zstd', 'gzip', 'brotli', 'lz4', None}
+            The compression codec.
+
+        Returns
+        -------
+        None
+
+        """
+        save_parquet(self.get_df(), filename, compression)
+
+    def save_feather(
+            self, filename: str = "participants", compression: Optional[str] = "zstd"
+    ) -> None:
+        """Saves the participants DataFrame to a Feather (Arrow IPC) file, keeping its dtypes and index. This requires
+        the optional `pyarrow` dependency.
+
+        Parameters
+        ----------
+        filename : str = "participants"
+            The filename to save the Feather file to. This should not include the file extension.
+            Example: "participants" would lead to a file named "participants.feather".
+        compression : {'zstd', 'lz4', None}
+            The compression codec.
+
+        Returns
+        -------
+        None
+
+        """
+        save_feather(self.get_df(), filename, compression)
+
+
+class AsyncParticipants(Participants):
+    """Class that acts as an asynchronous client for retrieval of participants from the API, for use inside a running
+    event loop, e.g. in the handlers of an async web framework or in Jupyter.
+
+    Creating an instance never calls the API. Awaiting it executes the API call on the running event loop, over the
+    given `async_client` or the client of the session for that loop, and returns the instance, so the event loop is
+    never blocked. Cancelling the awaiting task, or exceeding `timeout`, cancels the API call and leaves the instance
+    unfetched, so it can be awaited again. Results are accessed like those of `Participants` once awaited.
+
+    Attributes
+    ----------
+    timeout : float, optional
+        The number of seconds the API call may take, including reading a cached response and building the DataFrame,
+        before it is cancelled with a `TimeoutError`. Without it, only the timeouts of the HTTP client apply.
+
+    The query parameters and the other attributes are those of `Participants`, except `lazy`, which is ignored.
+
+    Methods
+    -------
+    afetch()
+        Asynchronously executes the API call unless it has already been executed. Awaiting the instance calls it.
+    fetch()
+        Returns the instance, which must have been awaited already.
+    get_df()
+        Returns the pandas.DataFrame of the retrieved participants.
+
+    Examples
+    --------
+    >>> participants = await AsyncParticipants(title="backend", async_client=client, timeout=5)
+    >>> participants.get_df()
+
+    Instances are not hashable, so concurrent calls are gathered through afetch():
+
+    >>> results = await asyncio.gather(*(AsyncParticipants(title=title).afetch() for title in ["backend", "frontend"]))
+    """
+
+    timeout: Optional[float] = Field(default=None, gt=0, exclude=True)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Placeholder that leaves the API call to the first await of the instance.
+
+        Parameters
+        ----------
+        __context : Any
+
+        Returns
+        -------
+        None
+        """
+
+    def __await__(self) -> Generator[Any, None, "AsyncParticipants"]:
+        return self.afetch().__await__()
+
+    def fetch(self) -> "AsyncParticipants":
+        """Returns the instance, which must have been awaited already: the API call is never executed synchronously,
+        which would block the event loop.
+
+        Returns
+        -------
+        AsyncParticipants
+
+        Raises
+        ------
+        RuntimeError
+            If the instance has not been awaited yet.
+        """
+        if self._participants is None:
+            raise RuntimeError("AsyncParticipants must be awaited before its results are accessed")
+        return self
+
+    async def afetch(self) -> "AsyncParticipants":
+        """Asynchronously executes the API call on the running event loop, within `timeout`, unless it has already been
+        executed.
+
+        Returns
+        -------
+        AsyncParticipants
+            The instance itself, so calls can be chained.
+
+        Raises
+        ------
+        TimeoutError
+            If the API call takes longer than `timeout`.
+        """
+        if self._participants is None:
+            async with asyncio.timeout(self.timeout):
+                await self.aexecute_call()
+        return self
+
 
 class Stats(StatsQueryParams):
     """Class for retrieval of statistics from the API with the given query parameters.
@@ -177,7 +870,31 @@ class Stats(StatsQueryParams):
     programming_language : {None, 'java_script', 'type_script', 'python', 'c_sharp', 'java', 'php', 'c_cplusplus',\
     'kotlin', 'swift', 'dart', 'go', 'r', 'scala', 'rust'}
         The programming language of the participants.
-    _stats : Dict[str, str]
+    cube : StatsCube, optional
+        A cube of the aggregates of a participants snapshot. When given, the query is answered locally from the cube
+        instead of calling the API. Queries on `programming_language` are not supported.
+    cache : ResponseCache, optional
+        A persistent on-disk cache of API responses. When given, responses are served from and stored in the cache.
+    session : Session, optional
+        The session holding the shared, long-lived HTTP clients. Defaults to the process-wide session returned by
+        `egytech_api.session.get_session()`.
+    async_client : httpx.AsyncClient, optional
+        An asynchronous client to make the API call of afetch() with, instead of the client of the session, e.g. the
+        client of a web application. It must be configured with the base URL of the API and is not closed.
+    instrumentation : Instrumentation, optional
+        The instrumentation of the API call. When given, the call is measured phase by phase and its measurements are
+        passed to the hooks of the instrumentation and returned by get_summary().
+    validate_responses : bool
+        Whether to validate the response against the response models (`StatsSummary` and `Bucket`), parsing and
+        validating the raw JSON in one pass without building model objects. Statistics or buckets with fields of
+        unexpected types or values raise a `pydantic.ValidationError`, so API changes are caught on ingestion.
+    dtype_backend : {None, 'numpy_nullable', 'pyarrow'}
+        The dtypes of the buckets DataFrame. When set, the buckets are categorical and the counts use nullable NumPy
+        or `pyarrow`-backed integers, see `egytech_api.schema`. When None, the dtypes are inferred by pandas.
+    lazy : bool
+        Whether to defer the API call until the results are first accessed or fetch()/afetch() is called. When False,
+        the API call is executed on initialization.
+    _stats : Dict[str, Any]
         The dictionary of statistics retrieved from the API Call. This can be accessed by calling the get_stats() method
         on your instance of the class.
     _buckets : pd.DataFrame
@@ -186,25 +903,44 @@ class Stats(StatsQueryParams):
 
     Methods
     -------
+    fetch()
+        Executes the API call unless it has already been executed.
+    afetch()
+        Asynchronously executes the API call unless it has already been executed.
     get_stats()
         Returns the statistics from the API Call.
     get_df()
         Returns the pandas.DataFrame of the buckets.
+    get_summary()
+        Returns the measurements of the API call, if the client is instrumented.
     save_csv(filename: str="buckets")
         Saves the buckets DataFrame to a CSV file.
     save_excel(filename: str="buckets")
         Saves the buckets DataFrame to an Excel file.
+    save_parquet(filename: str = "buckets", compression: str = "snappy")
+        Saves the buckets DataFrame to a Parquet file.
+    save_feather(filename: str = "buckets", compression: str = "zstd")
+        Saves the buckets DataFrame to a Feather file.
     """
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True, use_enum_values=True, extra="forbid"
     )
-    _stats: Optional[Dict[str, str]] = None
+    cube: Optional[StatsCube] = Field(default=None, exclude=True)
+    cache: Optional[ResponseCache] = Field(default=None, exclude=True)
+    session: Optional[Session] = Field(default=None, exclude=True)
+    async_client: Optional[httpx.AsyncClient] = Field(default=None, exclude=True)
+    instrumentation: Optional[Instrumentation] = Field(default=None, exclude=True)
+    validate_responses: bool = Field(default=False, exclude=True)
+    dtype_backend: Optional[DtypeBackend] = Field(default=None, exclude=True)
+    lazy: bool = Field(default=False, exclude=True)
+    _stats: Optional[Dict[str, Any]] = None
     _buckets: Optional[pd.DataFrame] = None
+    _spans: list[RequestSpan] = []
 
     def model_post_init(self, __context: Any) -> None:
         """Placeholder that calls execute_call() on self with given query parameters after initialization of the
-        pydantic model for the available query parameters with the correct specification.
+        pydantic model for the available query parameters with the correct specification, unless `lazy` is set.
 
         Parameters
         ----------
@@ -215,54 +951,140 @@ class Stats(StatsQueryParams):
         None
 
         """
-        self.execute_call()
+        if not self.lazy:
+            self.execute_call()
 
     def execute_call(self) -> None:
-        """Executes the API call with the given query parameters during model initialization.
+        """Executes the API call with the given query parameters.
 
         Returns
         -------
         None
 
         """
-        url = "https://api.egytech.fyi/stats"
-        headers = {"accept": "application/json"}
+        if self.cube is not None:
+            deser_response = self.cube.response(self)
+            self._buckets = _typed(
+                pd.DataFrame.from_records(deser_response["buckets"]), BUCKETS_SCHEMA, self.dtype_backend
+            )
+            self._stats = deser_response["stats"]
+            return
+
+        session = _session(self.session)
+        params, client = encode_query(self), session.client()
+        self._spans = []
+        with probe_call(self.instrumentation, "stats", params, self._spans) as probe:
+            deser_response = _get_json(
+                "stats",
+                params,
+                client,
+                self.cache,
+                probe,
+                session.flights(),
+                self.validate_responses,
+            )
 
-        response = httpx.get(
-            url,
-            headers=headers,
-            params=self.model_dump(mode="json", exclude_none=True),
-        )
+            self._buckets = _typed(
+                pd.DataFrame.from_records(deser_response["buckets"]), BUCKETS_SCHEMA, self.dtype_backend
+            )
+            self._stats = deser_response["stats"]
+            probe.mark("frame")
 
-        if response.status_code != 200:
-            raise Exception("Unsuccessful API Call")
+    async def aexecute_call(self) -> None:
+        """Asynchronously executes the API call with the given query parameters on the running event loop.
 
-        deser_response = response.json()
+        Returns
+        -------
+        None
 
-        self._buckets = pd.DataFrame.from_records(
-            deser_response["buckets"]
-        )
-        self._stats = deser_response["stats"]
+        """
+        if self.cube is not None:
+            deser_response = self.cube.response(self)
+            self._buckets = _typed(
+                pd.DataFrame.from_records(deser_response["buckets"]), BUCKETS_SCHEMA, self.dtype_backend
+            )
+            self._stats = deser_response["stats"]
+            return
+
+        session = _session(self.session)
+        params, client = encode_query(self), self.async_client or session.async_client()
+        self._spans = []
+        with probe_call(self.instrumentation, "stats", params, self._spans) as probe:
+            deser_response = await _aget_json(
+                "stats",
+                params,
+                client,
+                self.cache,
+                probe,
+                session.flights(),
+                self.validate_responses,
+            )
+
+            self._buckets = _typed(
+                pd.DataFrame.from_records(deser_response["buckets"]), BUCKETS_SCHEMA, self.dtype_backend
+            )
+            self._stats = deser_response["stats"]
+            probe.mark("frame")
+
+    def fetch(self) -> "Stats":
+        """Executes the API call unless it has already been executed.
+
+        Returns
+        -------
+        Stats
+            The instance itself, so calls can be chained.
+
+        """
+        if self._stats is None:
+            self.execute_call()
+        return self
+
+    async def afetch(self) -> "Stats":
+        """Asynchronously executes the API call on the running event loop unless it has already been executed.
+
+        Returns
+        -------
+        Stats
+            The instance itself, so calls can be chained.
+
+        """
+        if self._stats is None:
+            await self.aexecute_call()
+        return self
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns the statistics from the API Call, executing it first if it is deferred.
+
+        Returns
+        -------
+        Dict[str, Any]
+
+        """
+        return self.fetch()._stats
 
-    def get_stats(self) -> Dict[str, str]:
-        """Returns the statistics from the API Call.
+    def get_summary(self) -> Optional[InstrumentationSummary]:
+        """Returns the aggregated measurements of the API call, executing it first if it is deferred.
 
         Returns
         -------
-        Dict[str, str]
+        InstrumentationSummary or None
+            The summary, or None when the client is not instrumented.
 
         """
-        return self._stats
+        self.fetch()
+        if self.instrumentation is None:
+            return None
+        return InstrumentationSummary.from_spans(self._spans)
 
     def get_df(self) -> pd.DataFrame:
-        """Returns the pandas.DataFrame of the buckets.
+        """Returns the pandas.DataFrame of the buckets, executing the API call first if it is deferred.
 
         Returns
         -------
         pd.DataFrame
 
         """
-        return self._buckets
+        return self.fetch()._buckets
 
     def save_csv(self, filename: str) -> None:
         """Saves the buckets DataFrame to a CSV file.
@@ -278,7 +1100,7 @@ class Stats(StatsQueryParams):
         None
 
         """
-        self._buckets.to_csv(filename + ".csv", index=False)
+        self.get_df().to_csv(filename + ".csv", index=False)
 
     def save_excel(self, filename: str) -> None:
         """Saves the buckets DataFrame to an Excel file.
@@ -294,10 +1116,144 @@ class Stats(StatsQueryParams):
         None
 
         """
-        self._buckets.to_excel(
+        self.get_df().to_excel(
             filename + ".xlsx", index=False, engine="xlsxwriter"
         )
 
+    def save_parquet(
+            self, filename: str = "buckets", compression: Optional[str] = "snappy"
+    ) -> None:
+        """Saves the buckets DataFrame to a Parquet file, keeping its dtypes and index. This requires the optional
+        `pyarrow` dependency.
+
+        Parameters
+        ----------
+        filename : str = "buckets"
+            The filename to save the Parquet file to. This should not include the file extension.
+            Example: "buckets" would lead to a file named "buckets.parquet".
+        compression : {'snappy', 'zstd', 'gzip', 'brotli', 'lz4', None}
+            The compression codec.
+
+        Returns
+        -------
+        None
+
+        """
+        save_parquet(self.get_df(), filename, compression)
+
+    def save_feather(
+            self, filename: str = "buckets", compression: Optional[str] = "zstd"
+    ) -> None:
+        """Saves the buckets DataFrame to a Feather (Arrow IPC) file, keeping its dtypes and index. This requires the
+        optional `pyarrow` dependency.
+
+        Parameters
+        ----------
+        filename : str = "buckets"
+            The filename to save the Feather file to. This should not include the file extension.
+            Example: "buckets" would lead to a file named "buckets.feather".
+        compression : {'zstd', 'lz4', None}
+            The compression codec.
+
+        Returns
+        -------
+        None
+
+        """
+        save_feather(self.get_df(), filename, compression)
+
+
+class AsyncStats(Stats):
+    """Class that acts as an asynchronous client for retrieval of statistics from the API, for use inside a running
+    event loop, e.g. in the handlers of an async web framework or in Jupyter.
+
+    Creating an instance never calls the API. Awaiting it executes the API call on the running event loop, over the
+    given `async_client` or the client of the session for that loop, and returns the instance, so the event loop is
+    never blocked. Cancelling the awaiting task, or exceeding `timeout`, cancels the API call and leaves the instance
+    unfetched, so it can be awaited again. Results are accessed like those of `Stats` once awaited.
+
+    Attributes
+    ----------
+    timeout : float, optional
+        The number of seconds the API call may take, including reading a cached response and building the DataFrame,
+        before it is cancelled with a `TimeoutError`. Without it, only the timeouts of the HTTP client apply.
+
+    The query parameters and the other attributes are those of `Stats`, except `lazy`, which is ignored.
+
+    Methods
+    -------
+    afetch()
+        Asynchronously executes the API call unless it has already been executed. Awaiting the instance calls it.
+    fetch()
+        Returns the instance, which must have been awaited already.
+    get_stats()
+        Returns the statistics from the API Call.
+    get_df()
+        Returns the pandas.DataFrame of the buckets.
+
+    Examples
+    --------
+    >>> stats = await AsyncStats(title="backend", async_client=client, timeout=5)
+    >>> stats.get_stats()
+
+    Instances are not hashable, so concurrent calls are gathered through afetch():
+
+    >>> results = await asyncio.gather(*(AsyncStats(title=title).afetch() for title in ["backend", "frontend"]))
+    """
+
+    timeout: Optional[float] = Field(default=None, gt=0, exclude=True)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Placeholder that leaves the API call to the first await of the instance.
+
+        Parameters
+        ----------
+        __context : Any
+
+        Returns
+        -------
+        None
+        """
+
+    def __await__(self) -> Generator[Any, None, "AsyncStats"]:
+        return self.afetch().__await__()
+
+    def fetch(self) -> "AsyncStats":
+        """Returns the instance, which must have been awaited already: the API call is never executed synchronously,
+        which would block the event loop.
+
+        Returns
+        -------
+        AsyncStats
+
+        Raises
+        ------
+        RuntimeError
+            If the instance has not been awaited yet.
+        """
+        if self._stats is None:
+            raise RuntimeError("AsyncStats must be awaited before its results are accessed")
+        return self
+
+    async def afetch(self) -> "AsyncStats":
+        """Asynchronously executes the API call on the running event loop, within `timeout`, unless it has already been
+        executed.
+
+        Returns
+        -------
+        AsyncStats
+            The instance itself, so calls can be chained.
+
+        Raises
+        ------
+        TimeoutError
+            If the API call takes longer than `timeout`.
+        """
+        if self._stats is None:
+            async with asyncio.timeout(self.timeout):
+                await self.aexecute_call()
+        return self
+
 
 class PoolingClient(BaseModel):
     """Class for pooling multiple API calls with different query parameters into one object.
@@ -306,28 +1262,113 @@ class PoolingClient(BaseModel):
     ----------
     queries : list of `ParticipantsQueryParams`
         The list of query parameters for the participants endpoint.
+    snapshot : ParticipantsSnapshot, optional
+        A snapshot of the full participants dataset. When given, the queries are answered locally from the snapshot
+        instead of calling the API.
+    cache : ResponseCache, optional
+        A persistent on-disk cache of API responses. When given, responses are served from and stored in the cache.
+    session : Session, optional
+        The session holding the shared, long-lived HTTP clients. Defaults to the process-wide session returned by
+        `egytech_api.session.get_session()`.
+    instrumentation : Instrumentation, optional
+        The instrumentation of the API calls. When given, every call is measured phase by phase and its measurements
+        are passed to the hooks of the instrumentation and aggregated by get_summary().
+    validate_responses : bool
+        Whether to validate every response against the response models (`ParticipantRecord`), parsing and
+        validating the raw JSON in one pass without building model objects. Records with fields of unexpected types or
+        values raise a `pydantic.ValidationError`, so API changes are caught on ingestion. Ignored with `stream`.
+    stream : bool
+        Whether to decode the response incrementally while it downloads, straight into typed column buffers, instead
+        of building the full list of records first. This roughly halves the peak memory of large responses.
+    plan_queries : bool
+        Whether to plan the queries before fetching them: duplicate queries are fetched once, and queries contained in
+        another given query are derived locally by filtering its results instead of being fetched.
+    keys : list of tuple, optional
+        One key per query, e.g. its coordinates in a `QueryGrid`. When given, the aggregated DataFrame is indexed by a
+        MultiIndex made of the key of the originating query followed by the position of the row within its results.
+    key_names : list of str, optional
+        The names of the levels of the query keys.
+    max_workers : int
+        The number of threads fetching the queries concurrently over the thread-safe connection pool of the session.
+        With the default of 1, the queries are fetched one after the other.
+    processes : int, optional
+        The number of worker processes to shard the queries across. When given, every worker process fetches, decodes
+        and types the participants of contiguous shards of the queries, with `max_workers` threads each, and hands
+        them back through shared memory; the shards are merged in the order of the queries. The results are always
+        typed, as with `dtype_backend='numpy_nullable'` unless set otherwise. Queries are not planned, and the API
+        calls made in worker processes are not instrumented.
+    incremental : bool
+        Whether to keep a content fingerprint of the results of every query, so that refresh() only rebuilds the
+        results that changed. Queries are not planned and the cache is not used.
+    dtype_backend : {None, 'numpy_nullable', 'pyarrow'}
+        The dtypes of the aggregated DataFrame. When set, the enum-like columns are categorical with the category sets
+        of the enums and the other columns use nullable NumPy or `pyarrow`-backed dtypes, see `egytech_api.schema`.
+        When None, the dtypes are inferred by pandas.
+    writer : ChunkedWriter, optional
+        A writer the results of every query are appended to as soon as they are available, as one Parquet row group
+        or Arrow record batch with the position of the query in a `query` column.
+    lazy : bool
+        Whether to defer the API calls until the results are first accessed or fetch()/afetch() is called. When False,
+        the API calls are executed on initialization.
     _dataframe : pd.DataFrame
         The resulting pandas.DataFrame of the participants from the API Call. This can be accessed by calling the
         get_df() method on your instance of the class.
+    _fingerprints : list of `Fingerprint`
+        The fingerprint of the results of every query, when `incremental` is set.
+    _counts : list of int
+        The number of rows of the results of every query in the aggregated DataFrame, when `incremental` is set.
 
     Methods
     -------
+    fetch()
+        Executes the API calls unless they have already been executed.
+    afetch()
+        Asynchronously executes the API calls unless they have already been executed.
+    refresh()
+        Fetches the queries again and only rebuilds the results that changed, when `incremental` is set.
+    iter_results(order: str = "input")
+        Yields the participants of every query as soon as it is fetched.
     get_df()
         Returns the pandas.DataFrame of the aggregated participants from all the given queries.
+    get_summary()
+        Returns the aggregated measurements of the API calls, if the client is instrumented.
     save_csv(filename: str="pooled_participants_results")
         Saves the aggregated participants DataFrame to a CSV file.
     save_excel(filename: str="pooled_participants_results")
         Saves the aggregated participants DataFrame to an Excel file.
+    save_parquet(filename: str = "pooled_participants_results", compression: str = "snappy")
+        Saves the aggregated participants DataFrame to a Parquet file.
+    save_feather(filename: str = "pooled_participants_results", compression: str = "zstd")
+        Saves the aggregated participants DataFrame to a Feather file.
 
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
     queries: list[ParticipantsQueryParams] = Field(exclude=True)
+    snapshot: Optional[ParticipantsSnapshot] = Field(default=None, exclude=True)
+    cache: Optional[ResponseCache] = Field(default=None, exclude=True)
+    session: Optional[Session] = Field(default=None, exclude=True)
+    instrumentation: Optional[Instrumentation] = Field(default=None, exclude=True)
+    validate_responses: bool = Field(default=False, exclude=True)
+    stream: bool = Field(default=False, exclude=True)
+    plan_queries: bool = Field(default=False, exclude=True)
+    keys: Optional[list[tuple]] = Field(default=None, exclude=True)
+    key_names: Optional[list[Optional[str]]] = Field(default=None, exclude=True)
+    max_workers: int = Field(default=1, gt=0, exclude=True)
+    processes: Optional[int] = Field(default=None, gt=0, exclude=True)
+    incremental: bool = Field(default=False, exclude=True)
+    dtype_backend: Optional[DtypeBackend] = Field(default=None, exclude=True)
+    writer: Optional[ChunkedWriter] = Field(default=None, exclude=True)
+    lazy: bool = Field(default=False, exclude=True)
     _dataframe: Optional[pd.DataFrame] = None
+    _fingerprints: list[Optional[Fingerprint]] = []
+    _counts: list[int] = []
+    _spans: list[RequestSpan] = []
+    _aggregate_seconds: float = 0.0
 
     def model_post_init(self, __context: Any) -> None:
         """Placeholder that calls make_calls() after initialization of the proper pydantic model for the
-        available query parameters correctly.
+        available query parameters correctly, unless `lazy` is set.
 
         Parameters
         ----------
@@ -338,7 +1379,8 @@ class PoolingClient(BaseModel):
         None
 
         """
-        self.make_calls()
+        if not self.lazy:
+            self.make_calls()
 
     def make_calls(self) -> None:
         """Executes the API calls with the given query parameters.
@@ -348,37 +1390,242 @@ class PoolingClient(BaseModel):
         None
 
         """
-        url = "https://api.egytech.fyi/"
-        headers = {"accept": "application/json"}
+        self._spans = []
+        if self.snapshot is not None:
+            parts = [
+                _write(self.writer, position, self.snapshot.query(query), self.dtype_backend)
+                for position, query in enumerate(self.queries)
+            ]
+        elif self.incremental:
+            self._fingerprints = [None] * len(self.queries)
+            fetched = list(self._fetch_changes())
+            parts = [_write(self.writer, position, part, self.dtype_backend) for position, _, part in fetched]
+            self._counts = [len(part) for part in parts]
+            self._fingerprints = [fingerprint for _, fingerprint, _ in fetched]
+        elif self.processes is not None:
+            parts = [
+                _write(self.writer, position, part, self.dtype_backend)
+                for position, part in enumerate(self._fetch_sharded())
+            ]
+        elif self.plan_queries:
+            plan = QueryPlan.build(self.queries)
+            parts = plan.derive(
+                [_as_frame(part) for part in _map(self._fetch, plan.fetch, self.max_workers)]
+            )
+            missing = [query for query, part in zip(self.queries, parts) if part is None]
+            fetched = _map(self._fetch, missing, self.max_workers)
+            parts = [
+                _write(self.writer, position, next(fetched) if part is None else part, self.dtype_backend)
+                for position, part in enumerate(parts)
+            ]
+        else:
+            parts = [
+                _write(self.writer, position, part, self.dtype_backend)
+                for position, part in enumerate(_map(self._fetch, self.queries, self.max_workers))
+            ]
+
+        started = time.perf_counter()
+        self._dataframe = _typed(
+            _aggregate(parts, self.keys, self.key_names), PARTICIPANTS_SCHEMA, self.dtype_backend
+        )
+        self._aggregate_seconds = time.perf_counter() - started
 
-        with httpx.Client(base_url=url) as client:
-            responses = []
-            for query in self.queries:
-                response = client.get(
-                    "participants",
-                    headers=headers,
-                    params=query.model_dump(
-                        mode="json", exclude_none=True
-                    ),
+    def fetch(self) -> "PoolingClient":
+        """Executes the API calls unless they have already been executed.
+
+        Returns
+        -------
+        PoolingClient
+            The instance itself, so calls can be chained.
+
+        """
+        if self._dataframe is None:
+            self.make_calls()
+        return self
+
+    async def afetch(self) -> "PoolingClient":
+        """Executes the API calls in a worker thread unless they have already been executed, without blocking the
+        running event loop.
+
+        Returns
+        -------
+        PoolingClient
+            The instance itself, so calls can be chained.
+
+        """
+        if self._dataframe is None:
+            await asyncio.to_thread(self.make_calls)
+        return self
+
+    def refresh(self) -> list[ParticipantsQueryParams]:
+        """Fetches the queries again and only rebuilds the results that changed since the previous fetch, executing
+        the API calls first if they are deferred.
+
+        Every query is fetched conditionally on the fingerprint of its previous results (see `Fingerprint`). Unchanged
+        results are neither decoded nor rebuilt, and the rows of the changed ones are replaced in place in the
+        aggregated DataFrame, so a refresh of unchanged results costs little more than the requests themselves. Results
+        are not appended to the writer.
+
+        Returns
+        -------
+        list of `ParticipantsQueryParams`
+            The queries whose results changed, in the order of the given queries. All of them on the first fetch.
+
+        Raises
+        ------
+        ValueError
+            If `incremental` is not set or the queries are answered from a snapshot.
+        """
+        if not self.incremental or self.snapshot is not None:
+            raise ValueError("refresh() requires incremental=True and no snapshot")
+        if self._dataframe is None:
+            self.make_calls()
+            return list(self.queries)
+
+        self._spans = []
+        fetched = list(self._fetch_changes())
+        changes = {position: part for position, _, part in fetched if part is not None}
+        if changes:
+            started = time.perf_counter()
+            self._dataframe = self._patch(changes)
+            self._aggregate_seconds = time.perf_counter() - started
+        # Committed only once the results are patched, so that the changes fetched before a failed call are fetched
+        # again by the next refresh instead of being taken as seen.
+        for position, fingerprint, _ in fetched:
+            self._fingerprints[position] = fingerprint
+        return [self.queries[position] for position in changes]
+
+    def _fetch_changes(
+            self,
+    ) -> Iterator[tuple[int, Fingerprint, Optional[Union[list[Dict[str, Any]], pd.DataFrame]]]]:
+        """Fetches every query conditionally on its fingerprint, and yields the position of every query with the
+        fingerprint of its response and its new results, or None when they are unchanged. The fingerprints are left
+        to the caller to update."""
+        client = _session(self.session).client()
+
+        def fetch_changed(
+                position: int,
+        ) -> tuple[int, Fingerprint, Optional[Union[list[Dict[str, Any]], pd.DataFrame]]]:
+            params = encode_query(self.queries[position])
+            with probe_call(self.instrumentation, "participants", params, self._spans) as probe:
+                fingerprint, response = _get_changed(
+                    "participants", params, client, self._fingerprints[position], probe
                 )
+                if response is None:
+                    return position, fingerprint, None
+                if self.stream:
+                    part = read_frame([response.content])
+                else:
+                    part = _decode("participants", response.content, self.validate_responses)["results"]
+                probe.mark("decode")
+                return position, fingerprint, part
+
+        return _map(fetch_changed, range(len(self.queries)), self.max_workers)
+
+    def _patch(self, changes: Dict[int, Union[list[Dict[str, Any]], pd.DataFrame]]) -> pd.DataFrame:
+        """Returns the aggregated DataFrame with the rows of the queries at the given positions replaced by their new
+        results, keeping the rows of the other queries as they are."""
+        offsets = np.concatenate([[0], np.cumsum(self._counts, dtype=np.intp)])
+        pieces, start = [], 0
+        for position, part in sorted(changes.items()):
+            pieces.append(self._dataframe.iloc[offsets[start]:offsets[position]])
+            keys = None if self.keys is None else [self.keys[position]]
+            frame = _typed(_aggregate([part], keys, self.key_names), PARTICIPANTS_SCHEMA, self.dtype_backend)
+            pieces.append(frame)
+            self._counts[position] = len(frame)
+            start = position + 1
+        pieces.append(self._dataframe.iloc[offsets[start]:])
+        pieces = [piece for piece in pieces if not piece.columns.empty] or [pd.DataFrame()]
+        return pd.concat(pieces, ignore_index=self.keys is None)
+
+    def iter_results(
+            self, order: Literal["input", "completion"] = "input"
+    ) -> Iterator[tuple[ParticipantsQueryParams, pd.DataFrame]]:
+        """Fetches the queries and yields the results of every query as soon as it is fetched, instead of aggregating
+        them into one DataFrame.
+
+        Only the results of the current query, and of up to `max_workers` queries fetched ahead, are held in memory.
+        The aggregated DataFrame is not populated; construct the client with `lazy=True` to only iterate. Queries are
+        not planned.
+
+        Parameters
+        ----------
+        order : {'input', 'completion'}
+            Whether to yield the results in the order of the given queries or in the order the calls complete.
+
+        Yields
+        ------
+        tuple of `ParticipantsQueryParams` and `pd.DataFrame`
+            Every query with its participants.
+
+        Examples
+        --------
+        >>> client = PoolingClient(queries=queries, max_workers=8, lazy=True)
+        >>> for query, participants in client.iter_results(order="completion"):
+        ...     process(query, participants)
+        """
+        if self.snapshot is not None:
+            results = ((query, self.snapshot.query(query)) for query in self.queries)
+        else:
+            results = _map(
+                lambda query: (query, self._fetch(query)), self.queries, self.max_workers, ordered=order == "input"
+            )
+        for query, part in results:
+            yield query, _typed(_as_frame(part), PARTICIPANTS_SCHEMA, self.dtype_backend)
+
+    def _fetch_sharded(self) -> Iterator[pd.DataFrame]:
+        """Fetches the queries in `processes` worker processes and yields the typed participants of every query, in
+        order, as slices of the participants of its shard."""
+        # Imported here so that importing the clients does not import `multiprocessing`.
+        from .sharding import fetch_sharded_queries
+
+        return fetch_sharded_queries(
+            [encode_query(query) for query in self.queries],
+            self.processes,
+            _session(self.session).model_dump(),
+            self.cache,
+            self.stream,
+            self.max_workers,
+            self.validate_responses,
+        )
 
-                if response.status_code != 200:
-                    raise Exception("Unsuccessful API Call")
+    def _fetch(
+            self, query: ParticipantsQueryParams
+    ) -> Union[list[Dict[str, Any]], pd.DataFrame]:
+        params, session = encode_query(query), _session(self.session)
+        client = session.client()
+        with probe_call(self.instrumentation, "participants", params, self._spans) as probe:
+            if self.stream:
+                return _stream_frame("participants", params, client, self.cache, probe, session.flights())
+            return _get_json(
+                "participants", params, client, self.cache, probe, session.flights(), self.validate_responses
+            )["results"]
+
+    def get_summary(self) -> Optional[InstrumentationSummary]:
+        """Returns the aggregated measurements of the API calls, executing them first if they are deferred.
 
-                deser_response = response.json()
-                responses.extend(list(deser_response.values())[-1])
+        Returns
+        -------
+        InstrumentationSummary or None
+            The summary, or None when the client is not instrumented.
 
-        self._dataframe = pd.DataFrame.from_records(responses)
+        """
+        self.fetch()
+        if self.instrumentation is None:
+            return None
+        # The calls are not retried, see the `retries` attribute of the summary.
+        return InstrumentationSummary.from_spans(self._spans, aggregate_seconds=self._aggregate_seconds)
 
     def get_df(self) -> pd.DataFrame:
-        """Returns the pandas.DataFrame of the aggregated participants from all the given queries.
+        """Returns the pandas.DataFrame of the aggregated participants from all the given queries, executing the API
+        calls first if they are deferred.
 
         Returns
         -------
         pd.DataFrame
 
         """
-        return self._dataframe
+        return self.fetch()._dataframe
 
     def save_csv(
             self, filename: str = "pooled_participants_results"
@@ -396,7 +1643,7 @@ class PoolingClient(BaseModel):
         None
 
         """
-        self._dataframe.to_csv(filename + ".csv", index=False)
+        self.get_df().to_csv(filename + ".csv", index=False)
 
     def save_excel(
             self, filename: str = "pooled_participants_results"
@@ -414,10 +1661,52 @@ class PoolingClient(BaseModel):
         None
 
         """
-        self._dataframe.to_excel(
+        self.get_df().to_excel(
             filename + ".xlsx", index=False, engine="xlsxwriter"
         )
 
+    def save_parquet(
+            self, filename: str = "pooled_participants_results", compression: Optional[str] = "snappy"
+    ) -> None:
+        """Saves the aggregated participants DataFrame to a Parquet file, keeping its dtypes and index. This requires
+        the optional `pyarrow` dependency.
+
+        Parameters
+        ----------
+        filename : str = "pooled_participants_results"
+            The filename to save the Parquet file to. This should not include the file extension.
+            Example: "participants" would lead to a file named "participants.parquet".
+        compression : {'snappy', 'zstd', 'gzip', 'brotli', 'lz4', None}
+            The compression codec.
+
+        Returns
+        -------
+        None
+
+        """
+        save_parquet(self.get_df(), filename, compression)
+
+    def save_feather(
+            self, filename: str = "pooled_participants_results", compression: Optional[str] = "zstd"
+    ) -> None:
+        """Saves the aggregated participants DataFrame to a Feather (Arrow IPC) file, keeping its dtypes and index. This
+        requires the optional `pyarrow` dependency.
+
+        Parameters
+        ----------
+        filename : str = "pooled_participants_results"
+            The filename to save the Feather file to. This should not include the file extension.
+            Example: "participants" would lead to a file named "participants.feather".
+        compression : {'zstd', 'lz4', None}
+            The compression codec.
+
+        Returns
+        -------
+        None
+
+        """
+        save_feather(self.get_df(), filename, compression)
+
 
 class AsyncPoolingClient(BaseModel):
     """Class for asynchronously pooling multiple API calls with different query parameters into one object.
@@ -426,27 +1715,110 @@ class AsyncPoolingClient(BaseModel):
     ----------
     queries : list of `ParticipantsQueryParams`
         The list of query parameters for the participants endpoint.
+    snapshot : ParticipantsSnapshot, optional
+        A snapshot of the full participants dataset. When given, the queries are answered locally from the snapshot
+        instead of calling the API.
+    cache : ResponseCache, optional
+        A persistent on-disk cache of API responses. When given, responses are served from and stored in the cache.
+    session : Session, optional
+        The session holding the shared, long-lived HTTP clients. Defaults to the process-wide session returned by
+        `egytech_api.session.get_session()`.
+    instrumentation : Instrumentation, optional
+        The instrumentation of the API calls. When given, every call is measured phase by phase and its measurements
+        are passed to the hooks of the instrumentation and aggregated by get_summary().
+    validate_responses : bool
+        Whether to validate every response against the response models (`ParticipantRecord`), parsing and
+        validating the raw JSON in one pass without building model objects. Records with fields of unexpected types or
+        values raise a `pydantic.ValidationError`, so API changes are caught on ingestion. Ignored with `stream`.
+    stream : bool
+        Whether to decode the responses incrementally while they download, straight into typed column buffers,
+        instead of building the full list of records first. This roughly halves the peak memory of large responses.
+    plan_queries : bool
+        Whether to plan the queries before fetching them: duplicate queries are fetched once, and queries contained in
+        another given query are derived locally by filtering its results instead of being fetched.
+    keys : list of tuple, optional
+        One key per query, e.g. its coordinates in a `QueryGrid`. When given, the aggregated DataFrame is indexed by a
+        MultiIndex made of the key of the originating query followed by the position of the row within its results.
+    key_names : list of str, optional
+        The names of the levels of the query keys.
+    scheduler : Scheduler
+        The scheduler running the API calls, controlling the number of calls in flight, the rate limit and retries.
+    processes : int, optional
+        The number of worker processes to shard the queries across, like the `processes` option of `PoolingClient`.
+        When given, every worker process fetches, decodes and types the participants of contiguous shards of the
+        queries with up to `scheduler.max_in_flight` threads, while the event loop waits on the pool in a worker
+        thread. The results are always typed, as with `dtype_backend='numpy_nullable'` unless set otherwise. Queries
+        are not planned, the rate limit and retries of the scheduler do not apply, the API calls made in worker
+        processes are not instrumented, and the error of a failed shard is raised whatever `raise_on_error`.
+    raise_on_error : bool
+        Whether to raise the error of the first failed query. When False, failed queries are left out of the
+        resulting DataFrame and reported by get_report().
+    dtype_backend : {None, 'numpy_nullable', 'pyarrow'}
+        The dtypes of the aggregated DataFrame. When set, the enum-like columns are categorical with the category sets
+        of the enums and the other columns use nullable NumPy or `pyarrow`-backed dtypes, see `egytech_api.schema`.
+        When None, the dtypes are inferred by pandas.
+    writer : ChunkedWriter, optional
+        A writer the results of every query are appended to as soon as they are available, as one Parquet row group
+        or Arrow record batch with the position of the query in a `query` column.
+    lazy : bool
+        Whether to defer the API calls until the results are first accessed or fetch()/afetch() is called. When False,
+        the API calls are executed on initialization.
     _dataframe : pd.DataFrame
         The resulting pandas.DataFrame of the participants from the API Call.
+    _report : list of `QueryResult`
+        The outcome of every API call, in the order of the given queries (of the fetched queries when `plan_queries`
+        is set). This can be accessed by calling the get_report() method on your instance of the class.
 
     Methods
     -------
+    fetch()
+        Executes the API calls unless they have already been executed.
+    afetch()
+        Asynchronously executes the API calls unless they have already been executed.
+    aiter_results(order: str = "input")
+        Asynchronously yields the participants of every query as soon as they are available.
     get_df()
         Returns the `pandas.DataFrame` of the aggregated participants from all the given queries.
+    get_report()
+        Returns the outcome of every query, including the errors of failed queries.
+    get_summary()
+        Returns the aggregated measurements of the API calls, if the client is instrumented.
     save_csv(filename: str = "pooled_async_participants_results")
         Saves the aggregated participants DataFrame to a CSV file.
     save_excel(filename: str = "pooled_async_participants_results")
         Saves the aggregated participants DataFrame to an Excel file.
+    save_parquet(filename: str = "pooled_async_participants_results", compression: str = "snappy")
+        Saves the aggregated participants DataFrame to a Parquet file.
+    save_feather(filename: str = "pooled_async_participants_results", compression: str = "zstd")
+        Saves the aggregated participants DataFrame to a Feather file.
 
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
     queries: list[ParticipantsQueryParams] = Field(exclude=True)
+    snapshot: Optional[ParticipantsSnapshot] = Field(default=None, exclude=True)
+    cache: Optional[ResponseCache] = Field(default=None, exclude=True)
+    session: Optional[Session] = Field(default=None, exclude=True)
+    instrumentation: Optional[Instrumentation] = Field(default=None, exclude=True)
+    validate_responses: bool = Field(default=False, exclude=True)
+    stream: bool = Field(default=False, exclude=True)
+    plan_queries: bool = Field(default=False, exclude=True)
+    keys: Optional[list[tuple]] = Field(default=None, exclude=True)
+    key_names: Optional[list[Optional[str]]] = Field(default=None, exclude=True)
+    scheduler: Scheduler = Field(default_factory=Scheduler, exclude=True)
+    processes: Optional[int] = Field(default=None, gt=0, exclude=True)
+    raise_on_error: bool = Field(default=False, exclude=True)
+    dtype_backend: Optional[DtypeBackend] = Field(default=None, exclude=True)
+    writer: Optional[ChunkedWriter] = Field(default=None, exclude=True)
+    lazy: bool = Field(default=False, exclude=True)
     _dataframe: Optional[pd.DataFrame] = None
+    _report: Optional[list[QueryResult]] = None
+    _spans: list[RequestSpan] = []
+    _aggregate_seconds: float = 0.0
 
     def model_post_init(self, __context: Any) -> None:
         """Placeholder that calls make_calls() after initialization of the proper pydantic model for the
-        available query parameters correctly.
+        available query parameters correctly, unless `lazy` is set.
 
         Parameters
         ----------
@@ -457,7 +1829,8 @@ class AsyncPoolingClient(BaseModel):
         None
 
         """
-        asyncio.run(self.make_calls())
+        if not self.lazy:
+            _run(self.make_calls, self.session)
 
     async def make_calls(self) -> None:
         """Asynchronously Executes the API calls with the given query parameters.
@@ -467,39 +1840,226 @@ class AsyncPoolingClient(BaseModel):
         None
 
         """
-
-        async def make_single_call(
-                query: ParticipantsQueryParams, c: httpx.AsyncClient
-        ) -> list[Dict[str, Any]]:
-            response = await c.get(
-                "participants",
-                params=query.model_dump(mode="json", exclude_none=True),
+        self._spans = []
+        if self.snapshot is not None:
+            parts = [self.snapshot.query(query) for query in self.queries]
+            for position, part in enumerate(parts):
+                _write(self.writer, position, part, self.dtype_backend)
+            self._dataframe = _typed(
+                _aggregate(parts, self.keys, self.key_names), PARTICIPANTS_SCHEMA, self.dtype_backend
             )
-            if response.status_code != 200:
-                raise Exception("Unsuccessful API Call")
-            return response.json()["results"]
+            return
+
+        make_single_call = functools.partial(self._fetch, _session(self.session))
+
+        if self.processes is not None:
+            # The pool is waited on in a worker thread, so that the running event loop is not blocked.
+            parts = await asyncio.to_thread(list, self._fetch_sharded())
+            self._report = [
+                QueryResult(query=query, value=part, attempts=1) for query, part in zip(self.queries, parts)
+            ]
+            for position, part in enumerate(parts):
+                _write(self.writer, position, part, self.dtype_backend)
+        elif self.plan_queries:
+            parts = await self._make_planned_calls(make_single_call)
+            for position, part in enumerate(parts):
+                _write(self.writer, position, part, self.dtype_backend)
+        else:
+            if self.writer is None:
+                self._report = await self.scheduler.run(make_single_call, self.queries)
+            else:
+                async def make_written_call(position: int) -> Union[list[Dict[str, Any]], pd.DataFrame]:
+                    part = await make_single_call(self.queries[position])
+                    return _write(self.writer, position, part, self.dtype_backend)
+
+                # Scheduled by position, so that every call writes to the slot of its query even when a query is
+                # given more than once.
+                self._report = await self.scheduler.run(make_written_call, range(len(self.queries)))
+                for result in self._report:
+                    result.query = self.queries[result.query]
+            self._raise_on_error()
+            parts = [result.value if result.ok else None for result in self._report]
+
+        started = time.perf_counter()
+        self._dataframe = _typed(
+            _aggregate(parts, self.keys, self.key_names), PARTICIPANTS_SCHEMA, self.dtype_backend
+        )
+        self._aggregate_seconds = time.perf_counter() - started
+
+    def fetch(self) -> "AsyncPoolingClient":
+        """Executes the API calls in a new event loop unless they have already been executed.
+
+        Returns
+        -------
+        AsyncPoolingClient
+            The instance itself, so calls can be chained.
+
+        """
+        if self._dataframe is None:
+            _run(self.make_calls, self.session)
+        return self
+
+    async def afetch(self) -> "AsyncPoolingClient":
+        """Asynchronously executes the API calls on the running event loop unless they have already been executed.
+
+        Returns
+        -------
+        AsyncPoolingClient
+            The instance itself, so calls can be chained.
+
+        """
+        if self._dataframe is None:
+            await self.make_calls()
+        return self
+
+    async def _fetch(
+            self, session: Session, query: ParticipantsQueryParams
+    ) -> Union[list[Dict[str, Any]], pd.DataFrame]:
+        params, client = encode_query(query), session.async_client()
+        with probe_call(self.instrumentation, "participants", params, self._spans) as probe:
+            if self.stream:
+                return await _astream_frame("participants", params, client, self.cache, probe, session.flights())
+            deser_response = await _aget_json(
+                "participants", params, client, self.cache, probe, session.flights(), self.validate_responses
+            )
+            return deser_response["results"]
+
+    def _fetch_sharded(self) -> Iterator[pd.DataFrame]:
+        """Fetches the queries in `processes` worker processes and yields the typed participants of every query, in
+        order, as slices of the participants of its shard."""
+        # Imported here so that importing the clients does not import `multiprocessing`.
+        from .sharding import fetch_sharded_queries
+
+        return fetch_sharded_queries(
+            [encode_query(query) for query in self.queries],
+            self.processes,
+            _session(self.session).model_dump(),
+            self.cache,
+            self.stream,
+            self.scheduler.max_in_flight,
+            self.validate_responses,
+        )
+
+    async def aiter_results(
+            self, order: Literal["input", "completion"] = "input"
+    ) -> AsyncIterator[tuple[ParticipantsQueryParams, Optional[pd.DataFrame]]]:
+        """Asynchronously fetches the queries on the running event loop and yields the results of every query as soon
+        as they are available, instead of aggregating them into one DataFrame.
+
+        At most `scheduler.max_in_flight` calls run ahead of the consumer and new calls only start as results are
+        consumed, so memory does not grow with the number of queries. The aggregated DataFrame and the report are not
+        populated; construct the client with `lazy=True` to only iterate. Queries are not planned.
+
+        Parameters
+        ----------
+        order : {'input', 'completion'}
+            Whether to yield the results in the order of the given queries or in the order the calls complete.
+
+        Yields
+        ------
+        tuple of `ParticipantsQueryParams` and `pd.DataFrame`
+            Every query with its participants. The DataFrame is None for failed queries, unless `raise_on_error` is
+            set, in which case the error is raised.
+
+        Examples
+        --------
+        >>> client = AsyncPoolingClient(queries=queries, lazy=True)
+        >>> async for query, participants in client.aiter_results(order="completion"):
+        ...     process(query, participants)
+        """
+        if self.snapshot is not None:
+            for query in self.queries:
+                yield query, _typed(self.snapshot.query(query), PARTICIPANTS_SCHEMA, self.dtype_backend)
+            return
 
-        headers = {"accept": "application/json"}
-        client = httpx.AsyncClient(
-            base_url="https://api.egytech.fyi/", headers=headers
+        results = self.scheduler.iterate(
+            functools.partial(self._fetch, _session(self.session)),
+            self.queries,
+            ordered=order == "input",
         )
-        responses = await asyncio.gather(
-            *map(make_single_call, self.queries, itertools.repeat(client))
+        async with contextlib.aclosing(results):
+            async for result in results:
+                if result.ok:
+                    yield result.query, _typed(
+                        _as_frame(result.value), PARTICIPANTS_SCHEMA, self.dtype_backend
+                    )
+                elif self.raise_on_error:
+                    raise result.error
+                else:
+                    yield result.query, None
+
+    async def _make_planned_calls(
+            self, make_single_call: Callable[[ParticipantsQueryParams], Awaitable[Any]]
+    ) -> list[Optional[pd.DataFrame]]:
+        plan = QueryPlan.build(self.queries)
+        self._report = await self.scheduler.run(make_single_call, plan.fetch)
+        self._raise_on_error()
+
+        failed = {index for index, result in enumerate(self._report) if not result.ok}
+        parts = plan.derive(
+            [_as_frame(result.value if result.ok else []) for result in self._report]
         )
-        results = itertools.chain(*responses)
-        await client.aclose()
+        missing = [
+            index for index, (part, source) in enumerate(zip(parts, plan.sources))
+            if part is None and source not in failed
+        ]
+
+        if missing:
+            report = await self.scheduler.run(
+                make_single_call, [self.queries[index] for index in missing]
+            )
+            self._report.extend(report)
+            self._raise_on_error()
+            for index, result in zip(missing, report):
+                parts[index] = result.value if result.ok else None
+
+        return [
+            None if source in failed else part
+            for part, source in zip(parts, plan.sources)
+        ]
+
+    def _raise_on_error(self) -> None:
+        if self.raise_on_error:
+            for result in self._report:
+                if not result.ok:
+                    raise result.error
+
+    def get_report(self) -> list[QueryResult]:
+        """Returns the outcome of every query, in the order of the given queries, executing the API calls first if
+        they are deferred.
+
+        Returns
+        -------
+        list of `QueryResult`
+
+        """
+        return self.fetch()._report
+
+    def get_summary(self) -> Optional[InstrumentationSummary]:
+        """Returns the aggregated measurements of the API calls, executing them first if they are deferred.
+
+        Returns
+        -------
+        InstrumentationSummary or None
+            The summary, or None when the client is not instrumented.
 
-        self._dataframe = pd.DataFrame.from_records(results)
+        """
+        self.fetch()
+        if self.instrumentation is None:
+            return None
+        retries = sum(max(result.attempts - 1, 0) for result in self._report or [])
+        return InstrumentationSummary.from_spans(self._spans, retries, self._aggregate_seconds)
 
     def get_df(self) -> pd.DataFrame:
-        """Returns the pandas.DataFrame of the aggregated participants from all the given queries.
+        """Returns the pandas.DataFrame of the aggregated participants from all the given queries, executing the API
+        calls first if they are deferred.
 
         Returns
         -------
         pd.DataFrame
 
         """
-        return self._dataframe
+        return self.fetch()._dataframe
 
     def save_csv(self, filename: str) -> None:
         """Saves the aggregated participants DataFrame to a CSV file.
@@ -515,7 +2075,7 @@ class AsyncPoolingClient(BaseModel):
         None
 
         """
-        self._dataframe.to_csv(filename + ".csv", index=False)
+        self.get_df().to_csv(filename + ".csv", index=False)
 
     def save_excel(self, filename: str) -> None:
         """Saves the aggregated participants DataFrame to an Excel file.
@@ -531,6 +2091,650 @@ class AsyncPoolingClient(BaseModel):
         None
 
         """
-        self._dataframe.to_excel(
+        self.get_df().to_excel(
             filename + ".xlsx", index=False, engine="xlsxwriter"
         )
+
+    def save_parquet(
+            self, filename: str = "pooled_async_participants_results", compression: Optional[str] = "snappy"
+    ) -> None:
+        """Saves the aggregated participants DataFrame to a Parquet file, keeping its dtypes and index. This requires
+        the optional `pyarrow` dependency.
+
+        Parameters
+        ----------
+        filename : str = "pooled_async_participants_results"
+            The filename to save the Parquet file to. This should not include the file extension.
+            Example: "participants" would lead to a file named "participants.parquet".
+        compression : {'snappy', 'zstd', 'gzip', 'brotli', 'lz4', None}
+            The compression codec.
+
+        Returns
+        -------
+        None
+
+        """
+        save_parquet(self.get_df(), filename, compression)
+
+    def save_feather(
+            self, filename: str = "pooled_async_participants_results", compression: Optional[str] = "zstd"
+    ) -> None:
+        """Saves the aggregated participants DataFrame to a Feather (Arrow IPC) file, keeping its dtypes and index. This
+        requires the optional `pyarrow` dependency.
+
+        Parameters
+        ----------
+        filename : str = "pooled_async_participants_results"
+            The filename to save the Feather file to. This should not include the file extension.
+            Example: "participants" would lead to a file named "participants.feather".
+        compression : {'zstd', 'lz4', None}
+            The compression codec.
+
+        Returns
+        -------
+        None
+
+        """
+        save_feather(self.get_df(), filename, compression)
+
+
+class StatsPoolingClient(BaseModel):
+    """Class for pooling multiple stats API calls with different query parameters into one object.
+
+    Attributes
+    ----------
+    queries : list of `StatsQueryParams`
+        The list of query parameters for the stats endpoint.
+    cube : StatsCube, optional
+        A cube of the aggregates of a participants snapshot. When given, the queries are answered locally from the
+        cube instead of calling the API. Queries on `programming_language` are not supported.
+    cache : ResponseCache, optional
+        A persistent on-disk cache of API responses. When given, responses are served from and stored in the cache.
+    session : Session, optional
+        The session holding the shared, long-lived HTTP clients. Defaults to the process-wide session returned by
+        `egytech_api.session.get_session()`.
+    instrumentation : Instrumentation, optional
+        The instrumentation of the API calls. When given, every call is measured phase by phase and its measurements
+        are passed to the hooks of the instrumentation and aggregated by get_summary().
+    validate_responses : bool
+        Whether to validate every response against the response models (`StatsSummary` and `Bucket`), parsing and
+        validating the raw JSON in one pass without building model objects. Statistics or buckets with fields of
+        unexpected types or values raise a `pydantic.ValidationError`, so API changes are caught on ingestion.
+    keys : list of tuple, optional
+        One key per query, e.g. its coordinates in a `QueryGrid`. The resulting DataFrames are indexed by the key of
+        the originating query, which defaults to its position in `queries`.
+    key_names : list of str, optional
+        The names of the levels of the query keys.
+    max_workers : int
+        The number of threads fetching the queries concurrently over the thread-safe connection pool of the session.
+        With the default of 1, the queries are fetched one after the other.
+    dtype_backend : {None, 'numpy_nullable', 'pyarrow'}
+        The dtypes of the resulting DataFrames. When set, the columns use nullable NumPy or `pyarrow`-backed dtypes
+        and the buckets are categorical, see `egytech_api.schema`. When None, the dtypes are inferred by pandas.
+    lazy : bool
+        Whether to defer the API calls until the results are first accessed or fetch()/afetch() is called. When False,
+        the API calls are executed on initialization.
+    _stats : pd.DataFrame
+        One row of statistics per query. This can be accessed by calling the get_stats() method on your instance of
+        the class.
+    _buckets : pd.DataFrame
+        The concatenated buckets of compensation of all the queries. This can be accessed by calling the get_df()
+        method on your instance of the class.
+
+    Methods
+    -------
+    fetch()
+        Executes the API calls unless they have already been executed.
+    afetch()
+        Asynchronously executes the API calls unless they have already been executed.
+    get_stats()
+        Returns the pandas.DataFrame of the statistics of every query.
+    get_df()
+        Returns the pandas.DataFrame of the buckets of every query.
+    get_summary()
+        Returns the aggregated measurements of the API calls, if the client is instrumented.
+    save_csv(filename: str = "pooled_buckets_results")
+        Saves the buckets DataFrame to a CSV file.
+    save_excel(filename: str = "pooled_buckets_results")
+        Saves the buckets DataFrame to an Excel file.
+    save_parquet(filename: str = "pooled_buckets_results", compression: str = "snappy")
+        Saves the buckets DataFrame to a Parquet file.
+    save_feather(filename: str = "pooled_buckets_results", compression: str = "zstd")
+        Saves the buckets DataFrame to a Feather file.
+
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
+    queries: list[StatsQueryParams] = Field(exclude=True)
+    cube: Optional[StatsCube] = Field(default=None, exclude=True)
+    cache: Optional[ResponseCache] = Field(default=None, exclude=True)
+    session: Optional[Session] = Field(default=None, exclude=True)
+    instrumentation: Optional[Instrumentation] = Field(default=None, exclude=True)
+    validate_responses: bool = Field(default=False, exclude=True)
+    keys: Optional[list[tuple]] = Field(default=None, exclude=True)
+    key_names: Optional[list[Optional[str]]] = Field(default=None, exclude=True)
+    max_workers: int = Field(default=1, gt=0, exclude=True)
+    dtype_backend: Optional[DtypeBackend] = Field(default=None, exclude=True)
+    lazy: bool = Field(default=False, exclude=True)
+    _stats: Optional[pd.DataFrame] = None
+    _buckets: Optional[pd.DataFrame] = None
+    _spans: list[RequestSpan] = []
+    _aggregate_seconds: float = 0.0
+
+    def model_post_init(self, __context: Any) -> None:
+        """Placeholder that calls make_calls() after initialization of the proper pydantic model for the
+        available query parameters correctly, unless `lazy` is set.
+
+        Parameters
+        ----------
+        __context : Any
+
+        Returns
+        -------
+        None
+
+        """
+        if not self.lazy:
+            self.make_calls()
+
+    def make_calls(self) -> None:
+        """Executes the API calls with the given query parameters over one pooled connection.
+
+        Returns
+        -------
+        None
+
+        """
+        self._spans = []
+        if self.cube is not None:
+            responses = [self.cube.response(query) for query in self.queries]
+        else:
+            session = _session(self.session)
+            client = session.client()
+
+            def make_single_call(query: StatsQueryParams) -> Dict[str, Any]:
+                params = encode_query(query)
+                with probe_call(self.instrumentation, "stats", params, self._spans) as probe:
+                    return _get_json(
+                        "stats", params, client, self.cache, probe, session.flights(), self.validate_responses
+                    )
+
+            responses = list(_map(make_single_call, self.queries, self.max_workers))
+
+        started = time.perf_counter()
+        stats, buckets = _aggregate_stats(responses, self.keys, self.key_names)
+        self._stats = _typed(stats, STATS_SCHEMA, self.dtype_backend)
+        self._buckets = _typed(buckets, BUCKETS_SCHEMA, self.dtype_backend)
+        self._aggregate_seconds = time.perf_counter() - started
+
+    def fetch(self) -> "StatsPoolingClient":
+        """Executes the API calls unless they have already been executed.
+
+        Returns
+        -------
+        StatsPoolingClient
+            The instance itself, so calls can be chained.
+
+        """
+        if self._stats is None:
+            self.make_calls()
+        return self
+
+    async def afetch(self) -> "StatsPoolingClient":
+        """Executes the API calls in a worker thread unless they have already been executed, without blocking the
+        running event loop.
+
+        Returns
+        -------
+        StatsPoolingClient
+            The instance itself, so calls can be chained.
+
+        """
+        if self._stats is None:
+            await asyncio.to_thread(self.make_calls)
+        return self
+
+    def get_stats(self) -> pd.DataFrame:
+        """Returns the pandas.DataFrame of the statistics of every query, executing the API calls first if they are
+        deferred.
+
+        Returns
+        -------
+        pd.DataFrame
+
+        """
+        return self.fetch()._stats
+
+    def get_summary(self) -> Optional[InstrumentationSummary]:
+        """Returns the aggregated measurements of the API calls, executing them first if they are deferred.
+
+        Returns
+        -------
+        InstrumentationSummary or None
+            The summary, or None when the client is not instrumented.
+
+        """
+        self.fetch()
+        if self.instrumentation is None:
+            return None
+        # The calls are not retried, see the `retries` attribute of the summary.
+        return InstrumentationSummary.from_spans(self._spans, aggregate_seconds=self._aggregate_seconds)
+
+    def get_df(self) -> pd.DataFrame:
+        """Returns the pandas.DataFrame of the buckets of every query, executing the API calls first if they are
+        deferred.
+
+        Returns
+        -------
+        pd.DataFrame
+
+        """
+        return self.fetch()._buckets
+
+    def save_csv(self, filename: str = "pooled_buckets_results") -> None:
+        """Saves the buckets DataFrame to a CSV file.
+
+        Parameters
+        ----------
+        filename : str = "pooled_buckets_results"
+            The filename to save the CSV file to. This should not include the file extension.
+            Example: "buckets" would lead to a file named "buckets.csv".
+
+        Returns
+        -------
+        None
+
+        """
+        self.get_df().to_csv(filename + ".csv")
+
+    def save_excel(self, filename: str = "pooled_buckets_results") -> None:
+        """Saves the buckets DataFrame to an Excel file.
+
+        Parameters
+        ----------
+        filename : str = "pooled_buckets_results"
+            The filename to save the Excel file to. This should not include the file extension.
+            Example: "buckets" would lead to a file named "buckets.xlsx".
+
+        Returns
+        -------
+        None
+
+        """
+        self.get_df().to_excel(filename + ".xlsx", engine="xlsxwriter")
+
+    def save_parquet(
+            self, filename: str = "pooled_buckets_results", compression: Optional[str] = "snappy"
+    ) -> None:
+        """Saves the buckets DataFrame to a Parquet file, keeping its dtypes and index. This requires the optional
+        `pyarrow` dependency.
+
+        Parameters
+        ----------
+        filename : str = "pooled_buckets_results"
+            The filename to save the Parquet file to. This should not include the file extension.
+            Example: "buckets" would lead to a file named "buckets.parquet".
+        compression : {'snappy', 'zstd', 'gzip', 'brotli', 'lz4', None}
+            The compression codec.
+
+        Returns
+        -------
+        None
+
+        """
+        save_parquet(self.get_df(), filename, compression)
+
+    def save_feather(
+            self, filename: str = "pooled_buckets_results", compression: Optional[str] = "zstd"
+    ) -> None:
+        """Saves the buckets DataFrame to a Feather (Arrow IPC) file, keeping its dtypes and index. This requires the
+        optional `pyarrow` dependency.
+
+        Parameters
+        ----------
+        filename : str = "pooled_buckets_results"
+            The filename to save the Feather file to. This should not include the file extension.
+            Example: "buckets" would lead to a file named "buckets.feather".
+        compression : {'zstd', 'lz4', None}
+            The compression codec.
+
+        Returns
+        -------
+        None
+
+        """
+        save_feather(self.get_df(), filename, compression)
+
+
+class AsyncStatsPoolingClient(BaseModel):
+    """Class for asynchronously pooling multiple stats API calls with different query parameters into one object.
+
+    Attributes
+    ----------
+    queries : list of `StatsQueryParams`
+        The list of query parameters for the stats endpoint.
+    cube : StatsCube, optional
+        A cube of the aggregates of a participants snapshot. When given, the queries are answered locally from the
+        cube instead of calling the API. Queries on `programming_language` are not supported.
+    cache : ResponseCache, optional
+        A persistent on-disk cache of API responses. When given, responses are served from and stored in the cache.
+    session : Session, optional
+        The session holding the shared, long-lived HTTP clients. Defaults to the process-wide session returned by
+        `egytech_api.session.get_session()`.
+    instrumentation : Instrumentation, optional
+        The instrumentation of the API calls. When given, every call is measured phase by phase and its measurements
+        are passed to the hooks of the instrumentation and aggregated by get_summary().
+    validate_responses : bool
+        Whether to validate every response against the response models (`StatsSummary` and `Bucket`), parsing and
+        validating the raw JSON in one pass without building model objects. Statistics or buckets with fields of
+        unexpected types or values raise a `pydantic.ValidationError`, so API changes are caught on ingestion.
+    keys : list of tuple, optional
+        One key per query, e.g. its coordinates in a `QueryGrid`. The resulting DataFrames are indexed by the key of
+        the originating query, which defaults to its position in `queries`.
+    key_names : list of str, optional
+        The names of the levels of the query keys.
+    scheduler : Scheduler
+        The scheduler running the API calls, controlling the number of calls in flight, the rate limit and retries.
+    raise_on_error : bool
+        Whether to raise the error of the first failed query. When False, failed queries are left out of the
+        resulting DataFrames and reported by get_report().
+    dtype_backend : {None, 'numpy_nullable', 'pyarrow'}
+        The dtypes of the resulting DataFrames. When set, the columns use nullable NumPy or `pyarrow`-backed dtypes
+        and the buckets are categorical, see `egytech_api.schema`. When None, the dtypes are inferred by pandas.
+    lazy : bool
+        Whether to defer the API calls until the results are first accessed or fetch()/afetch() is called. When False,
+        the API calls are executed on initialization.
+    _stats : pd.DataFrame
+        One row of statistics per query. This can be accessed by calling the get_stats() method on your instance of
+        the class.
+    _buckets : pd.DataFrame
+        The concatenated buckets of compensation of all the queries. This can be accessed by calling the get_df()
+        method on your instance of the class.
+    _report : list of `QueryResult`
+        The outcome of every query, in the order of the given queries. This can be accessed by calling the
+        get_report() method on your instance of the class.
+
+    Methods
+    -------
+    fetch()
+        Executes the API calls unless they have already been executed.
+    afetch()
+        Asynchronously executes the API calls unless they have already been executed.
+    get_stats()
+        Returns the pandas.DataFrame of the statistics of every query.
+    get_df()
+        Returns the pandas.DataFrame of the buckets of every query.
+    get_report()
+        Returns the outcome of every query, including the errors of failed queries.
+    get_summary()
+        Returns the aggregated measurements of the API calls, if the client is instrumented.
+    save_csv(filename: str = "pooled_async_buckets_results")
+        Saves the buckets DataFrame to a CSV file.
+    save_excel(filename: str = "pooled_async_buckets_results")
+        Saves the buckets DataFrame to an Excel file.
+    save_parquet(filename: str = "pooled_async_buckets_results", compression: str = "snappy")
+        Saves the buckets DataFrame to a Parquet file.
+    save_feather(filename: str = "pooled_async_buckets_results", compression: str = "zstd")
+        Saves the buckets DataFrame to a Feather file.
+
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
+    queries: list[StatsQueryParams] = Field(exclude=True)
+    cube: Optional[StatsCube] = Field(default=None, exclude=True)
+    cache: Optional[ResponseCache] = Field(default=None, exclude=True)
+    session: Optional[Session] = Field(default=None, exclude=True)
+    instrumentation: Optional[Instrumentation] = Field(default=None, exclude=True)
+    validate_responses: bool = Field(default=False, exclude=True)
+    keys: Optional[list[tuple]] = Field(default=None, exclude=True)
+    key_names: Optional[list[Optional[str]]] = Field(default=None, exclude=True)
+    scheduler: Scheduler = Field(default_factory=Scheduler, exclude=True)
+    raise_on_error: bool = Field(default=False, exclude=True)
+    dtype_backend: Optional[DtypeBackend] = Field(default=None, exclude=True)
+    lazy: bool = Field(default=False, exclude=True)
+    _stats: Optional[pd.DataFrame] = None
+    _buckets: Optional[pd.DataFrame] = None
+    _report: Optional[list[QueryResult]] = None
+    _spans: list[RequestSpan] = []
+    _aggregate_seconds: float = 0.0
+
+    def model_post_init(self, __context: Any) -> None:
+        """Placeholder that calls make_calls() after initialization of the proper pydantic model for the
+        available query parameters correctly, unless `lazy` is set.
+
+        Parameters
+        ----------
+        __context : Any
+
+        Returns
+        -------
+        None
+
+        """
+        if not self.lazy:
+            _run(self.make_calls, self.session)
+
+    async def make_calls(self) -> None:
+        """Asynchronously executes the API calls with the given query parameters over one pooled connection.
+
+        Returns
+        -------
+        None
+
+        """
+        self._spans = []
+        if self.cube is not None:
+            self._report = [QueryResult(query=query, value=self.cube.response(query)) for query in self.queries]
+        else:
+            session = _session(self.session)
+            client = session.async_client()
+
+            async def make_single_call(query: StatsQueryParams) -> Dict[str, Any]:
+                params = encode_query(query)
+                with probe_call(self.instrumentation, "stats", params, self._spans) as probe:
+                    return await _aget_json(
+                        "stats",
+                        params,
+                        client,
+                        self.cache,
+                        probe,
+                        session.flights(),
+                        self.validate_responses,
+                    )
+
+            self._report = await self.scheduler.run(make_single_call, self.queries)
+
+        if self.raise_on_error:
+            for result in self._report:
+                if not result.ok:
+                    raise result.error
+
+        started = time.perf_counter()
+        stats, buckets = _aggregate_stats(
+            [result.value if result.ok else None for result in self._report],
+            self.keys,
+            self.key_names,
+        )
+        self._stats = _typed(stats, STATS_SCHEMA, self.dtype_backend)
+        self._buckets = _typed(buckets, BUCKETS_SCHEMA, self.dtype_backend)
+        self._aggregate_seconds = time.perf_counter() - started
+
+    def fetch(self) -> "AsyncStatsPoolingClient":
+        """Executes the API calls in a new event loop unless they have already been executed.
+
+        Returns
+        -------
+        AsyncStatsPoolingClient
+            The instance itself, so calls can be chained.
+
+        """
+        if self._stats is None:
+            _run(self.make_calls, self.session)
+        return self
+
+    async def afetch(self) -> "AsyncStatsPoolingClient":
+        """Asynchronously executes the API calls on the running event loop unless they have already been executed.
+
+        Returns
+        -------
+        AsyncStatsPoolingClient
+            The instance itself, so calls can be chained.
+
+        """
+        if self._stats is None:
+            await self.make_calls()
+        return self
+
+    def get_stats(self) -> pd.DataFrame:
+        """Returns the pandas.DataFrame of the statistics of every query, executing the API calls first if they are
+        deferred.
+
+        Returns
+        -------
+        pd.DataFrame
+
+        """
+        return self.fetch()._stats
+
+    def get_summary(self) -> Optional[InstrumentationSummary]:
+        """Returns the aggregated measurements of the API calls, executing them first if they are deferred.
+
+        Returns
+        -------
+        InstrumentationSummary or None
+            The summary, or None when the client is not instrumented.
+
+        """
+        self.fetch()
+        if self.instrumentation is None:
+            return None
+        retries = sum(max(result.attempts - 1, 0) for result in self._report or [])
+        return InstrumentationSummary.from_spans(self._spans, retries, self._aggregate_seconds)
+
+    def get_df(self) -> pd.DataFrame:
+        """Returns the pandas.DataFrame of the buckets of every query, executing the API calls first if they are
+        deferred.
+
+        Returns
+        -------
+        pd.DataFrame
+
+        """
+        return self.fetch()._buckets
+
+    def get_report(self) -> list[QueryResult]:
+        """Returns the outcome of every query, in the order of the given queries, executing the API calls first if
+        they are deferred.
+
+        Returns
+        -------
+        list of `QueryResult`
+
+        """
+        return self.fetch()._report
+
+    def save_csv(self, filename: str = "pooled_async_buckets_results") -> None:
+        """Saves the buckets DataFrame to a CSV file.
+
+        Parameters
+        ----------
+        filename : str = "pooled_async_buckets_results"
+            The filename to save the CSV file to. This should not include the file extension.
+            Example: "buckets" would lead to a file named "buckets.csv".
+
+        Returns
+        -------
+        None
+
+        """
+        self.get_df().to_csv(filename + ".csv")
+
+    def save_excel(self, filename: str = "pooled_async_buckets_results") -> None:
+        """Saves the buckets DataFrame to an Excel file.
+
+        Parameters
+        ----------
+        filename : str = "pooled_async_buckets_results"
+            The filename to save the Excel file to. This should not include the file extension.
+            Example: "buckets" would lead to a file named "buckets.xlsx".
+
+        Returns
+        -------
+        None
+
+        """
+        self.get_df().to_excel(filename + ".xlsx", engine="xlsxwriter")
+
+    def save_parquet(
+            self, filename: str = "pooled_async_buckets_results", compression: Optional[str] = "snappy"
+    ) -> None:
+        """Saves the buckets DataFrame to a Parquet file, keeping its dtypes and index. This requires the optional
+        `pyarrow` dependency.
+
+        Parameters
+        ----------
+        filename : str = "pooled_async_buckets_results"
+            The filename to save the Parquet file to. This should not include the file extension.
+            Example: "buckets" would lead to a file named "buckets.parquet".
+        compression : {'snappy', 'zstd', 'gzip', 'brotli', 'lz4', None}
+            The compression codec.
+
+        Returns
+        -------
+        None
+
+        """
+        save_parquet(self.get_df(), filename, compression)
+
+    def save_feather(
+            self, filename: str = "pooled_async_buckets_results", compression: Optional[str] = "zstd"
+    ) -> None:
+        """Saves the buckets DataFrame to a Feather (Arrow IPC) file, keeping its dtypes and index. This requires the
+        optional `pyarrow` dependency.
+
+        Parameters
+        ----------
+        filename : str = "pooled_async_buckets_results"
+            The filename to save the Feather file to. This should not include the file extension.
+            Example: "buckets" would lead to a file named "buckets.feather".
+        compression : {'zstd', 'lz4', None}
+            The compression codec.
+
+        Returns
+        -------
+        None
+
+        """
+        save_feather(self.get_df(), filename, compression)
+
+
+def fetch_all(clients: Iterable[BaseModel]) -> list[BaseModel]:
+    """Executes the deferred API calls of many lazily constructed objects together, in one event loop.
+
+    The calls of all the objects run concurrently over the shared connection pool of their sessions, instead of one
+    object at a time.
+
+    Parameters
+    ----------
+    clients : Iterable of `Participants`, `Stats` or pooling clients
+        The objects to fetch, typically constructed with `lazy=True`. Objects that have already been fetched are left
+        untouched.
+
+    Returns
+    -------
+    list of `Participants`, `Stats` or pooling clients
+        The given objects, in the same order.
+
+    Examples
+    --------
+    >>> deferred = [Participants(title=title, lazy=True) for title in ("backend", "frontend")]
+    >>> fetch_all(deferred)
+    >>> frames = [participants.get_df() for participants in deferred]
+    """
+    clients = list(clients)
+
+    async def make_calls() -> None:
+        await asyncio.gather(*(client.afetch() for client in clients))
+
+    _run(make_calls, *(client.session for client in clients))
+    return clients
@@ -0,0 +1,207 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, Field
+
+from .models import StatsQueryParams
+from .planner import normalize
+from .schema import PARTICIPANTS_SCHEMA, apply_schema
+from .snapshot import CATEGORICAL_COLUMNS, EXCLUSION_COLUMNS, ParticipantsSnapshot
+
+DIMENSIONS = [*CATEGORICAL_COLUMNS, "yoe", "cs_degree", *EXCLUSION_COLUMNS.values()]
+"""The participant record columns the cube is split along, one per filter of `ParticipantsQueryParams`."""
+
+STATS_QUANTILES = {
+    "median": 0.5,
+    "p20Compensation": 0.2,
+    "p75Compensation": 0.75,
+    "p90Compensation": 0.9,
+}
+"""The compensation percentiles of the stats of the API, by the name of their key."""
+
+
+def _label(low: float, high: Optional[float]) -> str:
+    def short(value: float) -> str:
+        return f"{value / 1000:g}K" if value else "0"
+
+    return f"{short(low)}+" if high is None else f"{short(low)}-{short(high)}"
+
+
+class StatsCube(BaseModel):
+    """Class that precomputes the aggregates of a participants snapshot to answer stats queries locally.
+
+    The participants are grouped once into cells, one per distinct combination of the filtered columns, holding their
+    count and compensation histogram. The compensations are sorted once, tagged with their cell. A stats query then
+    selects the matching cells with a vectorized mask over the cells, sums their counts and histograms, and reads the
+    percentiles off the already sorted compensations of the selected cells, without any HTTP round-trip. Answers
+    are memoized per distinct query.
+
+    Attributes
+    ----------
+    snapshot : ParticipantsSnapshot
+        The snapshot of the full participants dataset to aggregate.
+    bucket_size : float
+        The width of the compensation buckets. Ignored when `bucket_edges` is given.
+    bucket_edges : list of float, optional
+        The lower edges of the compensation buckets, in increasing order. The last bucket is open-ended.
+    cache_size : int
+        The maximum number of memoized answers.
+    _cells : ParticipantsSnapshot
+        The filtered columns of every cell, masked with the semantics of the API.
+    _counts : np.ndarray
+        The number of participants of every cell.
+    _histograms : np.ndarray
+        The number of participants of every cell in every compensation bucket.
+    _compensations : np.ndarray
+        The compensations of all the participants, sorted.
+    _compensation_cells : np.ndarray
+        The cell of every sorted compensation.
+
+    Methods
+    -------
+    get_stats(query: StatsQueryParams)
+        Returns the statistics of the participants matching the given query, like `Stats.get_stats()`.
+    get_df(query: StatsQueryParams)
+        Returns the pandas.DataFrame of the buckets of the participants matching the given query, like
+        `Stats.get_df()`.
+    response(query: StatsQueryParams)
+        Returns the answer to the given query in the shape of a response of the stats endpoint.
+
+    Examples
+    --------
+    >>> cube = StatsCube(snapshot=ParticipantsSnapshot())
+    >>> cube.get_stats(StatsQueryParams(title="backend", level="senior"))
+    >>> stats = Stats(title="backend", level="senior", cube=cube)
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
+    snapshot: ParticipantsSnapshot = Field(exclude=True)
+    bucket_size: float = Field(default=10000, gt=0)
+    bucket_edges: Optional[list[float]] = None
+    cache_size: int = Field(default=4096, ge=0)
+    _cells: Optional[ParticipantsSnapshot] = None
+    _counts: Optional[np.ndarray] = None
+    _histograms: Optional[np.ndarray] = None
+    _compensations: Optional[np.ndarray] = None
+    _compensation_cells: Optional[np.ndarray] = None
+    _labels: list[str] = []
+    _answers: Dict[tuple, tuple[Dict[str, Any], np.ndarray]] = {}
+
+    def model_post_init(self, __context: Any) -> None:
+        """Placeholder that builds the cube from the snapshot after initialization of the pydantic model.
+
+        Parameters
+        ----------
+        __context : Any
+
+        Returns
+        -------
+        None
+        """
+        participants = self.snapshot.get_df()
+        frame = apply_schema(participants.reindex(columns=[*DIMENSIONS, "compensation"]), PARTICIPANTS_SCHEMA)
+
+        cell_ids = frame.groupby(DIMENSIONS, dropna=False, observed=True, sort=False).ngroup().to_numpy()
+        cell_count = int(cell_ids.max()) + 1 if len(cell_ids) else 0
+        _, first_rows = np.unique(cell_ids, return_index=True)
+        self._cells = ParticipantsSnapshot(frame=frame[DIMENSIONS].iloc[first_rows].reset_index(drop=True))
+        self._counts = np.bincount(cell_ids, minlength=cell_count)
+
+        compensations = frame["compensation"].to_numpy(dtype=float, na_value=np.nan)
+        valid = ~np.isnan(compensations)
+        order = np.argsort(compensations[valid], kind="stable")
+        self._compensations = compensations[valid][order]
+        self._compensation_cells = cell_ids[valid][order]
+
+        if self.bucket_edges is not None:
+            edges = np.asarray(self.bucket_edges, dtype=float)
+        else:
+            top = self._compensations[-1] if len(self._compensations) else 0
+            edges = np.arange(0, top + self.bucket_size, self.bucket_size)
+        buckets = np.clip(np.searchsorted(edges, compensations[valid], side="right") - 1, 0, len(edges) - 1)
+        self._histograms = np.bincount(
+            cell_ids[valid] * len(edges) + buckets, minlength=cell_count * len(edges)
+        ).reshape(cell_count, len(edges))
+        self._labels = [_label(low, high) for low, high in zip(edges, [*edges[1:], None])]
+        self._answers = {}
+
+    def _answer(self, query: StatsQueryParams) -> tuple[Dict[str, Any], np.ndarray]:
+        if getattr(query, "programming_language", None) is not None:
+            raise ValueError("Participant records have no programming language, the cube cannot filter on it")
+
+        key = normalize(query)
+        answer = self._answers.get(key)
+        if answer is not None:
+            return answer
+
+        mask = self._cells.mask(query)
+        compensations = self._compensations[mask[self._compensation_cells]]
+        stats: Dict[str, Any] = {"totalCount": int(self._counts[mask].sum())}
+        for name, quantile in STATS_QUANTILES.items():
+            if len(compensations):
+                position = quantile * (len(compensations) - 1)
+                low = int(position)
+                high = min(low + 1, len(compensations) - 1)
+                value = compensations[low] + (compensations[high] - compensations[low]) * (position - low)
+                stats[name] = float(value)
+            else:
+                stats[name] = None
+        answer = stats, self._histograms[mask].sum(axis=0)
+
+        if len(self._answers) >= self.cache_size:
+            self._answers.pop(next(iter(self._answers)))
+        if self.cache_size:
+            self._answers[key] = answer
+        return answer
+
+    def get_stats(self, query: StatsQueryParams) -> Dict[str, Any]:
+        """Returns the statistics of the participants matching the given query, like `Stats.get_stats()`.
+
+        Parameters
+        ----------
+        query : StatsQueryParams
+            The query parameters to filter the participants with. `programming_language` is not supported.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The number of matching participants (`totalCount`) and the compensation percentiles of `STATS_QUANTILES`,
+            using linear interpolation.
+        """
+        return dict(self._answer(query)[0])
+
+    def get_df(self, query: StatsQueryParams) -> pd.DataFrame:
+        """Returns the pandas.DataFrame of the buckets of the participants matching the given query, like
+        `Stats.get_df()`.
+
+        Parameters
+        ----------
+        query : StatsQueryParams
+            The query parameters to filter the participants with. `programming_language` is not supported.
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        return pd.DataFrame({"bucket": self._labels, "count": self._answer(query)[1]})
+
+    def response(self, query: StatsQueryParams) -> Dict[str, Any]:
+        """Returns the answer to the given query in the shape of a response of the stats endpoint, which the stats
+        clients use in place of the API call when given a cube.
+
+        Parameters
+        ----------
+        query : StatsQueryParams
+            The query parameters to filter the participants with. `programming_language` is not supported.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The `stats` and the `buckets` records of the matching participants.
+        """
+        stats, counts = self._answer(query)
+        return {
+            "stats": dict(stats),
+            "buckets": [{"bucket": label, "count": int(count)} for label, count in zip(self._labels, counts)],
+        }
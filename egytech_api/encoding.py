@@ -0,0 +1,103 @@
+import typing
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Type
+
+from pydantic import BaseModel, PlainSerializer
+
+
+def _serializer(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Returns the function of the `PlainSerializer` declared anywhere in the given annotation, if any."""
+    for metadata in getattr(annotation, "__metadata__", ()):
+        if isinstance(metadata, PlainSerializer):
+            return metadata.func
+    for argument in typing.get_args(annotation):
+        function = _serializer(argument)
+        if function is not None:
+            return function
+    return None
+
+
+def _is_enum(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return True
+    return any(_is_enum(argument) for argument in typing.get_args(annotation))
+
+
+class QueryEncoder:
+    """Precompiled encoder turning validated query parameters into the URL parameters of an API call.
+
+    The encoder generates and compiles one straight-line function per model class from its fields, with the parameter
+    name of every field (its serialization alias, e.g. `yoe_from_included` for `min_yoe`) and the serializer of its
+    values inlined. It yields the same parameters as `query.model_dump(mode="json", exclude_none=True, by_alias=True)`
+    several times faster, since it reads the validated values directly instead of going through pydantic.
+
+    Parameters
+    ----------
+    query_class : type
+        The query parameters model, e.g. `ParticipantsQueryParams`. Excluded fields are left out of the parameters.
+
+    Methods
+    -------
+    encode(query: BaseModel)
+        Returns the URL parameters of the given query.
+    """
+
+    def __init__(self, query_class: Type[BaseModel]):
+        namespace: Dict[str, Any] = {}
+        lines = ["def encode(values):", "    params = {}"]
+        for position, (field, info) in enumerate(query_class.model_fields.items()):
+            if info.exclude:
+                continue
+            serializer = _serializer(info.annotation)
+            if serializer is not None:
+                namespace[f"serializer_{position}"] = serializer
+                expression = f"serializer_{position}(value)"
+            elif _is_enum(info.annotation):
+                # Models with `use_enum_values` already hold the plain value.
+                expression = "value if value.__class__ is str else value._value_"
+            else:
+                expression = "value"
+            lines += [
+                f"    value = values[{field!r}]",
+                "    if value is not None:",
+                f"        params[{info.serialization_alias or field!r}] = {expression}",
+            ]
+        lines.append("    return params")
+
+        exec(compile("\n".join(lines), f"<{query_class.__name__} encoder>", "exec"), namespace)
+        self._encode: Callable[[Dict[str, Any]], Dict[str, Any]] = namespace["encode"]
+
+    def encode(self, query: BaseModel) -> Dict[str, Any]:
+        """Returns the URL parameters of the given query.
+
+        Parameters
+        ----------
+        query : BaseModel
+            The validated query parameters, an instance of the model class of the encoder or of a subclass of it.
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        return self._encode(query.__dict__)
+
+
+_encoders: Dict[type, QueryEncoder] = {}
+
+
+def encode_query(query: BaseModel) -> Dict[str, Any]:
+    """Returns the URL parameters of the given query, using the encoder compiled once for its model class.
+
+    Parameters
+    ----------
+    query : BaseModel
+        The validated query parameters, e.g. a `ParticipantsQueryParams`, `StatsQueryParams` or `Participants`.
+
+    Returns
+    -------
+    Dict[str, Any]
+    """
+    encoder = _encoders.get(query.__class__)
+    if encoder is None:
+        encoder = _encoders[query.__class__] = QueryEncoder(query.__class__)
+    return encoder.encode(query)
@@ -0,0 +1,24 @@
+from typing import Optional
+
+
+class APIError(Exception):
+    """Exception raised when the API responds to a call with an unsuccessful status code.
+
+    Attributes
+    ----------
+    status_code : int
+        The HTTP status code of the response.
+    retry_after : float, optional
+        The number of seconds the server asked to wait before retrying, if it sent a `Retry-After` header.
+
+    """
+
+    def __init__(self, status_code: int, retry_after: Optional[float] = None):
+        super().__init__(f"Unsuccessful API Call (status code {status_code})")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+    def __reduce__(self):
+        # Pickled with the constructor arguments rather than the message, so that errors raised in worker processes
+        # keep their status code.
+        return type(self), (self.status_code, self.retry_after)
@@ -0,0 +1,213 @@
+from types import ModuleType
+from typing import Any, Literal, Optional
+
+import pandas as pd
+
+ExportFormat = Literal["parquet", "feather"]
+
+EXTENSIONS = {"parquet": ".parquet", "feather": ".feather"}
+"""The file extension of every columnar export format."""
+
+
+def require_pyarrow() -> ModuleType:
+    """Returns the `pyarrow` module, which the columnar formats and the `pyarrow` dtype backend require.
+
+    Returns
+    -------
+    ModuleType
+
+    Raises
+    ------
+    ImportError
+        If the optional `pyarrow` dependency is not installed.
+    """
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(
+            "This feature requires the optional pyarrow dependency: pip install egytech_api[arrow]"
+        ) from error
+    return pyarrow
+
+
+def save_parquet(frame: pd.DataFrame, filename: str, compression: Optional[str] = "snappy") -> None:
+    """Saves a DataFrame to a Parquet file, keeping its dtypes and index.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        The DataFrame to save.
+    filename : str
+        The filename to save the Parquet file to. This should not include the file extension.
+    compression : {'snappy', 'zstd', 'gzip', 'brotli', 'lz4', None}
+        The compression codec.
+
+    Returns
+    -------
+    None
+    """
+    require_pyarrow()
+    frame.to_parquet(filename + EXTENSIONS["parquet"], engine="pyarrow", compression=compression)
+
+
+def save_feather(frame: pd.DataFrame, filename: str, compression: Optional[str] = "zstd") -> None:
+    """Saves a DataFrame to a Feather (Arrow IPC) file, keeping its dtypes and index.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        The DataFrame to save.
+    filename : str
+        The filename to save the Feather file to. This should not include the file extension.
+    compression : {'zstd', 'lz4', None}
+        The compression codec.
+
+    Returns
+    -------
+    None
+    """
+    pyarrow = require_pyarrow()
+    from pyarrow import feather
+
+    # Unlike `DataFrame.to_feather()`, converting the table explicitly keeps non-default indexes (e.g. the
+    # MultiIndex of pooled results) in the pandas metadata of the file.
+    table = pyarrow.Table.from_pandas(frame, preserve_index=None)
+    feather.write_feather(
+        table, filename + EXTENSIONS["feather"], compression=compression or "uncompressed"
+    )
+
+
+def load_parquet(filename: str) -> pd.DataFrame:
+    """Loads a DataFrame saved by save_parquet() or by a `ChunkedWriter`.
+
+    Parameters
+    ----------
+    filename : str
+        The filename of the Parquet file. This should not include the file extension.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    require_pyarrow()
+    return pd.read_parquet(filename + EXTENSIONS["parquet"], engine="pyarrow")
+
+
+def load_feather(filename: str) -> pd.DataFrame:
+    """Loads a DataFrame saved by save_feather() or by a `ChunkedWriter`.
+
+    Parameters
+    ----------
+    filename : str
+        The filename of the Feather file. This should not include the file extension.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    require_pyarrow()
+    from pyarrow import feather
+
+    return feather.read_table(filename + EXTENSIONS["feather"]).to_pandas()
+
+
+class ChunkedWriter:
+    """Class that appends DataFrames to a columnar file one chunk at a time, e.g. the results of every query of a
+    pooled fetch as soon as they arrive.
+
+    Every chunk is written as one Parquet row group or one Arrow record batch, so the results never have to be held in
+    memory all at once. The schema of the file is the schema of the first non-empty chunk: columns missing from a
+    later chunk are written as nulls and extra columns are dropped, so chunks should share their dtypes, e.g. by
+    fetching with a `dtype_backend`. Categorical columns are written as dictionary-encoded columns to Parquet files
+    and as plain strings to Feather files, whose record batches cannot change their dictionaries.
+
+    Parameters
+    ----------
+    filename : str
+        The filename to write to. This should not include the file extension.
+    format : {'parquet', 'feather'}
+        The file format.
+    compression : str, optional
+        The compression codec, by default "snappy" for Parquet and "zstd" for Feather files.
+
+    Methods
+    -------
+    write(frame: pd.DataFrame)
+        Appends a DataFrame to the file as one chunk.
+    close()
+        Finishes the file.
+
+    Examples
+    --------
+    >>> with ChunkedWriter("participants", format="parquet") as writer:
+    ...     client = AsyncPoolingClient(queries=queries, writer=writer, dtype_backend="numpy_nullable")
+    >>> df = load_parquet("participants")
+    """
+
+    def __init__(
+            self, filename: str, format: ExportFormat = "parquet", compression: Optional[str] = None
+    ):
+        if format not in EXTENSIONS:
+            raise ValueError(f"Unsupported format {format!r}, expected one of {list(EXTENSIONS)}")
+        self._pyarrow = require_pyarrow()
+        self.path = filename + EXTENSIONS[format]
+        self.format = format
+        self.compression = compression or ("snappy" if format == "parquet" else "zstd")
+        self.rows = 0
+        self._writer: Any = None
+        self._schema: Any = None
+
+    def _open(self, table: Any) -> None:
+        pyarrow = self._pyarrow
+        self._schema = table.schema
+        if self.format == "parquet":
+            from pyarrow import parquet
+
+            self._writer = parquet.ParquetWriter(self.path, self._schema, compression=self.compression)
+        else:
+            options = pyarrow.ipc.IpcWriteOptions(compression=self.compression)
+            self._writer = pyarrow.ipc.new_file(self.path, self._schema, options=options)
+
+    def write(self, frame: pd.DataFrame) -> None:
+        """Appends a DataFrame to the file as one chunk. Its index is not written.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            The chunk to append.
+
+        Returns
+        -------
+        None
+        """
+        if self.format == "feather":
+            frame = frame.astype(
+                {name: object for name, dtype in frame.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)}
+            )
+
+        if self._writer is None:
+            if frame.columns.empty:
+                return
+            self._open(self._pyarrow.Table.from_pandas(frame, preserve_index=False))
+
+        frame = frame.reindex(columns=self._schema.names)
+        table = self._pyarrow.Table.from_pandas(frame, schema=self._schema, preserve_index=False)
+        self._writer.write_table(table)
+        self.rows += len(frame)
+
+    def close(self) -> None:
+        """Finishes the file. A file is only created once a non-empty chunk has been written.
+
+        Returns
+        -------
+        None
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "ChunkedWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,214 @@
+import itertools
+from enum import Enum
+from typing import Any, Dict, Iterator, Optional, Type, Union
+
+import pandas as pd
+from pydantic import BaseModel, ConfigDict
+
+from .core import AsyncPoolingClient, AsyncStatsPoolingClient
+from .models import ParticipantsQueryParams, StatsQueryParams
+
+
+def _construct(
+        query_class: Type[ParticipantsQueryParams], values: Dict[str, Any], fields_set: set[str]
+) -> ParticipantsQueryParams:
+    # Equivalent to `query_class.model_construct()` for already validated values, without its per-call overhead.
+    query = object.__new__(query_class)
+    object.__setattr__(query, "__dict__", values)
+    object.__setattr__(query, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(query, "__pydantic_extra__", None)
+    object.__setattr__(query, "__pydantic_private__", None)
+    return query
+
+
+class QueryGrid(BaseModel):
+    """Class for building the cartesian product of value sets of query parameters.
+
+    Every value of every dimension is validated once on initialization, so the cells of the grid are built without
+    validating a full pydantic model per cell. The cells are expanded lazily.
+
+    Attributes
+    ----------
+    dimensions : Dict[str, list or Enum class]
+        The value set of every dimension of the grid, in order. A dimension is named after the query parameter it
+        sets, or after several comma-separated parameters (e.g. "min_yoe,max_yoe") when its values are tuples setting
+        them together. An Enum class stands for all of its members.
+    base : Dict[str, Any]
+        Query parameters shared by every cell of the grid.
+    query_class : type
+        The query parameters model of the cells, `ParticipantsQueryParams` or `StatsQueryParams`.
+
+    Methods
+    -------
+    names()
+        Returns the names of the dimensions of the grid.
+    keys()
+        Lazily yields the coordinates of every cell of the grid.
+    queries()
+        Lazily yields the query parameters of every cell of the grid.
+    index()
+        Returns the pandas.MultiIndex of the cells of the grid.
+    client(client_class: type = None, **kwargs)
+        Fetches every cell of the grid in one pooled fetch and returns the pooling client holding the results.
+    fetch(client_class: type = None, **kwargs)
+        Fetches every cell of the grid in one pooled fetch and returns the aggregated DataFrame.
+
+    Examples
+    --------
+    >>> grid = QueryGrid(
+    ...     dimensions={"title": TitleEnum, "min_yoe,max_yoe": [(0, 3), (3, 6), (6, 10)]},
+    ...     base={"include_relocated": False},
+    ... )
+    >>> df = grid.fetch()
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
+    dimensions: Dict[str, Union[list[Any], Type[Enum]]]
+    base: Dict[str, Any] = {}
+    query_class: Type[ParticipantsQueryParams] = ParticipantsQueryParams
+    _values: list[list[Dict[str, Any]]] = []
+    _base: Dict[str, Any] = {}
+    _fields_set: set[str] = set()
+
+    def model_post_init(self, __context: Any) -> None:
+        """Placeholder that validates every value of every dimension once after initialization of the pydantic model.
+
+        Parameters
+        ----------
+        __context : Any
+
+        Returns
+        -------
+        None
+
+        """
+        base = self.query_class.model_validate(self.base)
+        self._base = {field: getattr(base, field) for field in base.model_fields_set}
+
+        self._values = []
+        for name, values in self.dimensions.items():
+            fields = name.split(",")
+            if isinstance(values, type) and issubclass(values, Enum):
+                values = list(values)
+                self.dimensions[name] = values
+            validated = []
+            for value in values:
+                cell = dict(zip(fields, value if len(fields) > 1 else (value,)))
+                query = self.query_class.model_validate({**self.base, **cell})
+                validated.append({field: getattr(query, field) for field in fields})
+            self._values.append(validated)
+
+        self._fields_set = set(self._base).union(*(name.split(",") for name in self.dimensions))
+
+    def __len__(self) -> int:
+        length = 1
+        for values in self._values:
+            length *= len(values)
+        return length
+
+    def names(self) -> list[str]:
+        """Returns the names of the dimensions of the grid.
+
+        Returns
+        -------
+        list of str
+
+        """
+        return list(self.dimensions)
+
+    def keys(self) -> Iterator[tuple]:
+        """Lazily yields the coordinates of every cell of the grid.
+
+        Enum members are replaced by their values.
+
+        Yields
+        ------
+        tuple
+
+        """
+        labels = [
+            [getattr(value, "value", value) for value in values]
+            for values in self.dimensions.values()
+        ]
+        return itertools.product(*labels)
+
+    def queries(self) -> Iterator[ParticipantsQueryParams]:
+        """Lazily yields the query parameters of every cell of the grid, without validating them again.
+
+        Yields
+        ------
+        ParticipantsQueryParams or StatsQueryParams
+
+        """
+        defaults = {
+            field: info.default for field, info in self.query_class.model_fields.items()
+        }
+        base = {**defaults, **self._base}
+        for cell in itertools.product(*self._values):
+            values = base.copy()
+            for fields in cell:
+                values.update(fields)
+            yield _construct(self.query_class, values, self._fields_set.copy())
+
+    def index(self) -> pd.MultiIndex:
+        """Returns the pandas.MultiIndex of the cells of the grid.
+
+        Returns
+        -------
+        pd.MultiIndex
+
+        """
+        return pd.MultiIndex.from_tuples(list(self.keys()), names=self.names())
+
+    def client(
+            self, client_class: Optional[Type[BaseModel]] = None, **kwargs: Any
+    ) -> BaseModel:
+        """Fetches every cell of the grid in one pooled fetch and returns the pooling client holding the results.
+
+        Parameters
+        ----------
+        client_class : type, optional
+            The pooling client to fetch the cells with. Defaults to `AsyncPoolingClient` for participants grids and
+            to `AsyncStatsPoolingClient` for stats grids.
+        **kwargs : Any
+            Extra arguments passed on to the pooling client, e.g. `cache` or `scheduler`.
+
+        Returns
+        -------
+        AsyncPoolingClient, PoolingClient, AsyncStatsPoolingClient or StatsPoolingClient
+
+        """
+        if client_class is None:
+            if issubclass(self.query_class, StatsQueryParams):
+                client_class = AsyncStatsPoolingClient
+            else:
+                client_class = AsyncPoolingClient
+
+        return client_class(
+            queries=list(self.queries()),
+            keys=list(self.keys()),
+            key_names=self.names(),
+            **kwargs,
+        )
+
+    def fetch(
+            self, client_class: Optional[Type[BaseModel]] = None, **kwargs: Any
+    ) -> pd.DataFrame:
+        """Fetches every cell of the grid in one pooled fetch.
+
+        Parameters
+        ----------
+        client_class : type, optional
+            The pooling client to fetch the cells with, see client().
+        **kwargs : Any
+            Extra arguments passed on to the pooling client, e.g. `cache` or `scheduler`.
+
+        Returns
+        -------
+        pd.DataFrame
+            The aggregated participants (or buckets for stats grids), indexed by the coordinates of the originating
+            cell followed by the position of the row within the results of that cell. For stats grids, the rows of
+            statistics are available through `client().get_stats()`.
+
+        """
+        return self.client(client_class, **kwargs).get_df()
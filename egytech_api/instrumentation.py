@@ -0,0 +1,600 @@
+import contextlib
+import time
+from types import ModuleType
+from typing import (Any, AsyncIterator, Callable, Dict, Iterator, Optional,
+                    Sequence)
+
+import httpx
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+
+PHASES = ("connect", "wait", "download", "decode", "frame")
+"""The consecutive phases of an API call, in order.
+
+- `connect`: opening the TCP connection and the TLS handshake, zero when a kept-alive connection is reused,
+- `wait`: sending the request and waiting for the response headers, i.e. the server time,
+- `download`: receiving the response body. Streamed responses are decoded while they download, so their decoding and
+  frame building are counted here,
+- `decode`: deserializing the JSON body,
+- `frame`: building the typed DataFrame of the results.
+"""
+
+_CONNECT_EVENTS = {"connection.connect_tcp", "connection.start_tls", "connection.connect_unix_socket"}
+
+
+def require_opentelemetry() -> ModuleType:
+    """Returns the `opentelemetry.trace` module, which `OpenTelemetryHook` requires.
+
+    Returns
+    -------
+    ModuleType
+
+    Raises
+    ------
+    ImportError
+        If the optional `opentelemetry-api` dependency is not installed.
+    """
+    try:
+        from opentelemetry import trace
+    except ImportError as error:
+        raise ImportError(
+            "This feature requires the optional opentelemetry-api dependency: pip install egytech_api[otel]"
+        ) from error
+    return trace
+
+
+class RequestSpan(BaseModel):
+    """Model for the measurements of a single API call.
+
+    Attributes
+    ----------
+    endpoint : str
+        The endpoint called, e.g. `participants`.
+    params : Dict[str, Any]
+        The URL parameters of the call.
+    start : float
+        The UNIX timestamp at which the call started.
+    duration : float
+        The number of seconds the call took, from its start to the end of its last phase.
+    phases : Dict[str, float]
+        The number of seconds spent in every phase of `PHASES` the call went through.
+    status_code : int, optional
+        The status code of the response, None when the call was answered from the cache or failed without a response.
+    bytes_sent : int
+        The approximate size of the HTTP/1.1 request, headers included.
+    bytes_received : int
+        The number of bytes of the response body received over the network, before decompression.
+    cached : bool
+        Whether the call was answered from a `ResponseCache` without a request.
+    coalesced : bool
+        Whether the call shared the result of an identical call in flight instead of making a request.
+    error : str, optional
+        The representation of the error the call failed with, if any.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+    endpoint: str
+    params: Dict[str, Any]
+    start: float
+    duration: float
+    phases: Dict[str, float]
+    status_code: Optional[int] = None
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    cached: bool = False
+    coalesced: bool = False
+    error: Optional[str] = None
+
+
+class PhaseSummary(BaseModel):
+    """Model for the distribution of the duration of one phase over many API calls, in seconds.
+
+    Attributes
+    ----------
+    total : float
+    mean : float
+    p50 : float
+    p99 : float
+    """
+
+    model_config = ConfigDict(extra="forbid")
+    total: float = 0.0
+    mean: float = 0.0
+    p50: float = 0.0
+    p99: float = 0.0
+
+    @classmethod
+    def from_durations(cls, durations: Sequence[float]) -> "PhaseSummary":
+        """Summarizes the given durations.
+
+        Parameters
+        ----------
+        durations : Sequence[float]
+
+        Returns
+        -------
+        PhaseSummary
+        """
+        if not len(durations):
+            return cls()
+        values = np.asarray(durations, dtype=float)
+        p50, p99 = np.percentile(values, [50, 99])
+        return cls(total=float(values.sum()), mean=float(values.mean()), p50=float(p50), p99=float(p99))
+
+
+class InstrumentationSummary(BaseModel):
+    """Model for the aggregated measurements of the API calls of a client run.
+
+    Attributes
+    ----------
+    requests : int
+        The number of API calls, retries and cache hits included.
+    errors : int
+        The number of failed API calls.
+    retries : int, optional
+        The number of API calls that were retries of a failed call, or None for clients that do not retry calls, i.e.
+        all but the asynchronous pooling clients, whose scheduler retries them.
+    cached : int
+        The number of API calls answered from the cache without a request.
+    coalesced : int
+        The number of API calls that shared the result of an identical call in flight.
+    bytes_sent : int
+        The total approximate size of the requests.
+    bytes_received : int
+        The total number of bytes of the response bodies received over the network.
+    duration : PhaseSummary
+        The distribution of the duration of the API calls.
+    phases : Dict[str, PhaseSummary]
+        The distribution of the duration of every phase of `PHASES`, over the calls that went through it.
+    aggregate_seconds : float
+        The number of seconds spent concatenating the results of pooled calls into the resulting DataFrames.
+    spans : list of `RequestSpan`
+        The measurements of every API call, in the order they finished.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+    requests: int = 0
+    errors: int = 0
+    retries: Optional[int] = None
+    cached: int = 0
+    coalesced: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    duration: PhaseSummary = PhaseSummary()
+    phases: Dict[str, PhaseSummary] = {}
+    aggregate_seconds: float = 0.0
+    spans: list[RequestSpan] = Field(default=[], repr=False)
+
+    @classmethod
+    def from_spans(
+            cls, spans: Sequence[RequestSpan], retries: Optional[int] = None, aggregate_seconds: float = 0.0
+    ) -> "InstrumentationSummary":
+        """Aggregates the measurements of the given API calls.
+
+        Parameters
+        ----------
+        spans : Sequence[RequestSpan]
+            The measurements of the API calls.
+        retries : int, optional
+            The number of calls that were retries of a failed call, or None when the calls are not retried.
+        aggregate_seconds : float
+            The number of seconds spent aggregating the results.
+
+        Returns
+        -------
+        InstrumentationSummary
+        """
+        spans = list(spans)
+        return cls(
+            requests=len(spans),
+            errors=sum(span.error is not None for span in spans),
+            retries=retries,
+            cached=sum(span.cached for span in spans),
+            coalesced=sum(span.coalesced for span in spans),
+            bytes_sent=sum(span.bytes_sent for span in spans),
+            bytes_received=sum(span.bytes_received for span in spans),
+            duration=PhaseSummary.from_durations([span.duration for span in spans]),
+            phases={
+                phase: PhaseSummary.from_durations([span.phases[phase] for span in spans if phase in span.phases])
+                for phase in PHASES
+            },
+            aggregate_seconds=aggregate_seconds,
+            spans=spans,
+        )
+
+
+def _request_size(request: httpx.Request) -> int:
+    line = len(request.method) + len(request.url.raw_path) + len(" HTTP/1.1\r\n") + 1
+    headers = sum(len(name) + len(value) + 4 for name, value in request.headers.raw)
+    return line + headers + 2 + len(request.content)
+
+
+def _response_size(response: httpx.Response) -> int:
+    # Responses built in memory (e.g. by a mock transport) are never downloaded.
+    return response.num_bytes_downloaded or int(response.headers.get("content-length", 0))
+
+
+class RequestProbe:
+    """Recorder of the phases of a single API call, used as a context manager around the call.
+
+    The connection phase is measured with the `trace` extension of the underlying `httpcore` connection pool. The
+    other phases are consecutive: every call to mark() closes the current phase. On exit, the measurements are passed
+    to the given callback as a `RequestSpan`, including the error the call failed with, if any.
+
+    Parameters
+    ----------
+    endpoint : str
+        The endpoint called.
+    params : Dict[str, Any]
+        The URL parameters of the call.
+    finish : Callable[[RequestSpan], Any]
+        The callback receiving the measurements of the call.
+    """
+
+    def __init__(self, endpoint: str, params: Dict[str, Any], finish: Callable[[RequestSpan], Any]):
+        self._endpoint = endpoint
+        self._params = params
+        self._finish = finish
+        self._start = time.time()
+        self._clock = self._last = time.perf_counter()
+        self._phases: Dict[str, float] = {}
+        self._connecting: Dict[str, float] = {}
+        self._status_code: Optional[int] = None
+        self._bytes_sent = self._bytes_received = 0
+        self._cached = self._coalesced = False
+
+    def trace(self, name: str, info: Dict[str, Any]) -> None:
+        """Callback of the `trace` extension of `httpx`, measuring the connection phase."""
+        event, _, stage = name.rpartition(".")
+        if event not in _CONNECT_EVENTS:
+            return
+        if stage == "started":
+            self._connecting[event] = time.perf_counter()
+        elif event in self._connecting:
+            elapsed = time.perf_counter() - self._connecting.pop(event)
+            self._phases["connect"] = self._phases.get("connect", 0.0) + elapsed
+
+    async def atrace(self, name: str, info: Dict[str, Any]) -> None:
+        """Callback of the `trace` extension of `httpx` for asynchronous clients."""
+        self.trace(name, info)
+
+    def mark(self, phase: str) -> None:
+        """Closes the current phase, attributing the time elapsed since the previous mark to the given phase.
+
+        Parameters
+        ----------
+        phase : str
+            One of `PHASES`.
+
+        Returns
+        -------
+        None
+        """
+        now = time.perf_counter()
+        elapsed = now - self._last
+        if phase == "wait":
+            # The connection is opened while the request is being sent.
+            elapsed -= self._phases.get("connect", 0.0)
+        self._phases[phase] = self._phases.get(phase, 0.0) + max(elapsed, 0.0)
+        self._last = now
+
+    def cached(self) -> None:
+        """Flags the call as answered from the cache without a request.
+
+        Returns
+        -------
+        None
+        """
+        self._cached = True
+        self._last = time.perf_counter()
+
+    def coalesced(self) -> None:
+        """Flags the call as sharing the result of an identical call in flight, the time spent waiting for it being
+        attributed to the wait phase.
+
+        Returns
+        -------
+        None
+        """
+        self._coalesced = True
+        self.mark("wait")
+
+    def _request(self, client: Any, path: str, headers: Dict[str, str], params: Dict[str, Any], trace: Any) -> Any:
+        request = client.build_request("GET", path, headers=headers, params=params, extensions={"trace": trace})
+        self._bytes_sent = _request_size(request)
+        return request
+
+    def _responded(self, response: httpx.Response) -> None:
+        self._status_code = response.status_code
+        self.mark("wait")
+
+    def send(
+            self, client: httpx.Client, path: str, headers: Dict[str, str], params: Dict[str, Any]
+    ) -> httpx.Response:
+        """Sends a GET request with the given client and reads its response, measuring every phase.
+
+        Parameters
+        ----------
+        client : httpx.Client
+        path : str
+        headers : Dict[str, str]
+        params : Dict[str, Any]
+
+        Returns
+        -------
+        httpx.Response
+        """
+        response = client.send(self._request(client, path, headers, params, self.trace), stream=True)
+        self._responded(response)
+        try:
+            response.read()
+        finally:
+            response.close()
+        self._bytes_received = _response_size(response)
+        self.mark("download")
+        return response
+
+    async def asend(
+            self, client: httpx.AsyncClient, path: str, headers: Dict[str, str], params: Dict[str, Any]
+    ) -> httpx.Response:
+        """Asynchronously sends a GET request with the given client and reads its response, measuring every phase.
+
+        Parameters
+        ----------
+        client : httpx.AsyncClient
+        path : str
+        headers : Dict[str, str]
+        params : Dict[str, Any]
+
+        Returns
+        -------
+        httpx.Response
+        """
+        response = await client.send(self._request(client, path, headers, params, self.atrace), stream=True)
+        self._responded(response)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        self._bytes_received = _response_size(response)
+        self.mark("download")
+        return response
+
+    @contextlib.contextmanager
+    def stream(
+            self, client: httpx.Client, path: str, headers: Dict[str, str], params: Dict[str, Any]
+    ) -> Iterator[httpx.Response]:
+        """Sends a GET request with the given client and yields its response before its body is read.
+
+        Parameters
+        ----------
+        client : httpx.Client
+        path : str
+        headers : Dict[str, str]
+        params : Dict[str, Any]
+
+        Returns
+        -------
+        Iterator[httpx.Response]
+        """
+        response = client.send(self._request(client, path, headers, params, self.trace), stream=True)
+        self._responded(response)
+        try:
+            yield response
+        finally:
+            response.close()
+            self._bytes_received = _response_size(response)
+
+    @contextlib.asynccontextmanager
+    async def astream(
+            self, client: httpx.AsyncClient, path: str, headers: Dict[str, str], params: Dict[str, Any]
+    ) -> AsyncIterator[httpx.Response]:
+        """Asynchronously sends a GET request with the given client and yields its response before its body is read.
+
+        Parameters
+        ----------
+        client : httpx.AsyncClient
+        path : str
+        headers : Dict[str, str]
+        params : Dict[str, Any]
+
+        Returns
+        -------
+        AsyncIterator[httpx.Response]
+        """
+        response = await client.send(self._request(client, path, headers, params, self.atrace), stream=True)
+        self._responded(response)
+        try:
+            yield response
+        finally:
+            await response.aclose()
+            self._bytes_received = _response_size(response)
+
+    def __enter__(self) -> "RequestProbe":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Optional[BaseException], traceback: Any) -> None:
+        self._finish(RequestSpan(
+            endpoint=self._endpoint,
+            params=self._params,
+            start=self._start,
+            duration=self._last - self._clock if exc_value is None else time.perf_counter() - self._clock,
+            phases=self._phases,
+            status_code=self._status_code,
+            bytes_sent=self._bytes_sent,
+            bytes_received=self._bytes_received,
+            cached=self._cached,
+            coalesced=self._coalesced,
+            error=None if exc_value is None else repr(exc_value),
+        ))
+
+
+class _NullProbe:
+    """Probe of uninstrumented calls, sending requests as is and recording nothing."""
+
+    def mark(self, phase: str) -> None:
+        pass
+
+    def cached(self) -> None:
+        pass
+
+    def coalesced(self) -> None:
+        pass
+
+    def send(
+            self, client: httpx.Client, path: str, headers: Dict[str, str], params: Dict[str, Any]
+    ) -> httpx.Response:
+        return client.get(path, headers=headers, params=params)
+
+    async def asend(
+            self, client: httpx.AsyncClient, path: str, headers: Dict[str, str], params: Dict[str, Any]
+    ) -> httpx.Response:
+        return await client.get(path, headers=headers, params=params)
+
+    def stream(
+            self, client: httpx.Client, path: str, headers: Dict[str, str], params: Dict[str, Any]
+    ) -> contextlib.AbstractContextManager[httpx.Response]:
+        return client.stream("GET", path, headers=headers, params=params)
+
+    def astream(
+            self, client: httpx.AsyncClient, path: str, headers: Dict[str, str], params: Dict[str, Any]
+    ) -> contextlib.AbstractAsyncContextManager[httpx.Response]:
+        return client.stream("GET", path, headers=headers, params=params)
+
+    def __enter__(self) -> "_NullProbe":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+NULL_PROBE = _NullProbe()
+"""The probe of uninstrumented calls."""
+
+
+class Instrumentation(BaseModel):
+    """Model for the instrumentation of the API calls of a client.
+
+    When given to a client through its `instrumentation` argument, every API call of the client is measured phase by
+    phase (see `PHASES`) along with its byte counts, and passed as a `RequestSpan` to every hook as soon as it
+    finishes. After a run, the aggregated measurements of the client are returned by its get_summary() method. Hooks
+    are called from the thread or event loop that made the call, so they should be quick and thread-safe.
+
+    Attributes
+    ----------
+    hooks : list of callable
+        The callbacks receiving the `RequestSpan` of every API call, e.g. an `OpenTelemetryHook` or a logging
+        function. Errors raised by a hook propagate to the client.
+
+    Methods
+    -------
+    probe(endpoint: str, params: Dict[str, Any], spans: list)
+        Returns the probe recording a single API call.
+
+    Examples
+    --------
+    >>> instrumentation = Instrumentation(hooks=[print, OpenTelemetryHook()])
+    >>> client = AsyncPoolingClient(queries=queries, instrumentation=instrumentation)
+    >>> client.get_summary().phases["wait"].p99
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
+    hooks: list[Callable[[RequestSpan], Any]] = []
+
+    def probe(self, endpoint: str, params: Dict[str, Any], spans: list[RequestSpan]) -> RequestProbe:
+        """Returns the probe recording a single API call, which appends its measurements to the given list and passes
+        them to every hook.
+
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint called.
+        params : Dict[str, Any]
+            The URL parameters of the call.
+        spans : list of `RequestSpan`
+            The measurements of the calls of the client.
+
+        Returns
+        -------
+        RequestProbe
+        """
+
+        def finish(span: RequestSpan) -> None:
+            spans.append(span)
+            for hook in self.hooks:
+                hook(span)
+
+        return RequestProbe(endpoint, params, finish)
+
+
+def probe_call(
+        instrumentation: Optional[Instrumentation], endpoint: str, params: Dict[str, Any], spans: list[RequestSpan]
+) -> Any:
+    """Returns the probe recording a single API call, or `NULL_PROBE` when the client is not instrumented.
+
+    Parameters
+    ----------
+    instrumentation : Instrumentation, optional
+        The instrumentation of the client.
+    endpoint : str
+        The endpoint called.
+    params : Dict[str, Any]
+        The URL parameters of the call.
+    spans : list of `RequestSpan`
+        The measurements of the calls of the client.
+
+    Returns
+    -------
+    RequestProbe or `NULL_PROBE`
+    """
+    if instrumentation is None:
+        return NULL_PROBE
+    return instrumentation.probe(endpoint, params, spans)
+
+
+class OpenTelemetryHook:
+    """Instrumentation hook exporting every API call as an OpenTelemetry span, with one child span per phase.
+
+    The spans follow the HTTP semantic conventions (`http.request.method`, `url.path`, `http.response.status_code`)
+    and carry the byte counts and cache hits as `egytech_api.*` attributes. This requires the optional
+    `opentelemetry-api` dependency and a configured tracer provider to export anything.
+
+    Parameters
+    ----------
+    tracer : opentelemetry.trace.Tracer, optional
+        The tracer creating the spans, by default the `egytech_api` tracer of the global tracer provider.
+    """
+
+    def __init__(self, tracer: Any = None):
+        self._trace = require_opentelemetry()
+        self._tracer = tracer if tracer is not None else self._trace.get_tracer("egytech_api")
+
+    def __call__(self, span: RequestSpan) -> None:
+        start = int(span.start * 1e9)
+        parent = self._tracer.start_span(
+            f"GET /{span.endpoint}",
+            start_time=start,
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": "GET",
+                "url.path": f"/{span.endpoint}",
+                "egytech_api.cached": span.cached,
+                "egytech_api.coalesced": span.coalesced,
+                "egytech_api.bytes_sent": span.bytes_sent,
+                "egytech_api.bytes_received": span.bytes_received,
+                **{f"egytech_api.param.{name}": str(value) for name, value in span.params.items()},
+            },
+        )
+        if span.status_code is not None:
+            parent.set_attribute("http.response.status_code", span.status_code)
+        if span.error is not None:
+            parent.set_status(self._trace.Status(self._trace.StatusCode.ERROR, span.error))
+
+        context = self._trace.set_span_in_context(parent)
+        offset = start
+        for phase in PHASES:
+            if phase in span.phases:
+                end = offset + int(span.phases[phase] * 1e9)
+                self._tracer.start_span(phase, context=context, start_time=offset).end(end_time=end)
+                offset = end
+        parent.end(end_time=start + int(span.duration * 1e9))
@@ -0,0 +1,223 @@
+import itertools
+from typing import Any, Dict, Optional, Sequence
+
+import pandas as pd
+from pydantic import BaseModel, ConfigDict
+
+from .models import ParticipantsQueryParams
+from .snapshot import (CATEGORICAL_COLUMNS, EXCLUSION_COLUMNS, SERVER_DEFAULTS,
+                       ParticipantsSnapshot)
+
+FILTER_COLUMNS = {
+    **{column: column for column in CATEGORICAL_COLUMNS},
+    "cs_degree": "cs_degree",
+    "min_yoe": "yoe",
+    "max_yoe": "yoe",
+    **EXCLUSION_COLUMNS,
+}
+"""Mapping of `ParticipantsQueryParams` fields to the participant record column they filter on."""
+
+
+def normalize(query: ParticipantsQueryParams) -> tuple:
+    """Returns a hashable canonical form of a participants query.
+
+    Enum members are replaced by their values and omitted `include_*` parameters by the server defaults, so queries
+    the API answers identically share the same canonical form.
+
+    Parameters
+    ----------
+    query : ParticipantsQueryParams
+        The query to normalize.
+
+    Returns
+    -------
+    tuple
+    """
+    values = []
+    for field in FILTER_COLUMNS:
+        value = getattr(query, field)
+        if value is None:
+            value = SERVER_DEFAULTS.get(field)
+        values.append(getattr(value, "value", value))
+    return tuple(values)
+
+
+_EQUALITY_FIELDS = [*CATEGORICAL_COLUMNS, "cs_degree"]
+
+
+def _fields(key: tuple) -> Dict[str, Any]:
+    return dict(zip(FILTER_COLUMNS, key))
+
+
+def _constraints(fields: Dict[str, Any]) -> frozenset:
+    return frozenset((field, fields[field]) for field in _EQUALITY_FIELDS if fields[field] is not None)
+
+
+def _contains(broad: Dict[str, Any], narrow: Dict[str, Any]) -> bool:
+    for field in FILTER_COLUMNS:
+        outer, inner = broad[field], narrow[field]
+        if field == "min_yoe":
+            if outer is not None and (inner is None or inner < outer):
+                return False
+        elif field == "max_yoe":
+            if outer is not None and (inner is None or inner > outer):
+                return False
+        elif field in EXCLUSION_COLUMNS:
+            if inner and not outer:
+                return False
+        elif outer is not None and outer != inner:
+            return False
+    return True
+
+
+def contains(broad: tuple, narrow: tuple) -> bool:
+    """Returns whether every participant matched by the `narrow` query is also matched by the `broad` one.
+
+    Parameters
+    ----------
+    broad : tuple
+        The canonical form of the broader query, as returned by normalize().
+    narrow : tuple
+        The canonical form of the narrower query, as returned by normalize().
+
+    Returns
+    -------
+    bool
+    """
+    return _contains(_fields(broad), _fields(narrow))
+
+
+def required_columns(broad: tuple, narrow: tuple) -> set[str]:
+    """Returns the record columns needed to derive the results of the `narrow` query from those of the `broad` one.
+
+    Parameters
+    ----------
+    broad : tuple
+        The canonical form of the broader query, as returned by normalize().
+    narrow : tuple
+        The canonical form of the narrower query, as returned by normalize().
+
+    Returns
+    -------
+    set of str
+    """
+    return {
+        FILTER_COLUMNS[field]
+        for field, outer, inner in zip(FILTER_COLUMNS, broad, narrow)
+        if outer != inner
+    }
+
+
+class QueryPlan(BaseModel):
+    """Model for the minimal set of participants queries to fetch in order to answer a list of queries.
+
+    Duplicate queries are fetched once, and queries contained in another query of the list are not fetched at all:
+    their results are derived locally by filtering the results of the containing query.
+
+    Attributes
+    ----------
+    queries : list of `ParticipantsQueryParams`
+        The queries to answer, in their original order.
+    fetch : list of `ParticipantsQueryParams`
+        The queries that have to be fetched from the API.
+    sources : list of int
+        For every query of `queries`, the index of the query of `fetch` its results are derived from.
+
+    Methods
+    -------
+    build(queries: Sequence[ParticipantsQueryParams])
+        Plans the given queries.
+    derive(frames: Sequence[pd.DataFrame])
+        Returns the results of every planned query, in the original order, from the results of the fetched queries.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+    queries: list[ParticipantsQueryParams]
+    fetch: list[ParticipantsQueryParams]
+    sources: list[int]
+
+    @classmethod
+    def build(cls, queries: Sequence[ParticipantsQueryParams]) -> "QueryPlan":
+        """Plans the given queries.
+
+        Parameters
+        ----------
+        queries : Sequence[ParticipantsQueryParams]
+            The queries to answer.
+
+        Returns
+        -------
+        QueryPlan
+        """
+        keys = [normalize(query) for query in queries]
+        unique = list(dict.fromkeys(keys))
+        fields = [_fields(key) for key in unique]
+        constraints = [_constraints(key_fields) for key_fields in fields]
+
+        # A query only contains the queries that have all its equality constraints, so the candidates containing a
+        # query are looked up by the subsets of its constraints instead of being compared with every other query.
+        by_constraints: Dict[frozenset, list[int]] = {}
+        for index, key_constraints in enumerate(constraints):
+            by_constraints.setdefault(key_constraints, []).append(index)
+
+        def containing(index: int) -> list[int]:
+            key_constraints = sorted(constraints[index])
+            candidates = [
+                other
+                for size in range(len(key_constraints) + 1)
+                for subset in itertools.combinations(key_constraints, size)
+                for other in by_constraints.get(frozenset(subset), ())
+            ]
+            return sorted(other for other in candidates if _contains(fields[other], fields[index]))
+
+        containers = [containing(index) for index in range(len(unique))]
+        maximal = [index for index in range(len(unique)) if containers[index] == [index]]
+        position = {index: rank for rank, index in enumerate(maximal)}
+        first = {}
+        for query, key in zip(queries, keys):
+            first.setdefault(key, query)
+
+        def source(index: int) -> int:
+            candidates = [position[other] for other in containers[index] if other in position]
+            return min(candidates, key=lambda rank: len(required_columns(unique[maximal[rank]], unique[index])))
+
+        sources = {key: source(index) for index, key in enumerate(unique)}
+        return cls(
+            queries=list(queries),
+            fetch=[first[unique[index]] for index in maximal],
+            sources=[sources[key] for key in keys],
+        )
+
+    def derive(self, frames: Sequence[pd.DataFrame]) -> list[Optional[pd.DataFrame]]:
+        """Returns the results of every planned query, in the original order, from the results of the fetched queries.
+
+        A result is `None` when the results of its source query lack a column needed to filter them, in which case
+        the query has to be fetched on its own.
+
+        Parameters
+        ----------
+        frames : Sequence[pd.DataFrame]
+            The results of the queries of `fetch`, in the same order.
+
+        Returns
+        -------
+        list of `pd.DataFrame` or None
+        """
+        roots = [normalize(query) for query in self.fetch]
+        snapshots: Dict[int, ParticipantsSnapshot] = {}
+        results = []
+        for query, source in zip(self.queries, self.sources):
+            frame = frames[source]
+            root, key = roots[source], normalize(query)
+            if root == key:
+                results.append(frame)
+            elif frame.empty:
+                results.append(frame.iloc[:0])
+            elif required_columns(root, key) <= set(frame.columns):
+                # One snapshot per source frame, shared by all the queries derived from it.
+                if source not in snapshots:
+                    snapshots[source] = ParticipantsSnapshot(frame=frame)
+                results.append(frame[snapshots[source].mask(query)].reset_index(drop=True))
+            else:
+                results.append(None)
+        return results
@@ -0,0 +1,84 @@
+import hashlib
+from typing import Dict, Optional
+
+import httpx
+from pydantic import BaseModel, ConfigDict
+
+
+class Fingerprint(BaseModel):
+    """Model for the content fingerprint of the response to a query, used to detect changed results on refresh.
+
+    A refresh first sends the validators of the previous response, so a server supporting conditional requests answers
+    unchanged results with an empty 304 response. Otherwise, the digest of the new body is compared to the previous
+    one, which still skips decoding and rebuilding the results when the body is identical.
+
+    Attributes
+    ----------
+    digest : str
+        The BLAKE2b digest of the response body.
+    etag : str, optional
+        The `ETag` header of the response, if the server provided one.
+    last_modified : str, optional
+        The `Last-Modified` header of the response, if the server provided one.
+
+    Methods
+    -------
+    from_response(response: httpx.Response)
+        Returns the fingerprint of a successful response.
+    validators()
+        Returns the conditional request headers asking the server whether the response changed.
+    matches(other: Fingerprint)
+        Returns whether the given fingerprint is of the same content.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    digest: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "Fingerprint":
+        """Returns the fingerprint of a successful response.
+
+        Parameters
+        ----------
+        response : httpx.Response
+            The response, with its body read.
+
+        Returns
+        -------
+        Fingerprint
+        """
+        return cls(
+            digest=hashlib.blake2b(response.content, digest_size=16).hexdigest(),
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+
+    def validators(self) -> Dict[str, str]:
+        """Returns the conditional request headers asking the server whether the response changed.
+
+        Returns
+        -------
+        Dict[str, str]
+        """
+        headers = {}
+        if self.etag is not None:
+            headers["if-none-match"] = self.etag
+        if self.last_modified is not None:
+            headers["if-modified-since"] = self.last_modified
+        return headers
+
+    def matches(self, other: Optional["Fingerprint"]) -> bool:
+        """Returns whether the given fingerprint is of the same content.
+
+        Parameters
+        ----------
+        other : Fingerprint, optional
+            The fingerprint of the previous response, if any.
+
+        Returns
+        -------
+        bool
+        """
+        return other is not None and other.digest == self.digest
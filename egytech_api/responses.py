@@ -0,0 +1,220 @@
+import json
+from typing import Any, Dict, Optional, Type
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing_extensions import TypedDict
+
+from .models import (BusinessFocusEnum, BusinessLineEnum, BusinessMarketEnum, BusinessSizeEnum,
+                     GenderEnum, LevelEnum, TitleEnum)
+
+# Unknown fields are kept, so that new API fields reach the results, while known fields with unexpected types or
+# values fail validation.
+_RESPONSE_CONFIG = ConfigDict(extra="allow", use_enum_values=True, populate_by_name=True)
+
+
+class ParticipantRecord(BaseModel):
+    """Model for a single participant returned by the participants endpoint of the API.
+
+    Attributes
+    ----------
+    title : TitleEnum, optional
+    level : LevelEnum, optional
+    yoe : int, optional
+        The years of experience of the participant.
+    gender : GenderEnum, optional
+    cs_degree : bool, optional
+        Whether the participant has a computer science degree.
+    business_market : BusinessMarketEnum, optional
+    business_size : BusinessSizeEnum, optional
+    business_focus : BusinessFocusEnum, optional
+    business_line : BusinessLineEnum, optional
+    is_relocated : bool, optional
+        Whether the participant relocated abroad.
+    is_remote_abroad : bool, optional
+        Whether the participant works remotely for a business abroad.
+    compensation : float, optional
+        The monthly compensation of the participant in EGP.
+    """
+
+    model_config = _RESPONSE_CONFIG
+    title: Optional[TitleEnum] = None
+    level: Optional[LevelEnum] = None
+    yoe: Optional[int] = None
+    gender: Optional[GenderEnum] = None
+    cs_degree: Optional[bool] = None
+    business_market: Optional[BusinessMarketEnum] = None
+    business_size: Optional[BusinessSizeEnum] = None
+    business_focus: Optional[BusinessFocusEnum] = None
+    business_line: Optional[BusinessLineEnum] = None
+    is_relocated: Optional[bool] = None
+    is_remote_abroad: Optional[bool] = None
+    compensation: Optional[float] = None
+
+
+class StatsSummary(BaseModel):
+    """Model for the statistics returned by the stats endpoint of the API. Fields are named in snake case and read
+    from, and dumped with `by_alias=True` to, the camel case names of the API.
+
+    Attributes
+    ----------
+    total_count : int
+        The number of participants matching the query (`totalCount`).
+    median : float, optional
+        The median compensation.
+    p20_compensation : float, optional
+        The 20th percentile of the compensation (`p20Compensation`).
+    p75_compensation : float, optional
+        The 75th percentile of the compensation (`p75Compensation`).
+    p90_compensation : float, optional
+        The 90th percentile of the compensation (`p90Compensation`).
+    """
+
+    model_config = _RESPONSE_CONFIG
+    total_count: int = Field(alias="totalCount")
+    median: Optional[float] = None
+    p20_compensation: Optional[float] = Field(default=None, alias="p20Compensation")
+    p75_compensation: Optional[float] = Field(default=None, alias="p75Compensation")
+    p90_compensation: Optional[float] = Field(default=None, alias="p90Compensation")
+
+
+class Bucket(BaseModel):
+    """Model for a single compensation bucket returned by the stats endpoint of the API.
+
+    Attributes
+    ----------
+    bucket : str
+        The label of the compensation range, e.g. `10K-20K`.
+    count : int
+        The number of participants whose compensation falls in the range.
+    """
+
+    model_config = _RESPONSE_CONFIG
+    bucket: str
+    count: int
+
+
+class ParticipantsResponse(BaseModel):
+    """Model for a response of the participants endpoint of the API.
+
+    Attributes
+    ----------
+    results : list of `ParticipantRecord`
+    """
+
+    model_config = _RESPONSE_CONFIG
+    results: list[ParticipantRecord]
+
+
+class StatsResponse(BaseModel):
+    """Model for a response of the stats endpoint of the API.
+
+    Attributes
+    ----------
+    stats : StatsSummary
+    buckets : list of `Bucket`
+    """
+
+    model_config = _RESPONSE_CONFIG
+    stats: StatsSummary
+    buckets: list[Bucket]
+
+
+def _row_type(model: Type[BaseModel]) -> type:
+    """Returns a TypedDict with the fields, under their API names, and the validation of the given model. Validating
+    against it yields plain dicts instead of model objects."""
+    fields = {field.alias or name: field.annotation for name, field in model.model_fields.items()}
+    row = TypedDict(f"{model.__name__}Row", fields, total=False)
+    row.__pydantic_config__ = _RESPONSE_CONFIG
+    return row
+
+
+_ParticipantsRows = TypedDict("_ParticipantsRows", {"results": list[_row_type(ParticipantRecord)]})
+_ParticipantsRows.__pydantic_config__ = _RESPONSE_CONFIG
+_StatsRows = TypedDict(
+    "_StatsRows", {"stats": _row_type(StatsSummary), "buckets": list[_row_type(Bucket)]}
+)
+_StatsRows.__pydantic_config__ = _RESPONSE_CONFIG
+
+PARTICIPANTS_ADAPTER = TypeAdapter(ParticipantsResponse)
+"""Validator of participants responses into model objects."""
+
+STATS_ADAPTER = TypeAdapter(StatsResponse)
+"""Validator of stats responses into model objects."""
+
+_ROWS_ADAPTERS: Dict[str, TypeAdapter] = {
+    "participants": TypeAdapter(_ParticipantsRows),
+    "stats": TypeAdapter(_StatsRows),
+}
+
+
+def decode_participants(body: bytes) -> ParticipantsResponse:
+    """Validates the raw body of a participants response into model objects, parsing the JSON and validating it in one
+    pass.
+
+    Parameters
+    ----------
+    body : bytes
+        The raw body of the response.
+
+    Returns
+    -------
+    ParticipantsResponse
+
+    Raises
+    ------
+    pydantic.ValidationError
+        If the response does not match the models, e.g. after a change of the API.
+    """
+    return PARTICIPANTS_ADAPTER.validate_json(body)
+
+
+def decode_stats(body: bytes) -> StatsResponse:
+    """Validates the raw body of a stats response into model objects, parsing the JSON and validating it in one pass.
+
+    Parameters
+    ----------
+    body : bytes
+        The raw body of the response.
+
+    Returns
+    -------
+    StatsResponse
+
+    Raises
+    ------
+    pydantic.ValidationError
+        If the response does not match the models, e.g. after a change of the API.
+    """
+    return STATS_ADAPTER.validate_json(body)
+
+
+def decode_response(path: str, body: bytes, columns: bool = True) -> Any:
+    """Decodes the raw body of a response of the given endpoint, validated against the response models.
+
+    With `columns`, records are validated against the fields of the models without building model objects, and come
+    back as plain dicts with the API names, ready to be turned into DataFrame columns. This is several times faster
+    than building model objects, and only about twice as slow as decoding the JSON without validation.
+
+    Parameters
+    ----------
+    path : str
+        The endpoint, `participants` or `stats`.
+    body : bytes
+        The raw body of the response.
+    columns : bool
+        Whether to return plain dicts instead of model objects.
+
+    Returns
+    -------
+    Dict[str, Any] or `ParticipantsResponse` or `StatsResponse`
+        The decoded response, shaped like the JSON body when `columns` is set.
+
+    Raises
+    ------
+    pydantic.ValidationError
+        If the response does not match the models, e.g. after a change of the API.
+    """
+    if columns:
+        adapter = _ROWS_ADAPTERS.get(path)
+        return json.loads(body) if adapter is None else adapter.validate_json(body)
+    return decode_stats(body) if path == "stats" else decode_participants(body)
@@ -0,0 +1,297 @@
+import asyncio
+import collections
+import itertools
+import random
+import time
+from typing import (Any, AsyncIterator, Awaitable, Callable, Iterable, Optional,
+                    Sequence)
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+from .exceptions import APIError
+
+
+class TokenBucket:
+    """Token bucket rate limiter for coroutines sharing one event loop.
+
+    Parameters
+    ----------
+    rate : float
+        The number of tokens added to the bucket per second.
+    capacity : int
+        The maximum number of tokens the bucket holds, i.e. the allowed burst size.
+
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Waits until a token is available and takes it.
+
+        Returns
+        -------
+        None
+
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class RetryPolicy(BaseModel):
+    """Model for the retry behaviour of failed API calls.
+
+    Attributes
+    ----------
+    max_retries : int
+        The maximum number of retries per call after the first attempt.
+    backoff_base : float
+        The delay in seconds before the first retry, doubled on every following retry.
+    backoff_max : float
+        The maximum delay in seconds between two attempts.
+    retry_statuses : set of int
+        The response status codes that are retried. Network errors are always retried.
+
+    Methods
+    -------
+    should_retry(error: Exception, attempt: int)
+        Returns whether a call that failed with the given error should be attempted again.
+    delay(error: Exception, attempt: int)
+        Returns the number of seconds to wait before the next attempt.
+
+    """
+
+    model_config = ConfigDict(extra="forbid")
+    max_retries: int = Field(default=3, ge=0)
+    backoff_base: float = Field(default=0.5, ge=0)
+    backoff_max: float = Field(default=30.0, ge=0)
+    retry_statuses: set[int] = {429, 500, 502, 503, 504}
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        """Returns whether a call that failed with the given error should be attempted again.
+
+        Parameters
+        ----------
+        error : Exception
+            The error the call failed with.
+        attempt : int
+            The number of attempts made so far.
+
+        Returns
+        -------
+        bool
+
+        """
+        if attempt > self.max_retries:
+            return False
+        if isinstance(error, APIError):
+            return error.status_code in self.retry_statuses
+        return isinstance(error, httpx.TransportError)
+
+    def delay(self, error: Exception, attempt: int) -> float:
+        """Returns the number of seconds to wait before the next attempt, using exponential backoff with full jitter.
+
+        A `Retry-After` delay sent by the server takes precedence when it is longer.
+
+        Parameters
+        ----------
+        error : Exception
+            The error the call failed with.
+        attempt : int
+            The number of attempts made so far.
+
+        Returns
+        -------
+        float
+
+        """
+        backoff = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        delay = random.uniform(0, backoff)
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max))
+        return delay
+
+
+class QueryResult(BaseModel):
+    """Model for the outcome of a single scheduled API call.
+
+    Attributes
+    ----------
+    query : Any
+        The query parameters the call was made with.
+    value : Any
+        The deserialized result of the call, or `None` if it failed.
+    error : Exception, optional
+        The error of the last attempt, if the call failed.
+    attempts : int
+        The number of attempts made.
+
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
+    query: Any
+    value: Any = None
+    error: Optional[Exception] = None
+    attempts: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+
+class Scheduler(BaseModel):
+    """Class for running many API calls concurrently with bounded concurrency, rate limiting and retries.
+
+    Every call is isolated: a call that still fails after its retries is reported in its `QueryResult` and does not
+    affect the other calls.
+
+    Attributes
+    ----------
+    max_in_flight : int
+        The maximum number of calls running at the same time.
+    rate_limit : float, optional
+        The maximum number of calls started per second. `None` disables rate limiting.
+    burst : int
+        The number of calls that may start at once before the rate limit applies.
+    retry : RetryPolicy
+        The retry behaviour of failed calls.
+
+    Methods
+    -------
+    run(call: Callable[[Any], Awaitable[Any]], queries: Sequence[Any])
+        Runs the given call for every query and returns the results in input order.
+    iterate(call: Callable[[Any], Awaitable[Any]], queries: Iterable[Any], ordered: bool = True)
+        Runs the given call for every query and yields the results as they complete.
+
+    """
+
+    model_config = ConfigDict(extra="forbid")
+    max_in_flight: int = Field(default=10, gt=0)
+    rate_limit: Optional[float] = Field(default=None, gt=0)
+    burst: int = Field(default=1, gt=0)
+    retry: RetryPolicy = Field(default_factory=RetryPolicy)
+
+    def _limits(self) -> tuple[asyncio.Semaphore, Optional[TokenBucket]]:
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        bucket = (
+            TokenBucket(self.rate_limit, self.burst)
+            if self.rate_limit is not None
+            else None
+        )
+        return semaphore, bucket
+
+    async def _run_single(
+            self,
+            call: Callable[[Any], Awaitable[Any]],
+            query: Any,
+            semaphore: asyncio.Semaphore,
+            bucket: Optional[TokenBucket],
+    ) -> QueryResult:
+        result = QueryResult(query=query)
+        while True:
+            async with semaphore:
+                if bucket is not None:
+                    await bucket.acquire()
+                result.attempts += 1
+                try:
+                    result.value = await call(query)
+                    result.error = None
+                    return result
+                except Exception as error:
+                    result.error = error
+                    if not self.retry.should_retry(error, result.attempts):
+                        return result
+            await asyncio.sleep(self.retry.delay(result.error, result.attempts))
+
+    async def run(
+            self,
+            call: Callable[[Any], Awaitable[Any]],
+            queries: Sequence[Any],
+    ) -> list[QueryResult]:
+        """Runs the given call for every query and returns the results in input order.
+
+        Parameters
+        ----------
+        call : Callable[[Any], Awaitable[Any]]
+            The coroutine function making a single API call for one query.
+        queries : Sequence[Any]
+            The queries to make calls for.
+
+        Returns
+        -------
+        list of `QueryResult`
+
+        """
+        semaphore, bucket = self._limits()
+        return list(
+            await asyncio.gather(
+                *(self._run_single(call, query, semaphore, bucket) for query in queries)
+            )
+        )
+
+    async def iterate(
+            self,
+            call: Callable[[Any], Awaitable[Any]],
+            queries: Iterable[Any],
+            ordered: bool = True,
+    ) -> AsyncIterator[QueryResult]:
+        """Runs the given call for every query and yields the results as they complete.
+
+        At most `max_in_flight` calls are started ahead of the consumer, and a new call is only started when a
+        result is consumed, so memory stays constant however many queries there are. The queries are consumed
+        lazily and may be a generator.
+
+        Parameters
+        ----------
+        call : Callable[[Any], Awaitable[Any]]
+            The coroutine function making a single API call for one query.
+        queries : Iterable[Any]
+            The queries to make calls for.
+        ordered : bool
+            Whether to yield the results in input order. When False, they are yielded in completion order.
+
+        Yields
+        ------
+        QueryResult
+
+        """
+        semaphore, bucket = self._limits()
+        queries = iter(queries)
+        pending: collections.deque[asyncio.Task] = collections.deque(
+            asyncio.ensure_future(self._run_single(call, query, semaphore, bucket))
+            for query in itertools.islice(queries, self.max_in_flight)
+        )
+        try:
+            while pending:
+                if ordered:
+                    task = pending[0]
+                    await asyncio.wait([task])
+                else:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    task = next(task for task in pending if task in done)
+                pending.remove(task)
+                for query in itertools.islice(queries, 1):
+                    pending.append(
+                        asyncio.ensure_future(self._run_single(call, query, semaphore, bucket))
+                    )
+                yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,102 @@
+from typing import Any, Dict, Literal
+
+import pandas as pd
+
+from .export import require_pyarrow
+from .snapshot import CATEGORICAL_COLUMNS
+
+DtypeBackend = Literal["numpy_nullable", "pyarrow"]
+
+PARTICIPANTS_SCHEMA: Dict[str, Any] = {
+    **{
+        column: pd.CategoricalDtype([member.value for member in enum])
+        for column, enum in CATEGORICAL_COLUMNS.items()
+    },
+    "yoe": "Int8",
+    "cs_degree": "boolean",
+    "is_relocated": "boolean",
+    "is_remote_abroad": "boolean",
+    "compensation": "Float64",
+}
+"""Declared dtypes of the columns of participants results. Enum-like columns use the category sets of their enums."""
+
+BUCKETS_SCHEMA: Dict[str, Any] = {"bucket": "category", "count": "Int32"}
+"""Declared dtypes of the columns of buckets results. Buckets keep the categories in the order the API sends them."""
+
+STATS_SCHEMA: Dict[str, Any] = {"totalCount": "Int32"}
+"""Declared dtypes of the columns of stats results. The other statistics use nullable floating dtypes."""
+
+_PYARROW_DTYPES = {
+    "Int8": "int8[pyarrow]",
+    "Int16": "int16[pyarrow]",
+    "Int32": "int32[pyarrow]",
+    "Int64": "int64[pyarrow]",
+    "Float64": "double[pyarrow]",
+    "boolean": "bool[pyarrow]",
+}
+
+_BOOLEANS = {"yes": True, "no": False, "true": True, "false": False, True: True, False: False}
+
+
+def _categorical(column: pd.Series, dtype: Any) -> pd.Series:
+    if isinstance(dtype, pd.CategoricalDtype):
+        categories = list(dtype.categories)
+    else:
+        categories = list(pd.unique(column.dropna()))
+    # Values outside the declared categories (e.g. a value added to the API but not to the enums) are kept as extra
+    # categories instead of being silently replaced by missing values.
+    unknown = set(column.dropna().unique()) - set(categories)
+    return column.astype(pd.CategoricalDtype(categories + sorted(unknown, key=str)))
+
+
+def _cast(column: pd.Series, dtype: str, dtype_backend: DtypeBackend) -> pd.Series:
+    if dtype == "boolean" and not pd.api.types.is_bool_dtype(column):
+        column = column.map(_BOOLEANS)
+    elif dtype != "boolean":
+        column = pd.to_numeric(column, errors="coerce")
+    if dtype_backend == "pyarrow":
+        dtype = _PYARROW_DTYPES[dtype]
+    try:
+        return column.astype(dtype)
+    except (TypeError, ValueError):
+        # e.g. fractional values in an integer column: fall back to the inferred nullable dtype.
+        return column.convert_dtypes(dtype_backend=dtype_backend)
+
+
+def apply_schema(
+        frame: pd.DataFrame, schema: Dict[str, Any], dtype_backend: DtypeBackend = "numpy_nullable"
+) -> pd.DataFrame:
+    """Returns a copy of a results DataFrame with the dtypes declared by the given schema.
+
+    Categorical columns are stored as small integer codes into a fixed category set, which makes them several times
+    more compact than object columns and much faster to group and compare. Columns missing from the schema get the
+    nullable dtypes inferred by `pd.DataFrame.convert_dtypes()`. Categorical columns stay pandas categoricals with
+    both backends.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        The results DataFrame to convert.
+    schema : Dict[str, Any]
+        The declared dtype of every known column, e.g. `PARTICIPANTS_SCHEMA`.
+    dtype_backend : {'numpy_nullable', 'pyarrow'}
+        Whether the non-categorical columns use nullable NumPy dtypes or `pyarrow`-backed dtypes. The latter requires
+        the optional `pyarrow` dependency.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    if dtype_backend == "pyarrow":
+        require_pyarrow()
+
+    columns = {}
+    for name, column in frame.items():
+        dtype = schema.get(name)
+        if dtype is None:
+            columns[name] = column.convert_dtypes(dtype_backend=dtype_backend)
+        elif isinstance(dtype, pd.CategoricalDtype) or dtype == "category":
+            columns[name] = _categorical(column, dtype)
+        else:
+            columns[name] = _cast(column, dtype, dtype_backend)
+    return pd.DataFrame(columns, index=frame.index)
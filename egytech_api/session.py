@@ -0,0 +1,225 @@
+import asyncio
+import atexit
+import os
+import threading
+import weakref
+from typing import Any, Optional
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+from .coalescing import SingleFlight
+
+API_URL = "https://api.egytech.fyi/"
+HEADERS = {"accept": "application/json"}
+
+
+class Session(BaseModel):
+    """Class holding long-lived HTTP clients shared by every API call, so connections are kept alive and reused.
+
+    The synchronous `httpx.Client` is created on first use and is safe to share between threads. Asynchronous calls
+    get one `httpx.AsyncClient` per event loop, since connections cannot be shared across loops. Unless another
+    session is given, all the classes of the package use the process-wide session returned by get_session().
+
+    Attributes
+    ----------
+    base_url : str
+        The base URL of the API.
+    timeout : float
+        The timeout in seconds of connecting, reading, writing and acquiring a pooled connection.
+    max_connections : int
+        The maximum number of concurrent connections.
+    max_keepalive_connections : int
+        The maximum number of idle connections kept alive in the pool.
+    keepalive_expiry : float
+        The number of seconds an idle connection is kept alive.
+    http2 : bool
+        Whether to enable HTTP/2. This requires the optional `h2` dependency (`pip install httpx[http2]`).
+    coalesce : bool
+        Whether to coalesce concurrent identical API calls made over the session, from threads or from coroutines of
+        the same event loop, into one request whose decoded result is shared by every caller (see `SingleFlight`).
+
+    Methods
+    -------
+    client()
+        Returns the shared synchronous client.
+    async_client()
+        Returns the shared asynchronous client of the running event loop.
+    flights()
+        Returns the coalescer of the API calls made over the session, if `coalesce` is set.
+    close()
+        Closes the synchronous client.
+    aclose()
+        Closes the asynchronous client of the running event loop.
+
+    Examples
+    --------
+    >>> with Session(max_connections=20, http2=True) as session:
+    ...     participants = Participants(title="backend", session=session)
+    """
+
+    model_config = ConfigDict(extra="forbid")
+    base_url: str = API_URL
+    timeout: float = Field(default=30.0, gt=0)
+    max_connections: int = Field(default=100, gt=0)
+    max_keepalive_connections: int = Field(default=20, ge=0)
+    keepalive_expiry: float = Field(default=30.0, ge=0)
+    http2: bool = False
+    coalesce: bool = False
+    _client: Optional[httpx.Client] = None
+    _async_clients: Any = None
+    _lock: Any = None
+    _pid: Optional[int] = None
+    _flights: Optional[SingleFlight] = None
+
+    def model_post_init(self, __context: Any) -> None:
+        """Placeholder that prepares the client registry after initialization of the pydantic model.
+
+        Parameters
+        ----------
+        __context : Any
+
+        Returns
+        -------
+        None
+        """
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._flights = SingleFlight() if self.coalesce else None
+
+    def _options(self) -> dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "headers": HEADERS,
+            "timeout": self.timeout,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "http2": self.http2,
+        }
+
+    def _check_fork(self) -> None:
+        # Connections inherited from a parent process must not be reused by a forked child.
+        if self._pid != os.getpid():
+            self._client = None
+            self._async_clients = weakref.WeakKeyDictionary()
+            self._pid = os.getpid()
+            # Calls in flight in the parent process never complete in the child.
+            self._flights = SingleFlight() if self.coalesce else None
+
+    def client(self) -> httpx.Client:
+        """Returns the shared synchronous client, creating it on first use.
+
+        Returns
+        -------
+        httpx.Client
+        """
+        self._check_fork()
+        client = self._client
+        if client is None or client.is_closed:
+            with self._lock:
+                if self._client is None or self._client.is_closed:
+                    self._client = httpx.Client(**self._options())
+                client = self._client
+        return client
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Returns the shared asynchronous client of the running event loop, creating it on first use.
+
+        Returns
+        -------
+        httpx.AsyncClient
+        """
+        self._check_fork()
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._async_clients[loop] = httpx.AsyncClient(**self._options())
+        return client
+
+    def flights(self) -> Optional[SingleFlight]:
+        """Returns the coalescer of the API calls made over the session.
+
+        Returns
+        -------
+        SingleFlight or None
+            The coalescer, or None when `coalesce` is not set.
+        """
+        self._check_fork()
+        return self._flights
+
+    def close(self) -> None:
+        """Closes the synchronous client. A new one is created if the session is used again.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self) -> None:
+        """Closes the asynchronous client of the running event loop. A new one is created if the session is used again.
+
+        Returns
+        -------
+        None
+        """
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def __enter__(self) -> "Session":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "Session":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+        self.close()
+
+
+_default_session: Optional[Session] = None
+_default_lock = threading.Lock()
+
+
+def get_session() -> Session:
+    """Returns the process-wide session, creating it on first use. It is closed automatically at exit.
+
+    Returns
+    -------
+    Session
+    """
+    global _default_session
+    if _default_session is None:
+        with _default_lock:
+            if _default_session is None:
+                _default_session = Session()
+                atexit.register(_default_session.close)
+    return _default_session
+
+
+def set_session(session: Optional[Session]) -> None:
+    """Replaces the process-wide session, e.g. with one configured with other limits or timeouts.
+
+    Parameters
+    ----------
+    session : Session or None
+        The new process-wide session. `None` resets it to a default session created on next use.
+
+    Returns
+    -------
+    None
+    """
+    global _default_session
+    with _default_lock:
+        _default_session = session
@@ -0,0 +1,257 @@
+import atexit
+import math
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+from typing import Any, Dict, Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .schema import PARTICIPANTS_SCHEMA, apply_schema
+from .store import layout_frame, read_buffers, write_buffers
+
+_worker_sessions: Dict[tuple, Any] = {}
+
+
+def pack_frame(frame: pd.DataFrame) -> Dict[str, Any]:
+    """Copies the columns of a DataFrame into a new block of shared memory, to hand them over to another process.
+
+    Categorical columns are stored as their codes and nullable columns as their values and missing-value masks, so
+    only a small descriptor has to be pickled. Columns of other dtypes (e.g. unexpected string columns) are pickled
+    with the descriptor. The block is released by unpack_frame().
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        The DataFrame to pack. Its index is not packed.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The descriptor of the packed DataFrame, to pass to unpack_frame().
+    """
+    columns, buffers, size = layout_frame(frame)
+    block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        write_buffers(block.buf, columns, buffers)
+    finally:
+        block.close()
+    return {"name": block.name, "rows": len(frame), "columns": columns}
+
+
+def unpack_frame(descriptor: Dict[str, Any]) -> pd.DataFrame:
+    """Rebuilds a DataFrame packed by pack_frame() in another process, then releases its block of shared memory.
+
+    Parameters
+    ----------
+    descriptor : Dict[str, Any]
+        The descriptor returned by pack_frame().
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    block = shared_memory.SharedMemory(name=descriptor["name"])
+    try:
+        return read_buffers(block.buf, descriptor["columns"], descriptor["rows"], copy=True)
+    finally:
+        block.close()
+        block.unlink()
+
+
+def release_frame(descriptor: Dict[str, Any]) -> None:
+    """Releases the block of shared memory of a DataFrame packed by pack_frame() without rebuilding it.
+
+    Parameters
+    ----------
+    descriptor : Dict[str, Any]
+        The descriptor returned by pack_frame().
+
+    Returns
+    -------
+    None
+    """
+    try:
+        block = shared_memory.SharedMemory(name=descriptor["name"])
+    except FileNotFoundError:
+        return
+    block.close()
+    block.unlink()
+
+
+def _worker_session(options: Dict[str, Any]) -> Any:
+    from .session import Session
+
+    key = tuple(sorted(options.items()))
+    session = _worker_sessions.get(key)
+    if session is None:
+        session = _worker_sessions[key] = Session(**options)
+        atexit.register(session.close)
+    return session
+
+
+def fetch_shard(
+        params: Sequence[Dict[str, Any]],
+        session_options: Dict[str, Any],
+        cache: Any = None,
+        stream: bool = False,
+        max_workers: int = 1,
+        validate: bool = False,
+) -> tuple[Dict[str, Any], list[int]]:
+    """Fetches, decodes and types the participants of a shard of queries in a worker process.
+
+    Parameters
+    ----------
+    params : Sequence[Dict[str, Any]]
+        The URL parameters of the queries of the shard.
+    session_options : Dict[str, Any]
+        The fields of the `Session` of the pooling client. Every worker process keeps one session per set of options.
+    cache : ResponseCache, optional
+        The response cache of the pooling client.
+    stream : bool
+        Whether to decode the responses incrementally while they download.
+    max_workers : int
+        The number of threads of the worker process fetching the queries of the shard concurrently.
+    validate : bool
+        Whether to validate the responses against the response models, see `egytech_api.responses`.
+
+    Returns
+    -------
+    tuple of dict and list of int
+        The descriptor of the participants of all the queries of the shard, packed by pack_frame(), and the number of
+        rows of every query.
+    """
+    from .core import _get_json, _map, _stream_frame
+
+    session = _worker_session(session_options)
+    client, flights = session.client(), session.flights()
+
+    def fetch(query_params: Dict[str, Any]) -> pd.DataFrame:
+        if stream:
+            frame = _stream_frame("participants", query_params, client, cache, flights=flights)
+        else:
+            records = _get_json(
+                "participants", query_params, client, cache, flights=flights, validate=validate
+            )["results"]
+            frame = pd.DataFrame.from_records(records)
+        return apply_schema(frame, PARTICIPANTS_SCHEMA)
+
+    frames = list(_map(fetch, params, max_workers))
+    counts = [len(frame) for frame in frames]
+    frames = [frame for frame in frames if not frame.columns.empty]
+    frame = apply_schema(pd.concat(frames, ignore_index=True), PARTICIPANTS_SCHEMA) if frames else pd.DataFrame()
+    return pack_frame(frame), counts
+
+
+def shards(count: int, processes: int, shards_per_process: int = 4) -> list[range]:
+    """Splits the positions of the given number of queries into contiguous shards, several per process so that the
+    processes stay busy when some shards take longer than others.
+
+    Parameters
+    ----------
+    count : int
+        The number of queries.
+    processes : int
+        The number of worker processes.
+    shards_per_process : int
+        The number of shards per worker process.
+
+    Returns
+    -------
+    list of range
+    """
+    size = max(1, math.ceil(count / (processes * shards_per_process)))
+    return [range(start, min(start + size, count)) for start in range(0, count, size)]
+
+
+def fetch_sharded(
+        params: Sequence[Dict[str, Any]],
+        processes: int,
+        session_options: Dict[str, Any],
+        cache: Any = None,
+        stream: bool = False,
+        max_workers: int = 1,
+        validate: bool = False,
+) -> Iterator[tuple[pd.DataFrame, list[int]]]:
+    """Fetches the participants of the given queries in a pool of worker processes, sharding the queries across the
+    processes, and yields the participants of every shard with the number of rows of each of its queries, in the
+    order of the queries.
+
+    Parameters
+    ----------
+    params : Sequence[Dict[str, Any]]
+        The URL parameters of the queries.
+    processes : int
+        The number of worker processes.
+    session_options : Dict[str, Any]
+        The fields of the `Session` of the pooling client.
+    cache : ResponseCache, optional
+        The response cache of the pooling client.
+    stream : bool
+        Whether to decode the responses incrementally while they download.
+    max_workers : int
+        The number of threads fetching the queries of a shard concurrently within each worker process.
+    validate : bool
+        Whether to validate the responses against the response models, see `egytech_api.responses`.
+
+    Yields
+    ------
+    tuple of `pd.DataFrame` and list of int
+    """
+    # Worker processes are spawned rather than forked: the parent may hold open connections and running threads.
+    executor = ProcessPoolExecutor(max_workers=processes, mp_context=get_context("spawn"))
+    futures = [
+        executor.submit(fetch_shard, [params[position] for position in shard], session_options, cache, stream,
+                        max_workers, validate)
+        for shard in shards(len(params), processes)
+    ]
+    try:
+        for future in futures:
+            descriptor, counts = future.result()
+            yield unpack_frame(descriptor), counts
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        # Release the shared memory of the shards that were fetched but not consumed, e.g. after a failed shard.
+        for future in futures:
+            if not future.cancelled() and future.exception() is None:
+                release_frame(future.result()[0])
+
+
+def fetch_sharded_queries(
+        params: Sequence[Dict[str, Any]],
+        processes: int,
+        session_options: Dict[str, Any],
+        cache: Any = None,
+        stream: bool = False,
+        max_workers: int = 1,
+        validate: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """Fetches the participants of the given queries in a pool of worker processes like fetch_sharded(), and yields
+    the typed participants of every query, in the order of the queries, as slices of the participants of its shard.
+
+    Parameters
+    ----------
+    params : Sequence[Dict[str, Any]]
+        The URL parameters of the queries.
+    processes : int
+        The number of worker processes.
+    session_options : Dict[str, Any]
+        The fields of the `Session` of the pooling client.
+    cache : ResponseCache, optional
+        The response cache of the pooling client.
+    stream : bool
+        Whether to decode the responses incrementally while they download.
+    max_workers : int
+        The number of threads fetching the queries of a shard concurrently within each worker process.
+    validate : bool
+        Whether to validate the responses against the response models, see `egytech_api.responses`.
+
+    Yields
+    ------
+    pd.DataFrame
+    """
+    shard_frames = fetch_sharded(params, processes, session_options, cache, stream, max_workers, validate)
+    for frame, counts in shard_frames:
+        offsets = np.concatenate([[0], np.cumsum(counts, dtype=np.intp)])
+        for start, stop in zip(offsets[:-1], offsets[1:]):
+            yield frame.iloc[start:stop] if start < stop else pd.DataFrame()
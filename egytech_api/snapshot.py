@@ -0,0 +1,223 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, Field
+
+from .exceptions import APIError
+from .models import (BusinessFocusEnum, BusinessLineEnum, BusinessMarketEnum,
+                     BusinessSizeEnum, GenderEnum, LevelEnum,
+                     ParticipantsQueryParams, TitleEnum)
+from .session import Session, get_session
+
+CATEGORICAL_COLUMNS = {
+    "title": TitleEnum,
+    "level": LevelEnum,
+    "gender": GenderEnum,
+    "business_market": BusinessMarketEnum,
+    "business_size": BusinessSizeEnum,
+    "business_focus": BusinessFocusEnum,
+    "business_line": BusinessLineEnum,
+}
+"""Mapping of participant record columns to the enum that declares their possible values."""
+
+EXCLUSION_COLUMNS = {
+    "include_relocated": "is_relocated",
+    "include_remote_abroad": "is_remote_abroad",
+}
+"""Mapping of `include_*` query parameters to the participant record flag they exclude on."""
+
+SERVER_DEFAULTS = {"include_relocated": False, "include_remote_abroad": False}
+"""Values the API assumes for the `include_*` query parameters when they are omitted."""
+
+FULL_DATASET_PARAMS = {"include_relocated": "true", "include_remote_abroad": "true"}
+"""Query parameters that make the participants endpoint return the unfiltered dataset."""
+
+
+def _value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def _flag(column: pd.Series) -> np.ndarray:
+    if column.dtype != bool:
+        column = column.map(
+            {"yes": True, "no": False, "true": True, "false": False, True: True, False: False}
+        )
+    return column.astype("boolean").fillna(False).to_numpy(dtype=bool)
+
+
+class ParticipantsSnapshot(BaseModel):
+    """Class that downloads the full participants dataset once and answers participants queries locally.
+
+    Every filter of `ParticipantsQueryParams` is applied in-process as a vectorized boolean mask over a typed columnar
+    copy of the dataset, following the semantics of the API: `min_yoe` is inclusive (`yoe_from_included`), `max_yoe`
+    is exclusive (`yoe_to_excluded`) and omitted `include_*` parameters fall back to the server defaults.
+
+    Attributes
+    ----------
+    records : list of dict, optional
+        Participant records to build the snapshot from.
+    frame : pd.DataFrame, optional
+        A participants DataFrame to build the snapshot from. When neither `records` nor `frame` is given, the full
+        dataset is downloaded from the API.
+    session : Session, optional
+        The session holding the shared, long-lived HTTP clients. Defaults to the process-wide session returned by
+        `egytech_api.session.get_session()`.
+    _participants : pd.DataFrame
+        The full participants dataset, with categorical dtypes for the enum-like columns. This can be accessed by
+        calling the get_df() method on your instance of the class.
+
+    Methods
+    -------
+    get_df()
+        Returns the pandas.DataFrame of the full participants dataset.
+    mask(query: ParticipantsQueryParams)
+        Returns the boolean mask of the participants matching the given query.
+    query(query: ParticipantsQueryParams)
+        Returns the pandas.DataFrame of the participants matching the given query.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
+    records: Optional[list[Dict[str, Any]]] = Field(default=None, exclude=True)
+    frame: Optional[pd.DataFrame] = Field(default=None, exclude=True)
+    session: Optional[Session] = Field(default=None, exclude=True)
+    _participants: Optional[pd.DataFrame] = None
+    _codes: Dict[str, np.ndarray] = {}
+    _code_lookup: Dict[str, Dict[str, int]] = {}
+    _flags: Dict[str, np.ndarray] = {}
+    _yoe: Optional[np.ndarray] = None
+
+    def model_post_init(self, __context: Any) -> None:
+        """Placeholder that calls execute_call() when no records or frame were given, then builds the columnar table.
+
+        Parameters
+        ----------
+        __context : Any
+
+        Returns
+        -------
+        None
+        """
+        if self.frame is not None:
+            self._build(self.frame.copy(deep=False))
+            self.frame = None
+        elif self.records is not None:
+            self._build(pd.DataFrame.from_records(self.records))
+            self.records = None
+        else:
+            self.execute_call()
+
+    def execute_call(self) -> None:
+        """Downloads the unfiltered participants dataset from the API.
+
+        Returns
+        -------
+        None
+        """
+        session = get_session() if self.session is None else self.session
+        response = session.client().get("participants", params=FULL_DATASET_PARAMS)
+
+        if response.status_code != 200:
+            raise APIError(response.status_code)
+
+        self._build(pd.DataFrame.from_records(response.json()["results"]))
+
+    def _build(self, frame: pd.DataFrame) -> None:
+        codes, lookup, flags = {}, {}, {}
+        for column, enum in CATEGORICAL_COLUMNS.items():
+            categories = [member.value for member in enum]
+            values = frame[column] if column in frame else pd.Series(None, index=frame.index)
+            frame[column] = pd.Categorical(values, categories=categories)
+            codes[column] = frame[column].cat.codes.to_numpy()
+            lookup[column] = {category: code for code, category in enumerate(categories)}
+
+        if "cs_degree" in frame:
+            flags["cs_degree"] = _flag(frame["cs_degree"])
+            flags["no_cs_degree"] = ~flags["cs_degree"] & frame["cs_degree"].notna().to_numpy()
+
+        for column in EXCLUSION_COLUMNS.values():
+            if column in frame:
+                flags[column] = _flag(frame[column])
+
+        yoe = frame["yoe"] if "yoe" in frame else pd.Series(np.nan, index=frame.index)
+        self._yoe = pd.to_numeric(yoe, errors="coerce").to_numpy(dtype=float)
+        self._participants = frame
+        self._codes, self._code_lookup, self._flags = codes, lookup, flags
+
+    def mask(self, query: ParticipantsQueryParams) -> np.ndarray:
+        """Returns the boolean mask of the participants matching the given query.
+
+        Parameters
+        ----------
+        query : ParticipantsQueryParams
+            The query parameters to filter the participants with.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        mask = np.ones(len(self._participants), dtype=bool)
+
+        for column, codes in self._codes.items():
+            value = getattr(query, column)
+            if value is not None:
+                mask &= codes == self._code_lookup[column][_value(value)]
+
+        if query.min_yoe is not None:
+            mask &= self._yoe >= query.min_yoe
+        if query.max_yoe is not None:
+            mask &= self._yoe < query.max_yoe
+
+        if query.cs_degree is not None:
+            if "cs_degree" not in self._flags:
+                return np.zeros_like(mask)
+            mask &= self._flags["cs_degree" if query.cs_degree else "no_cs_degree"]
+
+        for parameter, column in EXCLUSION_COLUMNS.items():
+            include = getattr(query, parameter)
+            if include is None:
+                include = SERVER_DEFAULTS[parameter]
+            if not include and column in self._flags:
+                mask &= ~self._flags[column]
+
+        return mask
+
+    def query(self, query: ParticipantsQueryParams) -> pd.DataFrame:
+        """Returns the pandas.DataFrame of the participants matching the given query.
+
+        Parameters
+        ----------
+        query : ParticipantsQueryParams
+            The query parameters to filter the participants with.
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        return self._participants[self.mask(query)].reset_index(drop=True)
+
+    def get_df(self) -> pd.DataFrame:
+        """Returns the pandas.DataFrame of the full participants dataset.
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        return self._participants
+
+
+def filter_frame(frame: pd.DataFrame, query: ParticipantsQueryParams) -> pd.DataFrame:
+    """Returns the rows of a participants DataFrame matching the given query, keeping the dtypes of the DataFrame.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        The participants DataFrame to filter.
+    query : ParticipantsQueryParams
+        The query parameters to filter the participants with.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    return frame[ParticipantsSnapshot(frame=frame).mask(query)].reset_index(drop=True)
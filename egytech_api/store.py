@@ -0,0 +1,328 @@
+import json
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict
+
+from .encoding import encode_query
+
+_ALIGNMENT = 64
+
+_MAGIC = b"EGYSTORE"
+_VERSION = 1
+# Magic, format version and length of the JSON header.
+_PREAMBLE = struct.Struct("<8sII")
+
+_MASKED_ARRAYS = {
+    "integer": pd.arrays.IntegerArray,
+    "floating": pd.arrays.FloatingArray,
+    "boolean": pd.arrays.BooleanArray,
+}
+
+
+def _aligned(size: int) -> int:
+    return math.ceil(size / _ALIGNMENT) * _ALIGNMENT
+
+
+def _column_buffers(column: pd.Series) -> tuple[str, Any, list[np.ndarray]]:
+    """Returns the kind of a column, the JSON-serializable metadata needed to rebuild it and the NumPy buffers holding
+    its values."""
+    dtype = column.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return "categorical", list(dtype.categories), [column.cat.codes.to_numpy()]
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        if isinstance(dtype, pd.BooleanDtype):
+            kind = "boolean"
+        elif pd.api.types.is_integer_dtype(dtype):
+            kind = "integer"
+        elif pd.api.types.is_float_dtype(dtype):
+            kind = "floating"
+        else:
+            kind = "object"
+        if kind != "object":
+            mask = column.isna().to_numpy()
+            values = column.to_numpy(dtype=dtype.numpy_dtype, na_value=dtype.numpy_dtype.type(0))
+            return kind, None, [values, mask]
+    elif dtype.kind in "biuf":
+        return "numpy", None, [column.to_numpy()]
+    values = [None if pd.isna(value) else value for value in column.tolist()]
+    return "object", [values, str(dtype)], []
+
+
+def layout_frame(frame: pd.DataFrame) -> tuple[list[tuple], list[np.ndarray], int]:
+    """Returns the columnar layout of a DataFrame in a flat buffer, aligned for zero-copy reads.
+
+    Categorical columns are laid out as their codes, nullable columns as their values and missing-value masks and
+    NumPy columns as their values. Columns of other dtypes (e.g. unexpected string columns) are kept in the metadata.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        The DataFrame to lay out. Its index is not laid out.
+
+    Returns
+    -------
+    tuple
+        The layout of every column as `(name, kind, metadata, [(offset, dtype), ...])`, JSON-serializable; the NumPy
+        buffers to copy at those offsets, in order; and the size of the flat buffer.
+    """
+    columns, buffers, offset = [], [], 0
+    for name, column in frame.items():
+        kind, metadata, column_buffers = _column_buffers(column)
+        layout = []
+        for buffer in column_buffers:
+            layout.append((offset, buffer.dtype.str))
+            offset += _aligned(buffer.nbytes)
+        columns.append((name, kind, metadata, layout))
+        buffers.extend(column_buffers)
+    return columns, buffers, offset
+
+
+def write_buffers(target: Any, columns: Sequence[tuple], buffers: Sequence[np.ndarray], offset: int = 0) -> None:
+    """Copies the buffers of a layout returned by layout_frame() into the given writable buffer.
+
+    Parameters
+    ----------
+    target : buffer
+        The writable buffer, e.g. a block of shared memory or a memory-mapped file.
+    columns : Sequence[tuple]
+        The layout of the columns.
+    buffers : Sequence[np.ndarray]
+        The buffers of the columns.
+    offset : int
+        The position of the flat buffer in `target`.
+
+    Returns
+    -------
+    None
+    """
+    positions = [layout for _, _, _, column_layout in columns for layout in column_layout]
+    for (start, dtype), buffer in zip(positions, buffers):
+        np.ndarray(len(buffer), dtype=dtype, buffer=target, offset=offset + start)[:] = buffer
+
+
+def read_buffers(
+        source: Any, columns: Sequence[tuple], rows: int, offset: int = 0, copy: bool = False
+) -> pd.DataFrame:
+    """Rebuilds a DataFrame from a flat buffer laid out by layout_frame().
+
+    Parameters
+    ----------
+    source : buffer
+        The buffer, e.g. a block of shared memory or a memory-mapped file.
+    columns : Sequence[tuple]
+        The layout of the columns.
+    rows : int
+        The number of rows.
+    offset : int
+        The position of the flat buffer in `source`.
+    copy : bool
+        Whether to copy the values out of the buffer. Otherwise, the columns are views of the buffer, which must stay
+        alive as long as the DataFrame; a read-only buffer gives read-only views that pandas copies on write.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    data = {}
+    for name, kind, metadata, layout in columns:
+        buffers = [
+            np.frombuffer(source, dtype=dtype, count=rows, offset=offset + start) for start, dtype in layout
+        ]
+        if copy:
+            buffers = [buffer.copy() for buffer in buffers]
+        if kind == "categorical":
+            data[name] = pd.Categorical.from_codes(buffers[0], categories=metadata)
+        elif kind in _MASKED_ARRAYS:
+            data[name] = _MASKED_ARRAYS[kind](*buffers)
+        elif kind == "numpy":
+            data[name] = buffers[0]
+        else:
+            values, dtype = metadata
+            data[name] = pd.array(values, dtype=dtype)
+    return pd.DataFrame(data, index=pd.RangeIndex(rows), copy=False)
+
+
+class StoreMetadata(BaseModel):
+    """Model for the metadata header of a snapshot published to a `DatasetStore`.
+
+    Attributes
+    ----------
+    fetched_at : float
+        The UNIX timestamp at which the data was fetched.
+    queries : list of dict
+        The URL parameters of the queries the data was fetched with, empty when unknown.
+    rows : int
+        The number of participants.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    fetched_at: float
+    queries: list[Dict[str, Any]] = []
+    rows: int
+
+
+class DatasetStore(BaseModel):
+    """Class for a local file holding a participants DataFrame in a memory-mapped columnar layout, shared by processes.
+
+    A snapshot starts with a small JSON header (see `StoreMetadata`) followed by the 64-byte aligned buffers of the
+    columns: categorical codes, nullable values and masks, as laid out by `layout_frame()`. Readers map the file
+    read-only and get DataFrames whose columns are views of the mapping, so any number of processes, e.g. web server
+    workers, share one copy of the data in the page cache instead of holding a copy each. Modifying such a DataFrame
+    copies the modified columns.
+
+    Snapshots are published atomically: they are written to a temporary file in the same directory, which then
+    replaces the store with a rename. Readers never see a partial snapshot, and keep their mapping of the previous one
+    until they read again.
+
+    Attributes
+    ----------
+    path : str
+        The path of the store file.
+
+    Methods
+    -------
+    publish(frame: pd.DataFrame, queries: Sequence[BaseModel] = (), fetched_at: float = None)
+        Atomically replaces the snapshot of the store with the given participants.
+    read()
+        Returns the participants of the current snapshot, mapped read-only.
+    get_metadata()
+        Returns the metadata header of the current snapshot.
+
+    Examples
+    --------
+    >>> client = PoolingClient(queries=queries, dtype_backend="numpy_nullable")
+    >>> DatasetStore(path="participants.store").publish(client.get_df(), client.queries)
+
+    In every worker process:
+
+    >>> store = DatasetStore(path="participants.store")
+    >>> participants = store.read()
+    """
+
+    model_config = ConfigDict(extra="forbid")
+    path: str
+    _lock: Any = None
+    _stat: Optional[tuple] = None
+    _frame: Optional[pd.DataFrame] = None
+    _metadata: Optional[StoreMetadata] = None
+
+    def model_post_init(self, __context: Any) -> None:
+        """Placeholder that prepares the lock guarding the current mapping after initialization of the pydantic model.
+
+        Parameters
+        ----------
+        __context : Any
+
+        Returns
+        -------
+        None
+        """
+        self._lock = threading.Lock()
+
+    def publish(
+            self, frame: pd.DataFrame, queries: Sequence[BaseModel] = (), fetched_at: Optional[float] = None
+    ) -> StoreMetadata:
+        """Atomically replaces the snapshot of the store with the given participants.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            The participants, e.g. returned by the get_df() method of a client. Typed DataFrames (`dtype_backend`) are
+            stored as is; the columns of other DataFrames should have NumPy, nullable or categorical dtypes, since
+            columns of other dtypes are stored in the header. The index is not stored.
+        queries : Sequence[BaseModel]
+            The queries the participants were fetched with, stored in the header by their URL parameters.
+        fetched_at : float, optional
+            The UNIX timestamp at which the participants were fetched. Defaults to now.
+
+        Returns
+        -------
+        StoreMetadata
+            The metadata header of the published snapshot.
+        """
+        metadata = StoreMetadata(
+            fetched_at=time.time() if fetched_at is None else fetched_at,
+            queries=[encode_query(query) for query in queries],
+            rows=len(frame),
+        )
+        columns, buffers, size = layout_frame(frame)
+        header = json.dumps({**metadata.model_dump(), "columns": columns}).encode()
+        data = _aligned(_PREAMBLE.size + len(header))
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w+b") as file:
+                file.truncate(max(data + size, 1))
+                with mmap.mmap(file.fileno(), 0) as mapping:
+                    mapping[:_PREAMBLE.size] = _PREAMBLE.pack(_MAGIC, _VERSION, len(header))
+                    mapping[_PREAMBLE.size:_PREAMBLE.size + len(header)] = header
+                    write_buffers(mapping, columns, buffers, data)
+                    mapping.flush()
+                os.fsync(file.fileno())
+            os.chmod(temporary, 0o644)
+            os.replace(temporary, self.path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.unlink(temporary)
+            raise
+        return metadata
+
+    def _load(self) -> tuple[pd.DataFrame, StoreMetadata]:
+        """Maps the current snapshot, unless it is already mapped, and returns its participants and metadata."""
+        with self._lock:
+            with open(self.path, "rb") as file:
+                stat = os.fstat(file.fileno())
+                key = (stat.st_ino, stat.st_dev, stat.st_mtime_ns, stat.st_size)
+                if key != self._stat:
+                    # The mapping outlives the file object, and the snapshot it maps outlives a replacement of the
+                    # store, until every DataFrame viewing it is released.
+                    mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                    magic, version, length = _PREAMBLE.unpack_from(mapping)
+                    if magic != _MAGIC or version != _VERSION:
+                        raise ValueError(f"{self.path} is not a dataset store of version {_VERSION}")
+                    header = json.loads(mapping[_PREAMBLE.size:_PREAMBLE.size + length])
+                    columns = header.pop("columns")
+                    data = _aligned(_PREAMBLE.size + length)
+                    self._metadata = StoreMetadata(**header)
+                    self._frame = read_buffers(mapping, columns, self._metadata.rows, data)
+                    self._stat = key
+            return self._frame, self._metadata
+
+    def read(self) -> pd.DataFrame:
+        """Returns the participants of the current snapshot, mapped read-only without copying them. The snapshot is
+        mapped again only when a new one was published since the last read, so this is cheap to call on every use.
+
+        Returns
+        -------
+        pd.DataFrame
+
+        Raises
+        ------
+        FileNotFoundError
+            If no snapshot was published yet.
+        """
+        return self._load()[0].copy(deep=False)
+
+    def get_metadata(self) -> StoreMetadata:
+        """Returns the metadata header of the current snapshot.
+
+        Returns
+        -------
+        StoreMetadata
+
+        Raises
+        ------
+        FileNotFoundError
+            If no snapshot was published yet.
+        """
+        return self._load()[1]
@@ -0,0 +1,269 @@
+import codecs
+import json
+import re
+from array import array
+from typing import Any, AsyncIterable, Dict, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from .snapshot import CATEGORICAL_COLUMNS
+
+_WHITESPACE = re.compile(r"[\s,]*")
+_decoder = json.JSONDecoder()
+
+
+class _Column:
+    """Typed append-only buffer for the values of one column."""
+
+    def __init__(self, name: str, length: int):
+        enum = CATEGORICAL_COLUMNS.get(name)
+        self.categories = [member.value for member in enum] if enum else None
+        self.lookup = {category: code for code, category in enumerate(self.categories or ())}
+        self.kind = "category" if enum else None
+        self.integral = True
+        self.values: Any = array("b", [-1] * length) if enum else None
+        self.length = length
+
+    def _promote(self, value: Any) -> None:
+        if isinstance(value, bool):
+            self.kind, self.values = "bool", array("b", [-1] * self.length)
+        elif isinstance(value, (int, float)):
+            self.kind, self.values = "number", array("d", [np.nan] * self.length)
+        else:
+            self.kind, self.values = "object", [None] * self.length
+
+    def _fallback(self) -> None:
+        self.values = list(self.finish())
+        self.kind = "object"
+
+    def append(self, value: Any) -> None:
+        if self.kind is None:
+            if value is None:
+                self.length += 1
+                return
+            self._promote(value)
+
+        if self.kind == "category":
+            code = self.lookup.get(value, -1)
+            if code == -1 and value is not None:
+                self._fallback()
+                self.values.append(value)
+            else:
+                self.values.append(code)
+        elif self.kind == "bool":
+            if value is None or isinstance(value, bool):
+                self.values.append(-1 if value is None else int(value))
+            else:
+                self._fallback()
+                self.values.append(value)
+        elif self.kind == "number":
+            if value is None:
+                self.values.append(np.nan)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                self.integral = self.integral and isinstance(value, int)
+                self.values.append(value)
+            else:
+                self._fallback()
+                self.values.append(value)
+        else:
+            self.values.append(value)
+        self.length += 1
+
+    def finish(self) -> Any:
+        """Returns the buffered values as an array suitable for a pandas.DataFrame column."""
+        if self.kind is None:
+            return pd.Series([None] * self.length, dtype=object)
+        if self.kind == "category":
+            return pd.Categorical.from_codes(
+                np.frombuffer(self.values, dtype=np.int8), categories=self.categories
+            )
+        if self.kind == "bool":
+            codes = np.frombuffer(self.values, dtype=np.int8)
+            if (codes == -1).any():
+                return pd.array(np.where(codes == -1, None, codes == 1), dtype="boolean")
+            return codes == 1
+        if self.kind == "number":
+            numbers = np.frombuffer(self.values, dtype=np.float64)
+            if self.integral and not np.isnan(numbers).any():
+                return numbers.astype(np.int64)
+            return numbers
+        return self.values
+
+
+class ColumnBuffers:
+    """Class that accumulates records column by column in typed buffers.
+
+    Enum-like columns are stored as `int8` category codes, numbers as `float64` and booleans as `int8`, so appending
+    a record only keeps its values and not the record itself.
+
+    Methods
+    -------
+    append(record: Dict[str, Any])
+        Appends the values of a record to the buffers.
+    to_frame()
+        Returns the buffered records as a pandas.DataFrame.
+    """
+
+    def __init__(self):
+        self._columns: Dict[str, _Column] = {}
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Appends the values of a record to the buffers.
+
+        Parameters
+        ----------
+        record : Dict[str, Any]
+            The record to append.
+
+        Returns
+        -------
+        None
+        """
+        for name, value in record.items():
+            column = self._columns.get(name)
+            if column is None:
+                column = self._columns[name] = _Column(name, self._length)
+            column.append(value)
+        self._length += 1
+        for column in self._columns.values():
+            if column.length < self._length:
+                column.append(None)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the buffered records as a pandas.DataFrame.
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        return pd.DataFrame(
+            {name: column.finish() for name, column in self._columns.items()},
+            index=pd.RangeIndex(self._length),
+        )
+
+
+class RecordStream:
+    """Class that incrementally extracts the records of a JSON array from a stream of byte chunks.
+
+    Only the array stored under `key` in the top-level JSON object is decoded. Each record is decoded on its own as
+    soon as its bytes have arrived, so the full list of records is never built.
+
+    Parameters
+    ----------
+    key : str
+        The key of the array of records in the top-level JSON object.
+
+    Methods
+    -------
+    feed(chunk: bytes)
+        Feeds a chunk of the response body and yields the records it completes.
+    close()
+        Checks that the whole array was received.
+    """
+
+    def __init__(self, key: str = "results"):
+        self._start = re.compile(r'"' + re.escape(key) + r'"\s*:\s*\[')
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._in_array = False
+        self._done = False
+
+    def feed(self, chunk: bytes) -> Iterator[Dict[str, Any]]:
+        """Feeds a chunk of the response body and yields the records it completes.
+
+        Parameters
+        ----------
+        chunk : bytes
+            The next chunk of the response body.
+
+        Yields
+        ------
+        Dict[str, Any]
+        """
+        if self._done:
+            return
+        self._buffer += self._decoder.decode(chunk)
+
+        if not self._in_array:
+            match = self._start.search(self._buffer)
+            if match is None:
+                return
+            self._buffer = self._buffer[match.end():]
+            self._in_array = True
+
+        position = 0
+        while True:
+            position = _WHITESPACE.match(self._buffer, position).end()
+            if position == len(self._buffer):
+                break
+            if self._buffer[position] == "]":
+                self._done = True
+                break
+            try:
+                record, position = _decoder.raw_decode(self._buffer, position)
+            except json.JSONDecodeError:
+                break
+            yield record
+        self._buffer = "" if self._done else self._buffer[position:]
+
+    def close(self) -> None:
+        """Checks that the whole array was received.
+
+        Returns
+        -------
+        None
+        """
+        if not self._done:
+            raise ValueError("Incomplete or malformed JSON response body")
+
+
+def read_frame(chunks: Iterable[bytes], key: str = "results") -> pd.DataFrame:
+    """Decodes the records of a JSON response body from byte chunks straight into a pandas.DataFrame.
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+        The chunks of the response body, e.g. `httpx.Response.iter_bytes()`.
+    key : str
+        The key of the array of records in the top-level JSON object.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    stream, buffers = RecordStream(key), ColumnBuffers()
+    for chunk in chunks:
+        for record in stream.feed(chunk):
+            buffers.append(record)
+    stream.close()
+    return buffers.to_frame()
+
+
+async def aread_frame(
+        chunks: AsyncIterable[bytes], key: str = "results"
+) -> pd.DataFrame:
+    """Asynchronously decodes the records of a JSON response body from byte chunks straight into a pandas.DataFrame.
+
+    Parameters
+    ----------
+    chunks : AsyncIterable[bytes]
+        The chunks of the response body, e.g. `httpx.Response.aiter_bytes()`.
+    key : str
+        The key of the array of records in the top-level JSON object.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    stream, buffers = RecordStream(key), ColumnBuffers()
+    async for chunk in chunks:
+        for record in stream.feed(chunk):
+            buffers.append(record)
+    stream.close()
+    return buffers.to_frame()
+
@@ -1,9 +1,45 @@
+import asyncio
+import functools
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
 from contextlib import nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import shared_memory
 
+import httpx
+import numpy as np
+import pandas as pd
 import pytest
 from pydantic import ValidationError
 
-from egytech_api.models import ParticipantsQueryParams, StatsQueryParams
+import egytech_api
+import egytech_api.session
+from egytech_api.analytics import SalaryAnalytics
+from egytech_api.cache import ResponseCache
+from egytech_api.coalescing import SingleFlight
+from egytech_api.core import (AsyncParticipants, AsyncPoolingClient, AsyncStats, AsyncStatsPoolingClient,
+                              Participants, PoolingClient, Stats, StatsPoolingClient, fetch_all)
+from egytech_api.cube import STATS_QUANTILES, StatsCube
+from egytech_api.encoding import encode_query
+from egytech_api.exceptions import APIError
+from egytech_api.export import ChunkedWriter, load_feather, load_parquet
+from egytech_api.grid import QueryGrid
+from egytech_api.instrumentation import Instrumentation
+from egytech_api.models import (GenderEnum, LevelEnum, ParticipantsQueryParams, ProgrammingLanguageEnum,
+                                StatsQueryParams, TitleEnum)
+from egytech_api.planner import QueryPlan
+from egytech_api.responses import decode_participants, decode_response, decode_stats
+from egytech_api.scheduler import RetryPolicy, Scheduler
+from egytech_api.schema import PARTICIPANTS_SCHEMA, apply_schema
+from egytech_api.session import API_URL, Session, get_session
+from egytech_api.sharding import pack_frame, shards, unpack_frame
+from egytech_api.snapshot import ParticipantsSnapshot
+from egytech_api.store import DatasetStore
+from egytech_api.streaming import read_frame
 
 
 @pytest.mark.parametrize(
@@ -64,3 +100,1230 @@ class TestStatsQueryParams:
         with expected as e:
             stats = StatsQueryParams(**normal)
             assert stats == e
+
+
+SNAPSHOT_RECORDS = [
+    {"title": "backend", "level": "senior", "yoe": 5, "gender": "male", "cs_degree": True,
+     "business_size": "large", "is_relocated": False, "is_remote_abroad": False, "compensation": 60000},
+    {"title": "backend", "level": "junior", "yoe": 1, "gender": "female", "cs_degree": False,
+     "business_size": "small", "is_relocated": False, "is_remote_abroad": True, "compensation": 20000},
+    {"title": "frontend", "level": "mid_level", "yoe": 3, "gender": "male", "cs_degree": True,
+     "business_size": "medium", "is_relocated": True, "is_remote_abroad": False, "compensation": 35000},
+    {"title": "backend", "level": "mid_level", "yoe": 3, "gender": "male", "cs_degree": False,
+     "business_size": "large", "is_relocated": False, "is_remote_abroad": False, "compensation": 40000},
+]
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ({}, [60000, 40000]),
+        ({"title": "backend"}, [60000, 40000]),
+        ({"title": "backend", "include_remote_abroad": True}, [60000, 20000, 40000]),
+        ({"include_relocated": True, "include_remote_abroad": True}, [60000, 20000, 35000, 40000]),
+        ({"min_yoe": 3, "max_yoe": 5, "include_relocated": True}, [35000, 40000]),
+        ({"min_yoe": 5}, [60000]),
+        ({"cs_degree": False}, [40000]),
+        ({"business_size": "large", "level": "senior"}, [60000]),
+        ({"gender": "female"}, []),
+    ],
+)
+class TestParticipantsSnapshot:
+    def test_query(self, query, expected):
+        snapshot = ParticipantsSnapshot(records=SNAPSHOT_RECORDS)
+        result = snapshot.query(ParticipantsQueryParams(**query))
+        assert result["compensation"].tolist() == expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        {},
+        {"title": "backend", "include_remote_abroad": True},
+        {"include_relocated": True, "include_remote_abroad": True},
+        {"min_yoe": 3, "max_yoe": 5, "include_relocated": True},
+        {"cs_degree": False},
+        {"gender": "female"},
+    ],
+)
+class TestStatsCube:
+    def test_matches_snapshot(self, query):
+        snapshot = ParticipantsSnapshot(records=SNAPSHOT_RECORDS)
+        cube = StatsCube(snapshot=snapshot)
+        compensations = snapshot.query(ParticipantsQueryParams(**query))["compensation"].to_numpy(dtype=float)
+        stats = cube.get_stats(StatsQueryParams(**query))
+        assert stats["totalCount"] == len(compensations)
+        if len(compensations):
+            assert stats["median"] == np.median(compensations)
+            assert stats["p90Compensation"] == np.percentile(compensations, 90)
+        else:
+            assert stats["median"] is None
+        buckets = cube.get_df(StatsQueryParams(**query))
+        assert buckets["count"].sum() == len(compensations)
+        assert buckets["bucket"].iloc[[0, -1]].tolist() == ["0-10K", "60K+"]
+
+    def test_answers_stats_clients(self, query, install_handler):
+        install_handler(lambda request: pytest.fail("the cube should answer without calling the API"))
+        cube = StatsCube(snapshot=ParticipantsSnapshot(records=SNAPSHOT_RECORDS), bucket_edges=[0, 30000])
+        expected = cube.get_stats(StatsQueryParams(**query))
+        assert Stats(**query, cube=cube).get_stats() == expected
+        assert Stats(**query, cube=cube).get_df()["bucket"].tolist() == ["0-30K", "30K+"]
+        for client_class in (StatsPoolingClient, AsyncStatsPoolingClient):
+            client = client_class(queries=[StatsQueryParams(**query)] * 2, cube=cube, dtype_backend="numpy_nullable")
+            assert client.get_stats()["totalCount"].tolist() == [expected["totalCount"]] * 2
+
+    def test_rejects_programming_language(self, query):
+        cube = StatsCube(snapshot=ParticipantsSnapshot(records=SNAPSHOT_RECORDS))
+        with pytest.raises(ValueError):
+            cube.get_stats(StatsQueryParams(**query, programming_language="python"))
+
+
+@pytest.fixture
+def install_handler(monkeypatch):
+    """Returns a function routing every HTTP request made by the package to the given in-memory handler."""
+
+    def install(handler):
+        transport = httpx.MockTransport(handler)
+        monkeypatch.setattr(httpx, "Client", functools.partial(httpx.Client, transport=transport))
+        monkeypatch.setattr(httpx, "AsyncClient", functools.partial(httpx.AsyncClient, transport=transport))
+        monkeypatch.setattr(egytech_api.session, "_default_session", None)
+
+    return install
+
+
+def serve_snapshot(records, requests=None):
+    """Returns a handler answering participants requests like the API would, from the given records."""
+    snapshot = ParticipantsSnapshot(records=records)
+    aliases = {"yoe_from_included": "min_yoe", "yoe_to_excluded": "max_yoe"}
+    booleans = {"yes": True, "no": False, "true": True, "false": False}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        params = {}
+        for name, value in request.url.params.items():
+            name = aliases.get(name, name)
+            params[name] = int(value) if name in ("min_yoe", "max_yoe") else booleans.get(value, value)
+        frame = snapshot.query(ParticipantsQueryParams(**params)).astype(object)
+        return httpx.Response(200, json={"results": frame.where(frame.notna(), None).to_dict("records")})
+
+    return handler
+
+
+@pytest.fixture
+def api(install_handler):
+    """Serves a single participant for every request, with an `ETag`, and records the requests."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, json={"results": SNAPSHOT_RECORDS[:1]}, headers={"etag": '"v1"'}
+        )
+
+    install_handler(handler)
+    return requests
+
+
+class TestResponseCache:
+    def test_warm_cache_skips_network(self, api, tmp_path):
+        cache = ResponseCache(directory=str(tmp_path))
+        first = Participants(title="backend", cache=cache).get_df()
+        second = Participants(title="backend", cache=cache).get_df()
+        assert len(api) == 1
+        assert first.equals(second)
+
+    def test_stale_entry_is_revalidated(self, api, tmp_path):
+        cache = ResponseCache(directory=str(tmp_path), ttl=0)
+        Participants(title="backend", cache=cache)
+        participants = Participants(title="backend", cache=cache)
+        assert len(api) == 2
+        assert api[1].headers["if-none-match"] == '"v1"'
+        assert len(participants.get_df()) == 1
+
+    def test_eviction_respects_byte_budget(self, api, tmp_path):
+        body_size = len(httpx.Response(200, json={"results": SNAPSHOT_RECORDS[:1]}).content)
+        cache = ResponseCache(directory=str(tmp_path), max_bytes=body_size)
+        Participants(title="backend", cache=cache)
+        Participants(title="frontend", cache=cache)
+        assert len(list(tmp_path.glob("*.body"))) == 1
+
+    def test_concurrent_writers_of_an_entry(self, tmp_path):
+        cache = ResponseCache(directory=str(tmp_path))
+        errors = []
+
+        def write(writer):
+            try:
+                for version in range(50):
+                    cache.store("participants", {"title": "backend"}, f'{{"v": {writer}{version}}}'.encode(), {})
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=write, args=(writer,)) for writer in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        assert "v" in cache.load("participants", {"title": "backend"}).decode()
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_store_scans_directory_only_over_budget(self, tmp_path, monkeypatch):
+        cache = ResponseCache(directory=str(tmp_path), max_bytes=100)
+        cache.store("participants", {"title": "backend"}, b"x" * 40, {})
+        scans = []
+        scandir = os.scandir
+        monkeypatch.setattr(os, "scandir", lambda path: scans.append(path) or scandir(path))
+        cache.store("participants", {"title": "frontend"}, b"x" * 40, {})
+        cache.store("participants", {"title": "frontend"}, b"x" * 50, {})
+        assert not scans
+        cache.store("participants", {"title": "mobile"}, b"x" * 40, {})
+        assert len(scans) == 1 and len(list(tmp_path.glob("*.body"))) == 2
+
+    def test_entry_evicted_while_loading_is_returned(self, tmp_path, monkeypatch):
+        cache = ResponseCache(directory=str(tmp_path))
+        cache.store("participants", {"title": "backend"}, b'{"results": []}', {})
+
+        def evicted(path, *args, **kwargs):
+            cache.clear()
+            raise FileNotFoundError(path)
+
+        monkeypatch.setattr(os, "utime", evicted)
+        assert cache.load("participants", {"title": "backend"}).body == b'{"results": []}'
+        assert cache.load("participants", {"title": "backend"}) is None
+
+
+class TestScheduler:
+    def test_transient_errors_are_retried(self):
+        attempts = []
+
+        async def call(query):
+            attempts.append(query)
+            if len(attempts) < 3:
+                raise APIError(503)
+            return query
+
+        scheduler = Scheduler(retry=RetryPolicy(backoff_base=0))
+        [result] = asyncio.run(scheduler.run(call, ["q"]))
+        assert result.ok and result.value == "q" and result.attempts == 3
+
+    def test_failures_are_isolated(self):
+        async def call(query):
+            if query == "bad":
+                raise APIError(404)
+            return query
+
+        results = asyncio.run(Scheduler().run(call, ["a", "bad", "b"]))
+        assert [result.ok for result in results] == [True, False, True]
+        assert results[1].attempts == 1 and results[1].error.status_code == 404
+
+    def test_max_in_flight(self):
+        in_flight, peak = [0], [0]
+
+        async def call(query):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.001)
+            in_flight[0] -= 1
+
+        asyncio.run(Scheduler(max_in_flight=3).run(call, range(20)))
+        assert peak[0] == 3
+
+    @pytest.mark.parametrize("ordered, expected", [(True, [0, 1, 2, 3]), (False, [1, 0, 3, 2])])
+    def test_iterate_applies_backpressure(self, ordered, expected):
+        started = []
+
+        async def call(query):
+            started.append(query)
+            await asyncio.sleep({0: 0.03, 2: 0.1}.get(query, 0))
+            return query
+
+        async def consume():
+            values = []
+            async for result in Scheduler(max_in_flight=2).iterate(call, iter(range(4)), ordered=ordered):
+                assert len(started) <= len(values) + 3
+                values.append(result.value)
+            return values
+
+        assert asyncio.run(consume()) == expected
+
+    def test_async_pooling_client_keeps_partial_results(self, install_handler):
+        def handler(request):
+            if request.url.params["title"] == "frontend":
+                return httpx.Response(500)
+            return httpx.Response(200, json={"results": SNAPSHOT_RECORDS[:1]})
+
+        install_handler(handler)
+        client = AsyncPoolingClient(
+            queries=[ParticipantsQueryParams(title="backend"), ParticipantsQueryParams(title="frontend")],
+            scheduler=Scheduler(retry=RetryPolicy(backoff_base=0)),
+        )
+        assert len(client.get_df()) == 1
+        assert [result.attempts for result in client.get_report()] == [1, 4]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+class TestStreaming:
+    def test_read_frame_matches_from_records(self, chunk_size):
+        body = json.dumps({"count": 4, "results": SNAPSHOT_RECORDS}).encode()
+        frame = read_frame(body[i:i + chunk_size] for i in range(0, len(body), chunk_size))
+        expected = pd.DataFrame.from_records(SNAPSHOT_RECORDS)
+        assert frame.astype(object).equals(expected.astype(object))
+        assert frame["title"].dtype == "category"
+
+    def test_missing_and_unknown_values(self, chunk_size):
+        records = SNAPSHOT_RECORDS[:1] + [{"title": "unknown", "yoe": None}]
+        body = json.dumps({"results": records}).encode()
+        frame = read_frame(body[i:i + chunk_size] for i in range(0, len(body), chunk_size))
+        assert frame["title"].tolist() == ["backend", "unknown"]
+        assert frame["yoe"].isna().tolist() == [False, True]
+        assert frame["cs_degree"].isna().tolist() == [False, True]
+
+    def test_truncated_body_raises(self, chunk_size):
+        body = json.dumps({"results": SNAPSHOT_RECORDS}).encode()[:-5]
+        with pytest.raises(ValueError):
+            read_frame(body[i:i + chunk_size] for i in range(0, len(body), chunk_size))
+
+    def test_streaming_clients(self, chunk_size, install_handler):
+        install_handler(lambda request: httpx.Response(200, json={"results": SNAPSHOT_RECORDS}))
+        queries = [ParticipantsQueryParams(title="backend"), ParticipantsQueryParams(title="frontend")]
+        assert len(Participants(title="backend", stream=True).get_df()) == 4
+        assert len(PoolingClient(queries=queries, stream=True).get_df()) == 8
+        assert len(AsyncPoolingClient(queries=queries, stream=True).get_df()) == 8
+
+
+class TestQueryPlan:
+    def test_duplicates_and_contained_queries_are_not_fetched(self):
+        queries = [
+            ParticipantsQueryParams(title="backend", cs_degree=True),
+            ParticipantsQueryParams(title="backend"),
+            ParticipantsQueryParams(title="backend", include_relocated=False),
+            ParticipantsQueryParams(min_yoe=3, max_yoe=5),
+            ParticipantsQueryParams(title="backend", min_yoe=3, max_yoe=4),
+        ]
+        plan = QueryPlan.build(queries)
+        assert plan.fetch == [queries[1], queries[3]]
+        assert plan.sources == [0, 0, 0, 1, 0]
+
+    def test_wider_include_flags_contain_narrower_ones(self):
+        queries = [
+            ParticipantsQueryParams(include_relocated=True),
+            ParticipantsQueryParams(),
+            ParticipantsQueryParams(include_remote_abroad=True),
+        ]
+        assert QueryPlan.build(queries).fetch == [queries[0], queries[2]]
+
+    def test_large_grids_are_planned_quickly(self):
+        grid = QueryGrid(
+            dimensions={"level": LevelEnum, "title": TitleEnum, "gender": GenderEnum, "cs_degree": [True, False]}
+        )
+        queries = [*grid.queries(), ParticipantsQueryParams(title="backend")]
+        started = time.perf_counter()
+        plan = QueryPlan.build(queries)
+        assert time.perf_counter() - started < 1
+        assert len(plan.fetch) == len(queries) - len(LevelEnum) * len(GenderEnum) * 2
+        backend = [source for query, source in zip(queries, plan.sources) if query.title == "backend"]
+        assert len(backend) > 1 and all(plan.fetch[source] == queries[-1] for source in backend)
+
+    @pytest.mark.parametrize("client_class", [PoolingClient, AsyncPoolingClient])
+    def test_planned_results_match_unplanned(self, client_class, install_handler):
+        requests = []
+        install_handler(serve_snapshot(SNAPSHOT_RECORDS, requests))
+        queries = [
+            ParticipantsQueryParams(title="backend", cs_degree=True),
+            ParticipantsQueryParams(title="backend", include_remote_abroad=True),
+            ParticipantsQueryParams(title="backend", min_yoe=3),
+            ParticipantsQueryParams(title="backend", include_remote_abroad=True),
+        ]
+        expected = client_class(queries=queries).get_df()
+        requests.clear()
+        planned = client_class(queries=queries, plan_queries=True).get_df()
+        assert len(requests) == 1
+        assert planned.equals(expected)
+
+
+class TestQueryGrid:
+    def test_cells_match_validated_queries(self):
+        grid = QueryGrid(
+            dimensions={"title": ["backend", "frontend"], "min_yoe,max_yoe": [(0, 3), (3, 6)], "gender": GenderEnum},
+            base={"include_relocated": True},
+        )
+        assert len(grid) == 8
+        assert list(grid.queries())[5] == ParticipantsQueryParams(
+            title="frontend", min_yoe=0, max_yoe=3, gender="female", include_relocated=True
+        )
+        assert list(grid.keys())[5] == ("frontend", (0, 3), "female")
+
+    def test_invalid_values_are_rejected(self):
+        with pytest.raises(ValidationError):
+            QueryGrid(dimensions={"title": ["backend", "nope"]})
+        with pytest.raises(ValidationError):
+            QueryGrid(dimensions={"programming_language": ["python"]})
+
+    @pytest.mark.parametrize("client_class", [PoolingClient, AsyncPoolingClient])
+    def test_fetch_is_indexed_by_grid(self, client_class, install_handler):
+        install_handler(serve_snapshot(SNAPSHOT_RECORDS))
+        grid = QueryGrid(dimensions={"title": ["backend", "frontend"], "level": ["mid_level", "senior"]})
+        frame = grid.fetch(client_class)
+        assert frame.index.names == ["title", "level", None]
+        assert frame.index.tolist() == [("backend", "mid_level", 0), ("backend", "senior", 0)]
+        assert frame["compensation"].tolist() == [40000, 60000]
+
+
+def serve_stats(requests=None):
+    """Returns a handler answering stats requests with statistics derived from the programming language."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        language = request.url.params.get("programming_language", "any")
+        return httpx.Response(200, json={
+            "stats": {"totalCount": len(language), "median": 1000 * len(language)},
+            "buckets": [{"bucket": "0-10K", "count": 1}, {"bucket": "10K-20K", "count": len(language) - 1}],
+        })
+
+    return handler
+
+
+@pytest.mark.parametrize("client_class", [StatsPoolingClient, AsyncStatsPoolingClient])
+class TestStatsPoolingClient:
+    def test_results_are_keyed_by_query(self, client_class, install_handler):
+        install_handler(serve_stats())
+        queries = [StatsQueryParams(programming_language="python"), StatsQueryParams(programming_language="go")]
+        client = client_class(queries=queries)
+        assert client.get_stats()["median"].tolist() == [6000, 2000]
+        assert client.get_stats().index.tolist() == [(0,), (1,)]
+        assert client.get_df().loc[(1, 1), "count"] == 1
+
+    def test_grid_of_stats(self, client_class, install_handler):
+        requests = []
+        install_handler(serve_stats(requests))
+        grid = QueryGrid(
+            dimensions={"programming_language": ProgrammingLanguageEnum, "title": ["backend", "frontend"]},
+            query_class=StatsQueryParams,
+        )
+        stats = grid.client(client_class).get_stats()
+        assert len(requests) == len(stats) == 28
+        assert stats.loc[("type_script", "frontend"), "totalCount"] == len("type_script")
+
+
+class TestSession:
+    def test_connections_are_reused(self, install_handler):
+        install_handler(serve_snapshot(SNAPSHOT_RECORDS))
+        session = Session()
+        with session:
+            Participants(title="backend", session=session)
+            client = session.client()
+            Participants(title="frontend", session=session)
+            assert session.client() is client
+        assert client.is_closed
+
+    def test_default_session_is_shared(self, install_handler):
+        install_handler(serve_snapshot(SNAPSHOT_RECORDS))
+        assert get_session() is get_session()
+        PoolingClient(queries=[ParticipantsQueryParams(title="backend")])
+        client = get_session().client()
+        Participants(title="backend")
+        assert get_session().client() is client
+
+    def test_async_clients_are_per_event_loop(self, install_handler):
+        install_handler(serve_snapshot(SNAPSHOT_RECORDS))
+        session = Session()
+
+        async def get_client():
+            return session.async_client(), session.async_client()
+
+        first, second = asyncio.run(get_client()), asyncio.run(get_client())
+        assert first[0] is first[1]
+        assert first[0] is not second[0]
+        client = AsyncPoolingClient(queries=[ParticipantsQueryParams(title="backend")], session=session)
+        assert len(client.get_df()) == 2
+
+
+class TestLazyExecution:
+    @pytest.mark.parametrize("client_class", [PoolingClient, AsyncPoolingClient])
+    def test_construction_defers_calls(self, client_class, install_handler):
+        requests = []
+        install_handler(serve_snapshot(SNAPSHOT_RECORDS, requests))
+        client = client_class(queries=[ParticipantsQueryParams(title="backend")], lazy=True)
+        copy = client.model_copy(
+            update={"queries": [ParticipantsQueryParams(title="frontend", include_relocated=True)]}
+        )
+        assert requests == []
+        assert client.get_df()["compensation"].tolist() == [60000, 40000]
+        assert client.get_df() is client.fetch().get_df()
+        assert len(requests) == 1
+        assert copy.get_df()["compensation"].tolist() == [35000]
+
+    def test_fetch_all_batches_deferred_objects(self, install_handler):
+        requests = []
+        handlers = {"participants": serve_snapshot(SNAPSHOT_RECORDS, requests), "stats": serve_stats(requests)}
+        install_handler(lambda request: handlers[request.url.path.strip("/")](request))
+        deferred = [
+            Participants(title="backend", lazy=True),
+            Participants(title="frontend", include_relocated=True, lazy=True),
+            Stats(programming_language="python", lazy=True),
+            StatsPoolingClient(queries=[StatsQueryParams(programming_language="go")], lazy=True),
+        ]
+        assert requests == []
+        assert fetch_all(deferred) == deferred
+        assert len(requests) == 4
+        assert deferred[1].get_df()["compensation"].tolist() == [35000]
+        assert deferred[2].get_stats()["median"] == 6000
+        assert deferred[3].get_stats()["median"].tolist() == [2000]
+        assert len(requests) == 4
+
+
+class TestSchema:
+    def test_participants_are_typed(self):
+        records = SNAPSHOT_RECORDS + [{"title": "quantum", "level": None, "yoe": None, "compensation": None}]
+        frame = apply_schema(pd.DataFrame.from_records(records), PARTICIPANTS_SCHEMA)
+        assert frame["level"].dtype == PARTICIPANTS_SCHEMA["level"]
+        assert frame["title"].tolist()[-1] == "quantum"
+        assert str(frame["yoe"].dtype) == "Int8"
+        assert str(frame["cs_degree"].dtype) == "boolean"
+        assert frame["compensation"].isna().tolist() == [False] * 4 + [True]
+
+    def test_typed_frame_is_smaller(self):
+        frame = pd.DataFrame.from_records(SNAPSHOT_RECORDS * 1000)
+        typed = apply_schema(frame, PARTICIPANTS_SCHEMA)
+        assert typed.memory_usage(deep=True).sum() * 4 < frame.memory_usage(deep=True).sum()
+        pd.testing.assert_frame_equal(typed.astype(object), frame.astype(object), check_dtype=False)
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_clients_apply_schema(self, stream, install_handler):
+        install_handler(serve_snapshot(SNAPSHOT_RECORDS))
+        queries = [ParticipantsQueryParams(title="backend"), ParticipantsQueryParams(title="frontend")]
+        frame = AsyncPoolingClient(queries=queries, stream=stream, dtype_backend="numpy_nullable").get_df()
+        assert frame["title"].dtype == PARTICIPANTS_SCHEMA["title"]
+        assert str(frame["compensation"].dtype) == "Float64"
+
+    def test_pyarrow_backend(self):
+        pytest.importorskip("pyarrow")
+        frame = apply_schema(pd.DataFrame.from_records(SNAPSHOT_RECORDS), PARTICIPANTS_SCHEMA, "pyarrow")
+        assert str(frame["yoe"].dtype) == "int8[pyarrow]"
+        assert frame["title"].dtype == PARTICIPANTS_SCHEMA["title"]
+
+    def test_buckets_keep_api_order(self, install_handler):
+        install_handler(serve_stats())
+        buckets = Stats(programming_language="python", dtype_backend="numpy_nullable").get_df()
+        assert buckets["bucket"].cat.categories.tolist() == ["0-10K", "10K-20K"]
+        assert str(buckets["count"].dtype) == "Int32"
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        ParticipantsQueryParams(),
+        ParticipantsQueryParams(title="backend", min_yoe=2, max_yoe=5, cs_degree=False, include_relocated=True),
+        StatsQueryParams(level="senior", gender="female", business_line="b2b", programming_language="python"),
+        next(QueryGrid(dimensions={"title": ["frontend"]}, base={"cs_degree": True}).queries()),
+    ],
+)
+class TestQueryEncoder:
+    def test_matches_pydantic_serialization(self, query):
+        assert encode_query(query) == query.model_dump(mode="json", exclude_none=True, by_alias=True)
+
+    def test_clients_send_encoded_params(self, query, install_handler):
+        requests = []
+        handlers = {"participants": serve_snapshot(SNAPSHOT_RECORDS, requests), "stats": serve_stats(requests)}
+        install_handler(lambda request: handlers[request.url.path.strip("/")](request))
+        client_class = Stats if isinstance(query, StatsQueryParams) else Participants
+        client = client_class(**{field: getattr(query, field) for field in query.model_fields_set})
+        assert dict(requests[0].url.params) == {key: str(value) for key, value in encode_query(query).items()}
+        assert encode_query(client) == encode_query(query)
+
+
+class TestExport:
+    def test_missing_pyarrow_is_reported(self, monkeypatch, tmp_path):
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        participants = Participants(snapshot=ParticipantsSnapshot(records=SNAPSHOT_RECORDS))
+        with pytest.raises(ImportError, match="pyarrow"):
+            participants.save_parquet(str(tmp_path / "participants"))
+        with pytest.raises(ImportError, match="pyarrow"):
+            ChunkedWriter(str(tmp_path / "participants"))
+
+    @pytest.mark.parametrize("save, load", [("save_parquet", load_parquet), ("save_feather", load_feather)])
+    def test_round_trip_keeps_index_and_dtypes(self, save, load, tmp_path):
+        pytest.importorskip("pyarrow")
+        grid = QueryGrid(dimensions={"title": ["backend", "frontend"]}, base={"include_relocated": True})
+        client = grid.client(PoolingClient, snapshot=ParticipantsSnapshot(records=SNAPSHOT_RECORDS),
+                             dtype_backend="numpy_nullable")
+        getattr(client, save)(str(tmp_path / "pooled"))
+        loaded = load(str(tmp_path / "pooled"))
+        assert isinstance(loaded["title"].dtype, pd.CategoricalDtype)
+        pd.testing.assert_frame_equal(
+            loaded, client.get_df(), check_dtype=False, check_categorical=False, check_index_type=False
+        )
+
+    @pytest.mark.parametrize("save, load", [("save_parquet", load_parquet), ("save_feather", load_feather)])
+    def test_async_stats_pooling_client_saves_buckets(self, save, load, install_handler, monkeypatch, tmp_path):
+        install_handler(serve_stats())
+        client = AsyncStatsPoolingClient(
+            queries=[StatsQueryParams(programming_language="python"), StatsQueryParams(programming_language="go")]
+        )
+        with monkeypatch.context() as patch:
+            patch.setitem(sys.modules, "pyarrow", None)
+            with pytest.raises(ImportError, match="pyarrow"):
+                getattr(client, save)(str(tmp_path / "buckets"))
+        pytest.importorskip("pyarrow")
+        getattr(client, save)(str(tmp_path / "buckets"))
+        pd.testing.assert_frame_equal(
+            load(str(tmp_path / "buckets")), client.get_df(), check_dtype=False, check_index_type=False
+        )
+
+    @pytest.mark.parametrize("format, load", [("parquet", load_parquet), ("feather", load_feather)])
+    def test_chunked_writer_appends_every_query(self, format, load, install_handler, tmp_path):
+        pytest.importorskip("pyarrow")
+        install_handler(serve_snapshot(SNAPSHOT_RECORDS))
+        queries = [ParticipantsQueryParams(title=title) for title in ("frontend", "backend", "backend")]
+        with ChunkedWriter(str(tmp_path / "chunks"), format=format) as writer:
+            client = AsyncPoolingClient(queries=queries, writer=writer)
+        frame = load(str(tmp_path / "chunks")).sort_values("query", kind="stable")
+        assert frame["query"].tolist() == [1, 1, 2, 2]
+        assert frame["compensation"].tolist() == client.get_df()["compensation"].tolist()
+
+    def test_duplicate_queries_are_written_to_their_slots(self, install_handler):
+        class RecordingWriter(ChunkedWriter):
+            def __init__(self):
+                self.chunks = []
+
+            def write(self, frame):
+                self.chunks.append(frame)
+
+        requests, serve = [], serve_snapshot(SNAPSHOT_RECORDS)
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(404) if len(requests) == 1 else serve(request)
+
+        install_handler(handler)
+        query = ParticipantsQueryParams(title="backend")
+        writer = RecordingWriter()
+        client = AsyncPoolingClient(queries=[query, query], writer=writer)
+        assert [result.ok for result in client.get_report()] == [False, True]
+        assert all(result.query is query for result in client.get_report())
+        assert [chunk["query"].unique().tolist() for chunk in writer.chunks] == [[1]]
+
+
+class TestResultIterators:
+    def test_iter_results_yields_every_query(self, install_handler):
+        requests = []
+        install_handler(serve_snapshot(SNAPSHOT_RECORDS, requests))
+        queries = [ParticipantsQueryParams(title="backend"), ParticipantsQueryParams(cs_degree=False)]
+        results = PoolingClient(queries=queries, lazy=True).iter_results()
+        query, participants = next(results)
+        assert len(requests) == 1
+        assert query is queries[0] and participants["compensation"].tolist() == [60000, 40000]
+        assert [participants["compensation"].tolist() for _, participants in results] == [[40000]]
+
+    def test_iter_results_in_completion_order(self, install_handler):
+        serve = serve_snapshot(SNAPSHOT_RECORDS)
+
+        def handler(request):
+            if request.url.params["title"] == "backend":
+                time.sleep(0.2)
+            return serve(request)
+
+        install_handler(handler)
+        queries = [ParticipantsQueryParams(title=title) for title in ("backend", "frontend", "mobile")]
+        client = PoolingClient(queries=queries, max_workers=2, lazy=True)
+        assert [query.title for query, _ in client.iter_results()] == ["backend", "frontend", "mobile"]
+        results = list(client.iter_results(order="completion"))
+        assert [query.title for query, _ in results] == ["frontend", "mobile", "backend"]
+        assert results[2][1]["compensation"].tolist() == [60000, 40000]
+
+    def test_aiter_results_reports_failures(self, install_handler):
+        def handler(request):
+            if request.url.params["title"] == "frontend":
+                return httpx.Response(404)
+            return serve_snapshot(SNAPSHOT_RECORDS)(request)
+
+        install_handler(handler)
+        queries = [ParticipantsQueryParams(title=title) for title in ("backend", "frontend", "backend")]
+        client = AsyncPoolingClient(queries=queries, lazy=True)
+
+        async def consume():
+            return [(query.title, participants) async for query, participants in client.aiter_results()]
+
+        results = asyncio.run(consume())
+        assert [title for title, _ in results] == ["backend", "frontend", "backend"]
+        assert results[1][1] is None and len(results[2][1]) == 2
+
+
+class TestThreadPool:
+    def test_queries_are_fetched_concurrently_in_order(self, install_handler):
+        lock, in_flight, peak = threading.Lock(), [0], [0]
+        serve = serve_snapshot(SNAPSHOT_RECORDS)
+
+        def handler(request):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return serve(request)
+
+        install_handler(handler)
+        queries = [
+            ParticipantsQueryParams(title=title, include_relocated=True) for title in ["backend", "frontend"] * 4
+        ]
+        frame = PoolingClient(queries=queries, max_workers=4, keys=[(i,) for i in range(8)]).get_df()
+        assert 1 < peak[0] <= 4
+        assert frame.index.get_level_values(0).tolist() == [0, 0, 1, 2, 2, 3, 4, 4, 5, 6, 6, 7]
+        install_handler(serve_stats())
+        stats = StatsPoolingClient(queries=[StatsQueryParams()] * 4, max_workers=2).get_stats()
+        assert len(stats) == 4
+
+    def test_async_clients_inside_running_loop(self, install_handler):
+        install_handler(serve_snapshot(SNAPSHOT_RECORDS))
+
+        async def handler():
+            return AsyncPoolingClient(queries=[ParticipantsQueryParams(title="backend")]).get_df()
+
+        assert len(asyncio.run(handler())) == 2
+
+
+class TestInstrumentation:
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_participants_phases_and_hooks(self, install_handler, stream):
+        install_handler(serve_snapshot(SNAPSHOT_RECORDS))
+        spans = []
+        participants = Participants(
+            title="backend", stream=stream, instrumentation=Instrumentation(hooks=[spans.append])
+        )
+        summary = participants.get_summary()
+        [span] = spans
+        assert summary.requests == 1 and summary.errors == 0 and summary.spans == spans
+        assert span.endpoint == "participants" and span.params == {"title": "backend"} and span.status_code == 200
+        expected = ["wait", "download", "frame"] if stream else ["wait", "download", "decode", "frame"]
+        assert list(span.phases) == expected
+        assert span.duration == pytest.approx(sum(span.phases.values()))
+        assert span.bytes_sent > 0 and span.bytes_received == summary.bytes_received > 0
+
+    def test_uninstrumented_client_has_no_summary(self, install_handler):
+        install_handler(serve_stats())
+        assert Stats().get_summary() is None
+
+    def test_cache_hits_are_counted(self, api, tmp_path):
+        cache = ResponseCache(directory=str(tmp_path))
+        Participants(title="backend", cache=cache)
+        summary = Participants(title="backend", cache=cache, instrumentation=Instrumentation()).get_summary()
+        assert summary.cached == 1 and summary.bytes_received == 0
+        assert list(summary.spans[0].phases) == ["decode", "frame"]
+
+    def test_retries_and_errors(self, install_handler):
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"results": SNAPSHOT_RECORDS[:1]})
+
+        install_handler(handler)
+        client = AsyncPoolingClient(
+            queries=[ParticipantsQueryParams(title="backend"), ParticipantsQueryParams(title="frontend")],
+            scheduler=Scheduler(retry=RetryPolicy(backoff_base=0)),
+            instrumentation=Instrumentation(),
+        )
+        summary = client.get_summary()
+        assert summary.requests == 3 and summary.errors == 1 and summary.retries == 1
+        assert "APIError" in next(span.error for span in summary.spans if span.error is not None)
+        assert summary.aggregate_seconds > 0
+
+    @pytest.mark.parametrize(
+        "client_class, retries",
+        [(PoolingClient, None), (AsyncPoolingClient, 0), (StatsPoolingClient, None), (AsyncStatsPoolingClient, 0)],
+    )
+    def test_retries_are_only_counted_by_retrying_clients(self, install_handler, client_class, retries):
+        install_handler(serve_stats() if "Stats" in client_class.__name__ else serve_snapshot(SNAPSHOT_RECORDS))
+        query_class = StatsQueryParams if "Stats" in client_class.__name__ else ParticipantsQueryParams
+        client = client_class(queries=[query_class(title="backend")], instrumentation=Instrumentation())
+        assert client.get_summary().retries == retries
+
+    @pytest.mark.parametrize("client_class", [StatsPoolingClient, AsyncStatsPoolingClient])
+    def test_stats_pooling_clients(self, install_handler, client_class):
+        install_handler(serve_stats())
+        queries = [StatsQueryParams(programming_language=language) for language in ["python", "go", "rust"]]
+        summary = client_class(queries=queries, instrumentation=Instrumentation()).get_summary()
+        assert summary.requests == 3 and summary.phases["wait"].p99 >= summary.phases["wait"].p50
+        assert sorted(span.params["programming_language"] for span in summary.spans) == ["go", "python", "rust"]
+
+
+@pytest.mark.parametrize("validators", [True, False])
+class TestIncrementalRefresh:
+    @pytest.fixture
+    def dataset(self, install_handler, validators):
+        """Serves versioned results per title, with `ETag` validators or without, and records every request."""
+        results = {"backend": SNAPSHOT_RECORDS[:2], "frontend": SNAPSHOT_RECORDS[2:3], "mobile": []}
+        requests = []
+
+        def handler(request):
+            title = request.url.params["title"]
+            if results[title] is None:
+                return httpx.Response(503)
+            body = json.dumps({"results": results[title]}).encode()
+            etag = f'"{hash(body)}"'
+            requests.append((title, request.headers.get("if-none-match") == etag))
+            if validators and request.headers.get("if-none-match") == etag:
+                return httpx.Response(304)
+            return httpx.Response(200, content=body, headers={"etag": etag} if validators else {})
+
+        install_handler(handler)
+        return results, requests
+
+    @pytest.mark.parametrize("keys", [None, [("b",), ("f",), ("m",)]])
+    def test_refresh_patches_changed_results(self, dataset, keys, validators):
+        results, requests = dataset
+        queries = [ParticipantsQueryParams(title=title) for title in results]
+        client = PoolingClient(queries=queries, keys=keys, incremental=True, dtype_backend="numpy_nullable")
+        assert client.refresh() == []
+        assert len(requests) == 6 and len(client.get_df()) == 3
+        assert [conditional for _, conditional in requests[3:]] == [validators] * 3
+
+        results["mobile"] = SNAPSHOT_RECORDS[3:]
+        results["backend"] = SNAPSHOT_RECORDS[:1]
+        assert client.refresh() == [queries[0], queries[2]]
+        expected = PoolingClient(queries=queries, keys=keys, dtype_backend="numpy_nullable").get_df()
+        pd.testing.assert_frame_equal(client.get_df(), expected)
+
+    def test_failed_refresh_keeps_changes_for_next_refresh(self, dataset):
+        results, _ = dataset
+        queries = [ParticipantsQueryParams(title=title) for title in results]
+        client = PoolingClient(queries=queries, incremental=True, dtype_backend="numpy_nullable")
+        stale = client.get_df()
+
+        results["backend"] = SNAPSHOT_RECORDS[:1]
+        frontend, results["frontend"] = results["frontend"], None
+        with pytest.raises(APIError):
+            client.refresh()
+        pd.testing.assert_frame_equal(client.get_df(), stale)
+
+        results["frontend"] = frontend
+        assert client.refresh() == [queries[0]]
+        expected = PoolingClient(queries=queries, dtype_backend="numpy_nullable").get_df()
+        pd.testing.assert_frame_equal(client.get_df(), expected)
+
+    def test_refresh_requires_incremental(self, dataset):
+        with pytest.raises(ValueError):
+            PoolingClient(queries=[ParticipantsQueryParams(title="backend")]).refresh()
+
+
+@pytest.fixture
+def http_api():
+    """Returns a function serving the given in-memory handler over a local HTTP server, reachable from worker
+    processes, and returning a session targeting it."""
+    servers = []
+
+    def serve(handler):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                response = handler(httpx.Request("GET", f"http://testserver{self.path}"))
+                body = response.read()
+                self.send_response(response.status_code)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return Session(base_url=f"http://127.0.0.1:{server.server_address[1]}/")
+
+    yield serve
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class TestSharding:
+    def test_pack_round_trip(self):
+        frame = apply_schema(pd.DataFrame.from_records(SNAPSHOT_RECORDS), PARTICIPANTS_SCHEMA)
+        frame.loc[1, ["yoe", "compensation", "cs_degree", "title"]] = pd.NA
+        frame["note"] = ["a", None, "c", "d"]
+        descriptor = pack_frame(frame)
+        pd.testing.assert_frame_equal(unpack_frame(descriptor), frame)
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=descriptor["name"])
+        assert unpack_frame(pack_frame(pd.DataFrame())).empty
+
+    @pytest.mark.parametrize("count, processes", [(0, 2), (1, 4), (10, 1), (37, 3)])
+    def test_shards_cover_queries_in_order(self, count, processes):
+        positions = [position for shard in shards(count, processes) for position in shard]
+        assert positions == list(range(count))
+
+    def test_processes_merge_in_order(self, http_api):
+        with http_api(serve_snapshot(SNAPSHOT_RECORDS)) as session:
+            queries = [
+                ParticipantsQueryParams(title=title, include_relocated=True)
+                for title in ["backend", "frontend", "mobile"] * 3
+            ]
+            keys = [(position,) for position in range(len(queries))]
+            expected = PoolingClient(
+                queries=queries, keys=keys, session=session, dtype_backend="numpy_nullable"
+            ).get_df()
+            for stream in [False, True]:
+                frame = PoolingClient(queries=queries, keys=keys, session=session, processes=2, stream=stream).get_df()
+                pd.testing.assert_frame_equal(frame, expected)
+            client = AsyncPoolingClient(queries=queries, keys=keys, session=session, processes=2)
+            pd.testing.assert_frame_equal(client.get_df(), expected)
+            assert [result.query for result in client.get_report()] == queries
+
+    def test_worker_errors_propagate(self, http_api):
+        with http_api(lambda request: httpx.Response(503)) as session:
+            with pytest.raises(APIError) as error:
+                PoolingClient(queries=[ParticipantsQueryParams()], session=session, processes=1)
+            with pytest.raises(APIError):
+                AsyncPoolingClient(queries=[ParticipantsQueryParams()], session=session, processes=1)
+        assert error.value.status_code == 503
+
+
+class TestCoalescing:
+    @pytest.fixture
+    def slow_api(self, install_handler):
+        """Serves the snapshot records after a delay, so that identical calls overlap, and records the requests."""
+        requests, serve = [], serve_snapshot(SNAPSHOT_RECORDS)
+
+        def handler(request):
+            requests.append(request)
+            time.sleep(0.1)
+            return serve(request)
+
+        install_handler(handler)
+        return requests
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_threads_share_one_request(self, slow_api, stream):
+        queries = [ParticipantsQueryParams(title="backend") for _ in range(4)]
+        client = PoolingClient(
+            queries=queries,
+            session=Session(coalesce=True),
+            stream=stream,
+            max_workers=4,
+            instrumentation=Instrumentation(),
+        )
+        assert len(slow_api) == 1
+        assert len(client.get_df()) == 8
+        assert client.get_summary().coalesced == 3
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_coroutines_share_one_request(self, slow_api, stream):
+        session = Session(coalesce=True)
+
+        async def handler():
+            clients = [Participants(title="backend", stream=stream, session=session, lazy=True) for _ in range(4)]
+            await asyncio.gather(*(client.afetch() for client in clients))
+            return [client.get_df() for client in clients]
+
+        frames = asyncio.run(handler())
+        assert len(slow_api) == 1
+        frames[0].loc[0, "compensation"] = 0
+        assert frames[1].loc[0, "compensation"] == 60000
+
+    def test_errors_are_shared(self, install_handler):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            time.sleep(0.1)
+            return httpx.Response(503)
+
+        install_handler(handler)
+        client = StatsPoolingClient(
+            queries=[StatsQueryParams() for _ in range(3)], session=Session(coalesce=True), max_workers=3, lazy=True
+        )
+        with pytest.raises(APIError):
+            client.fetch()
+        assert len(requests) == 1
+
+    def test_sequential_calls_are_not_coalesced(self, slow_api):
+        session = Session(coalesce=True)
+        Participants(title="backend", session=session)
+        Participants(title="backend", session=session)
+        assert len(slow_api) == 2
+
+    def test_cancelled_caller_does_not_cancel_call(self):
+        flights = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def handler():
+            leader = asyncio.ensure_future(flights.ado("key", call))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flights.ado("key", call))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await follower
+
+        assert asyncio.run(handler()) == ("result", True)
+
+
+class TestLazyImports:
+    @pytest.mark.parametrize(
+        "statement, heavy",
+        [
+            ("import egytech_api", []),
+            ("from egytech_api import ParticipantsQueryParams, StatsQueryParams", []),
+            ("from egytech_api.session import Session", ["httpx"]),
+        ],
+    )
+    def test_heavy_dependencies_are_not_imported(self, statement, heavy):
+        code = f"import sys; {statement}; print(','.join(m for m in ['pandas', 'numpy', 'httpx'] if m in sys.modules))"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=True, cwd=root, text=True
+        ).stdout
+        assert output.strip() == ",".join(heavy)
+
+    def test_exports_resolve_on_access(self):
+        assert egytech_api.Participants is Participants and egytech_api.fetch_all is fetch_all
+        assert egytech_api.ParticipantsQueryParams is ParticipantsQueryParams
+        assert egytech_api.cube.StatsCube is StatsCube and "PoolingClient" in dir(egytech_api)
+        with pytest.raises(AttributeError):
+            egytech_api.Missing
+
+
+class TestResponseModels:
+    def test_decode_into_models(self):
+        response = decode_participants(json.dumps({"results": SNAPSHOT_RECORDS}).encode())
+        assert [record.compensation for record in response.results] == [60000.0, 20000.0, 35000.0, 40000.0]
+        assert response.results[0].title == "backend" and response.results[0].business_line is None
+        body = {"stats": {"totalCount": 3, "p90Compensation": 9}, "buckets": [{"bucket": "0-10K", "count": 3}]}
+        stats = decode_stats(json.dumps(body).encode())
+        assert stats.stats.total_count == 3 and stats.stats.p90_compensation == 9.0
+        assert stats.stats.model_dump(by_alias=True, exclude_none=True) == {"totalCount": 3, "p90Compensation": 9.0}
+
+    def test_columns_skip_model_objects(self):
+        body = json.dumps({"results": [{**SNAPSHOT_RECORDS[0], "new_field": 1}]}).encode()
+        [record] = decode_response("participants", body)["results"]
+        assert record == {**SNAPSHOT_RECORDS[0], "compensation": 60000.0, "new_field": 1}
+
+    @pytest.mark.parametrize("client_class", [Participants, PoolingClient, AsyncPoolingClient])
+    def test_participants_are_validated(self, install_handler, client_class):
+        if client_class is Participants:
+            options = {"title": "backend"}
+        else:
+            options = {"queries": [ParticipantsQueryParams(title="backend")], "raise_on_error": True}
+            if client_class is PoolingClient:
+                del options["raise_on_error"]
+        install_handler(serve_snapshot(SNAPSHOT_RECORDS))
+        frame = client_class(**options, validate_responses=True).get_df()
+        assert frame["compensation"].tolist() == [60000.0, 40000.0]
+
+        install_handler(lambda request: httpx.Response(200, json={"results": [{"title": "astronaut"}]}))
+        with pytest.raises(ValidationError):
+            client_class(**options, validate_responses=True)
+        assert len(client_class(**options).get_df()) == 1
+
+    def test_stats_are_validated(self, install_handler):
+        install_handler(serve_stats())
+        stats = Stats(programming_language="python", validate_responses=True)
+        assert stats.get_stats() == {"totalCount": 6, "median": 6000.0}
+        pooled = StatsPoolingClient(queries=[StatsQueryParams()], validate_responses=True)
+        assert pooled.get_stats()["median"].tolist() == [3000.0]
+
+        install_handler(lambda request: httpx.Response(200, json={"stats": {"totalCount": "many"}, "buckets": []}))
+        with pytest.raises(ValidationError):
+            Stats(validate_responses=True)
+
+    def test_cached_responses_are_validated(self, api, tmp_path):
+        cache = ResponseCache(directory=str(tmp_path))
+        Participants(title="backend", cache=cache)
+        participants = Participants(title="backend", cache=cache, validate_responses=True)
+        assert len(api) == 1 and participants.get_df()["compensation"].tolist() == [60000.0]
+
+
+class TestDatasetStore:
+    @pytest.fixture
+    def frame(self):
+        frame = apply_schema(pd.DataFrame.from_records(SNAPSHOT_RECORDS), PARTICIPANTS_SCHEMA)
+        frame.loc[1, ["yoe", "compensation", "cs_degree", "title"]] = pd.NA
+        return frame
+
+    def test_round_trip_keeps_metadata(self, frame, tmp_path):
+        store = DatasetStore(path=str(tmp_path / "participants.store"))
+        with pytest.raises(FileNotFoundError):
+            store.read()
+        published = store.publish(frame, [ParticipantsQueryParams(title="backend")], fetched_at=1.5)
+        pd.testing.assert_frame_equal(store.read(), frame)
+        assert store.get_metadata() == published
+        assert published.model_dump() == {"fetched_at": 1.5, "queries": [{"title": "backend"}], "rows": 4}
+
+    def test_reads_are_zero_copy_and_read_only(self, frame, tmp_path):
+        store = DatasetStore(path=str(tmp_path / "participants.store"))
+        store.publish(frame)
+        first, second = store.read(), store.read()
+        assert np.shares_memory(first["title"].array.codes, second["title"].array.codes)
+        assert np.shares_memory(first["compensation"].array._data, second["compensation"].array._data)
+        first.loc[0, "compensation"] = 0
+        assert second["compensation"].iloc[0] == frame["compensation"].iloc[0]
+        assert store.read()["compensation"].iloc[0] == frame["compensation"].iloc[0]
+
+    def test_publish_replaces_snapshot_atomically(self, frame, tmp_path):
+        store = DatasetStore(path=str(tmp_path / "participants.store"))
+        store.publish(frame)
+        old = store.read()
+        DatasetStore(path=store.path).publish(frame.iloc[:2])
+        assert len(store.read()) == 2 and store.get_metadata().rows == 2
+        pd.testing.assert_frame_equal(old, frame)
+        assert os.listdir(tmp_path) == ["participants.store"]
+
+    def test_other_processes_read_snapshot(self, frame, tmp_path):
+        store = DatasetStore(path=str(tmp_path / "participants.store"))
+        store.publish(frame)
+        code = (
+            "import sys; from egytech_api.store import DatasetStore; "
+            "print(DatasetStore(path=sys.argv[1]).read()['compensation'].sum())"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run(
+            [sys.executable, "-c", code, store.path], capture_output=True, check=True, cwd=root, text=True
+        ).stdout
+        assert float(output) == frame["compensation"].sum()
+
+
+class TestSalaryAnalytics:
+    @pytest.fixture
+    def frame(self):
+        generator = np.random.default_rng(0)
+        rows = 2000
+        frame = pd.DataFrame(
+            {
+                "title": generator.choice(["backend", "frontend", "mobile"], rows),
+                "level": generator.choice(["junior", "senior"], rows),
+                "gender": generator.choice(["male", "female"], rows),
+                "yoe": generator.integers(0, 15, rows),
+                "cs_degree": generator.random(rows) < 0.5,
+                "is_relocated": generator.random(rows) < 0.2,
+                "compensation": generator.lognormal(10, 0.8, rows).round(),
+            }
+        )
+        frame.loc[::13, "compensation"] = np.nan
+        frame.loc[::29, "level"] = None
+        return apply_schema(frame, PARTICIPANTS_SCHEMA)
+
+    @pytest.mark.parametrize("by", [["title"], ["title", "level"], ["gender", "cs_degree"]])
+    def test_stats_match_groupby(self, frame, by):
+        stats = SalaryAnalytics(frame=frame).get_stats(by=by)
+        groups = frame.dropna(subset=by).groupby(by, observed=True)
+        assert stats["totalCount"].tolist() == groups.size().tolist()
+        compensations = groups["compensation"]
+        np.testing.assert_allclose(stats["mean"], compensations.mean().astype(float))
+        for name, quantile in STATS_QUANTILES.items():
+            np.testing.assert_allclose(stats[name], compensations.quantile(quantile).astype(float))
+        assert stats[by].drop_duplicates().shape[0] == len(stats)
+
+    def test_yoe_buckets_follow_api_bounds(self, frame):
+        analytics = SalaryAnalytics(frame=frame, yoe_edges=[0, 3, 10])
+        stats = analytics.get_stats(by=["yoe"])
+        assert stats["yoe"].tolist() == ["0-3", "3-10", "10+"]
+        yoe = frame["yoe"].astype(int)
+        assert stats["totalCount"].tolist() == [(yoe < 3).sum(), ((yoe >= 3) & (yoe < 10)).sum(), (yoe >= 10).sum()]
+
+    def test_query_selects_like_snapshot(self, frame):
+        query = StatsQueryParams(title="backend", min_yoe=2, max_yoe=8)
+        stats = SalaryAnalytics(frame=frame).get_stats(query=query)
+        selected = ParticipantsSnapshot(frame=frame).query(query)
+        assert stats["totalCount"].tolist() == [len(selected)]
+        assert stats["median"].iloc[0] == pytest.approx(selected["compensation"].astype(float).median())
+        with pytest.raises(ValueError):
+            SalaryAnalytics(frame=frame).get_stats(query=StatsQueryParams(programming_language="python"))
+
+    def test_histogram_matches_cube_buckets(self, frame):
+        query = StatsQueryParams(title="mobile", include_relocated=True)
+        cube = StatsCube(snapshot=ParticipantsSnapshot(frame=frame), bucket_edges=[0, 20000, 50000])
+        histogram = SalaryAnalytics(frame=frame, bucket_edges=[0, 20000, 50000]).get_histogram(query=query)
+        pd.testing.assert_frame_equal(histogram, cube.get_df(query), check_dtype=False, check_categorical=False)
+        by_title = SalaryAnalytics(frame=frame).get_histogram(by=["title"])
+        assert by_title.groupby("title", observed=True)["count"].sum().tolist() == (
+            frame.dropna(subset=["compensation"]).groupby("title", observed=True).size().tolist()
+        )
+
+    def test_gaps_compare_to_reference(self, frame):
+        analytics = SalaryAnalytics(frame=frame)
+        gaps = analytics.get_gaps("gender", by=["title"])
+        stats = analytics.get_stats(by=["title", "gender"]).set_index(["title", "gender"])
+        row = gaps.set_index("title").loc["backend"]
+        assert row["count_female"] == stats.loc[("backend", "female"), "totalCount"]
+        assert row["gap_female"] == pytest.approx(
+            1 - stats.loc[("backend", "female"), "median"] / stats.loc[("backend", "male"), "median"]
+        )
+        degree = analytics.get_gaps("cs_degree", statistic="mean")
+        assert list(degree.columns) == ["count_False", "count_True", "mean_False", "mean_True", "gap_False"]
+        with pytest.raises(ValueError):
+            analytics.get_gaps("gender", reference="other")
+
+
+class TestAsyncClients:
+    def test_await_runs_on_running_loop(self, install_handler):
+        requests = []
+        install_handler(serve_snapshot(SNAPSHOT_RECORDS, requests))
+
+        async def handler():
+            participants = AsyncParticipants(title="backend", dtype_backend="numpy_nullable")
+            assert not requests
+            with pytest.raises(RuntimeError):
+                participants.get_df()
+            return await participants
+
+        participants = asyncio.run(handler())
+        assert participants.get_df()["compensation"].tolist() == [60000, 40000] and len(requests) == 1
+
+        install_handler(serve_stats())
+        stats = asyncio.run(AsyncStats(programming_language="python").afetch())
+        assert stats.get_stats() == {"totalCount": 6, "median": 6000}
+
+    def test_injected_client_is_shared(self):
+        requests = []
+        transport = httpx.MockTransport(serve_stats(requests))
+
+        async def handler():
+            async with httpx.AsyncClient(transport=transport, base_url=API_URL) as client:
+                results = await asyncio.gather(
+                    *(
+                        AsyncStats(programming_language=language, async_client=client).afetch()
+                        for language in ["go", "r"]
+                    )
+                )
+                lazy = await Stats(programming_language="java", async_client=client, lazy=True).afetch()
+                assert not client.is_closed
+            return [stats.get_stats()["median"] for stats in [*results, lazy]]
+
+        assert asyncio.run(handler()) == [2000, 1000, 4000] and len(requests) == 3
+
+    def test_timeout_and_cancellation_leave_instance_unfetched(self, install_handler):
+        delays = [1, 1, 0]
+        serve = serve_stats()
+
+        async def slow(request):
+            await asyncio.sleep(delays.pop(0))
+            return serve(request)
+
+        install_handler(slow)
+
+        async def handler():
+            stats = AsyncStats(programming_language="go", timeout=0.05)
+            with pytest.raises(TimeoutError):
+                await stats
+            task = asyncio.create_task(stats.afetch())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            with pytest.raises(RuntimeError):
+                stats.get_stats()
+            return await stats
+
+        assert asyncio.run(handler()).get_stats()["median"] == 2000 and not delays